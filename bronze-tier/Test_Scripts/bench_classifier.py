@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: single-pass weighted classifier vs. the old substring classifier.
+The old classifier lowercased the content and ran one `any(word in ...)` scan
+per category; the new one finds keyword stems with str.find and checks word
+boundaries only where a stem occurs.
+Two corpora of --target-mb each are timed: the sample files in Vault/Done
+(and Needs_Action) repeated, and keyword-free filler text. The agent classifies
+a file before its response is appended, so the samples are cut at their
+"AI Response" heading. The old classifier stops at the first category with a
+hit; the filler is its worst case, where every scan runs to the end.
+
+Usage: python Test_Scripts/bench_classifier.py [--target-mb 20] [--runs 3]
+"""
+
+import argparse
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from docx import Document
+
+from classifier import Classifier
+
+VAULT = Path(__file__).resolve().parent.parent / "Vault"
+
+# No keyword of any category, not even as a substring
+FILLER = "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt.\n"
+
+# The heading the agent writes above its response, in text files and .docx
+RESPONSE_HEADING = re.compile(r'^(?:## )?AI Response$', re.M)
+
+
+def legacy_classify(content):
+    """The pre-classifier `_classify_task`, kept for comparison."""
+    content_lower = content.lower()
+
+    if any(word in content_lower for word in ['?', 'what', 'how', 'why', 'when', 'where']):
+        return "Question"
+    elif any(word in content_lower for word in ['analyze', 'review', 'examine']):
+        return "Analysis"
+    elif any(word in content_lower for word in ['write', 'create', 'generate', 'draft']):
+        return "Writing"
+    elif any(word in content_lower for word in ['code', 'function', 'script', 'program']):
+        return "Code"
+    elif any(word in content_lower for word in ['calculate', 'compute', 'solve']):
+        return "Calculation"
+    else:
+        return "General"
+
+
+def task_text(text):
+    """The part of a processed file the agent classified (before its response)."""
+    return RESPONSE_HEADING.split(text, 1)[0]
+
+
+def load_corpus():
+    """(name, task text) for every sample task file in the vault."""
+    corpus = []
+    for folder in ("Done", "Needs_Action"):
+        for path in sorted((VAULT / folder).glob("*")):
+            if path.suffix == '.docx':
+                corpus.append((path.name, task_text('\n'.join(p.text for p in Document(path).paragraphs))))
+            elif path.suffix in ('.md', '.txt'):
+                corpus.append((path.name, task_text(path.read_text(encoding='utf-8'))))
+    return corpus
+
+
+def bench(classify, documents, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        labels = [classify(text) for text in documents]
+        timings.append(time.perf_counter() - start)
+    return min(timings), labels
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the task classifier")
+    parser.add_argument('--target-mb', type=float, default=20)
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    classifier = Classifier.from_skill(VAULT.parent / "skills" / "file-triage" / "SKILL.md")
+
+    print("=" * 60)
+    print(f"Sample files ({len(corpus)})")
+    print("=" * 60)
+    print(f"{'File':<28}{'Old':>14}{'New':>14}")
+    for name, text in corpus:
+        print(f"{name:<28}{legacy_classify(text):>14}{classifier.classify(text):>14}")
+
+    target = args.target_mb * 1024 * 1024
+    total = sum(len(text) for _, text in corpus)
+    samples = [text for _, text in corpus] * max(1, int(target / max(total, 1)))
+    # One large document with nothing to match: the old classifier runs all six scans in full
+    filler = [FILLER * max(1, int(target / len(FILLER)))]
+    assert legacy_classify(filler[0]) == "General"
+
+    for title, documents in (("Sample files (old classifier exits at the first hit)", samples),
+                             ("Keyword-free text (old classifier's worst case)", filler)):
+        size_mb = sum(len(text) for text in documents) / (1024 * 1024)
+        old_time, old_labels = bench(legacy_classify, documents, args.runs)
+        new_time, new_labels = bench(classifier.classify, documents, args.runs)
+
+        print()
+        print(f"{title}: {len(documents)} documents, {size_mb:.1f} MB")
+        print(f"{'Classifier':<14}{'Best time':>12}{'MB/s':>10}")
+        print(f"{'old':<14}{old_time:>11.3f}s{size_mb / old_time:>10.1f}")
+        print(f"{'single-pass':<14}{new_time:>11.3f}s{size_mb / new_time:>10.1f}")
+        print(f"Labels changed: {sum(a != b for a, b in zip(old_labels, new_labels))}/{len(documents)} "
+              f"({dict(Counter(new_labels))})")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
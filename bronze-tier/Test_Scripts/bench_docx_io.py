@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Benchmark: single-pass TaskContext vs. the old read-three-times pipeline.
+The old pipeline parsed a .docx in `process`, again to re-classify, and a third
+time in `_update_docx`. TaskContext streams the text out once and parses the
+Document only for the write-back, so it still reads the file twice (see
+bench_docx_text.py for extraction alone). Reads and bytes are counted on the
+file objects zipfile opens, not assumed.
+
+Usage: python Test_Scripts/bench_docx_io.py [--paragraphs 5000] [--runs 3]
+"""
+
+import argparse
+import io
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from docx import Document
+
+from agent import FileTriageAgent
+from classifier import Classifier
+
+RESPONSE = "Summary of the document.\n" * 40
+
+
+class CountingFile:
+    """File proxy that adds every byte read to a shared tally."""
+
+    def __init__(self, f, tally):
+        self._f = f
+        self._tally = tally
+
+    def read(self, *args):
+        data = self._f.read(*args)
+        self._tally['bytes'] += len(data)
+        return data
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._f.close()
+
+    def __getattr__(self, name):
+        return getattr(self._f, name)
+
+
+@contextmanager
+def count_reads(path):
+    """Tally the opens for reading of `path` and the bytes read from them."""
+    tally = {'reads': 0, 'bytes': 0}
+    real_open = io.open
+
+    def counting_open(file, mode='r', *args, **kwargs):
+        f = real_open(file, mode, *args, **kwargs)
+        if 'r' in mode and str(file) == str(path):
+            tally['reads'] += 1
+            return CountingFile(f, tally)
+        return f
+
+    # zipfile (used by python-docx and extract_docx_text) opens paths with io.open
+    io.open = counting_open
+    try:
+        yield tally
+    finally:
+        io.open = real_open
+
+
+def make_large_docx(path, paragraphs):
+    """Write a synthetic report with `paragraphs` paragraphs and a few headings."""
+    doc = Document()
+    for i in range(paragraphs):
+        if i % 50 == 0:
+            doc.add_heading(f"Section {i // 50 + 1}", level=1)
+        doc.add_paragraph(f"Paragraph {i}: please review the quarterly budget line items and analyze the variance.")
+    doc.save(path)
+
+
+def old_pipeline(agent, path):
+    """Emulate the pre-TaskContext flow: three reads/parses of the same file."""
+    doc = Document(path)
+    content = '\n'.join(p.text for p in doc.paragraphs)
+    task_type = agent._classify_task(content)
+    doc = Document(path)
+    agent._classify_task('\n'.join(p.text for p in doc.paragraphs))
+    doc = Document(path)
+    doc.add_paragraph(RESPONSE)
+    doc.save(path)
+    return task_type
+
+
+def new_pipeline(agent, path):
+    """Current flow: streamed text extraction, then one python-docx parse for the write-back."""
+    ctx = agent.load_task(path)
+    ctx.task_type = agent._classify_task(ctx.content)
+    doc = Document(path)
+    doc.add_paragraph(RESPONSE)
+    doc.save(path)
+    return ctx.task_type
+
+
+def bench(fn, agent, source, workdir, runs):
+    timings = []
+    for run in range(runs):
+        target = workdir / f"{fn.__name__}_{run}.docx"
+        shutil.copy(source, target)
+        with count_reads(target) as tally:
+            start = time.perf_counter()
+            fn(agent, target)
+            timings.append(time.perf_counter() - start)
+    return min(timings), tally
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark single-pass .docx handling")
+    parser.add_argument('--paragraphs', type=int, default=5000)
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    agent = FileTriageAgent.__new__(FileTriageAgent)
+    agent.classifier = Classifier()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        source = workdir / "large_report.docx"
+        make_large_docx(source, args.paragraphs)
+        size = source.stat().st_size
+
+        old_time, old_io = bench(old_pipeline, agent, source, workdir, args.runs)
+        new_time, new_io = bench(new_pipeline, agent, source, workdir, args.runs)
+
+    print("=" * 60)
+    print(f"Single-pass .docx benchmark ({args.paragraphs} paragraphs, {size / 1024:.0f} KB)")
+    print("=" * 60)
+    print(f"{'Pipeline':<14}{'Reads':>8}{'Bytes read':>14}{'Best time':>12}")
+    print(f"{'old':<14}{old_io['reads']:>8}{old_io['bytes']:>14,}{old_time:>11.3f}s")
+    print(f"{'TaskContext':<14}{new_io['reads']:>8}{new_io['bytes']:>14,}{new_time:>11.3f}s")
+    print(f"Saved: {old_io['reads'] - new_io['reads']} read, {old_io['bytes'] - new_io['bytes']:,} bytes read, "
+          f"{old_time - new_time:.3f}s ({(1 - new_time / old_time) * 100:.0f}%) per file")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Benchmark: end-to-end Inbox-to-Done throughput against a fake Groq backend.
+Generates a synthetic inbox of mixed .md/.txt/.docx files, starts watcher.py
+and agent.py (or daemon.py with --daemon) as subprocesses on a scratch vault
+pointed at a local FakeGroqServer, drops the files into Vault/Inbox/ and
+waits for each one to reach Vault/Done/. Reports throughput, p50/p95/p99
+Inbox-to-Done latency, dashboard write amplification (from the processes'
+--metrics-file snapshots) and peak RSS per process.
+
+A warm-up file goes through first so process startup is not counted. Save a
+report with --json and pass it back with --baseline to fail on regressions.
+
+Usage: python Test_Scripts/bench_pipeline.py [--files 200] [--mix md=2,txt=1,docx=1]
+       [--min-kb 0.5] [--max-kb 8] [--rate 0] [--workers 4] [--latency 0.2]
+       [--rate-429 0.05] [--daemon] [--json report.json] [--baseline report.json]
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fake_groq import FakeGroqServer
+from metrics import percentile
+
+REPO = Path(__file__).resolve().parent.parent
+
+WORDS = ("budget", "report", "client", "review", "schedule", "invoice", "quarter", "team", "project",
+         "deadline", "vendor", "estimate", "meeting", "draft", "launch", "metrics", "risk", "summary")
+OPENERS = (
+    "What is the status of the {0} for the {1}?",
+    "Please analyze the {0} figures and compare them with last {1}.",
+    "Write a short email to the {0} about the {1}.",
+    "Create a Python function that totals the {0} per {1}.",
+    "Calculate the total {0} cost if each {1} is $1,250.",
+    "Notes on the {0} and the {1}.",
+)
+
+
+def make_text(rng, size):
+    """About `size` bytes of task text: one request line, then filler paragraphs."""
+    lines = [rng.choice(OPENERS).format(rng.choice(WORDS), rng.choice(WORDS)), ""]
+    length = len(lines[0])
+    while length < size:
+        sentence = " ".join(rng.choice(WORDS) for _ in range(12)).capitalize() + "."
+        lines.append(sentence)
+        length += len(sentence) + 1
+    return "\n".join(lines)
+
+
+def generate_inbox(folder, count, mix=None, min_kb=0.5, max_kb=8.0, seed=0):
+    """Write `count` synthetic task files to `folder`; returns their paths.
+
+    `mix` maps extension to relative weight, e.g. {'md': 2, 'txt': 1, 'docx': 1}.
+    Sizes are drawn uniformly between `min_kb` and `max_kb` of text.
+    """
+    from docx import Document
+
+    mix = mix or {'md': 2, 'txt': 1, 'docx': 1}
+    rng = random.Random(seed)
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(count):
+        extension = rng.choices(list(mix), weights=list(mix.values()))[0]
+        text = make_text(rng, int(rng.uniform(min_kb, max_kb) * 1024))
+        path = folder / f"bench_{i:05}.{extension}"
+        if extension == 'docx':
+            doc = Document()
+            for paragraph in text.split("\n"):
+                doc.add_paragraph(paragraph)
+            doc.save(path)
+        else:
+            path.write_text(text, encoding='utf-8')
+        paths.append(path)
+    return paths
+
+
+def make_vault(root):
+    """A scratch base path with Vault/ folders, the Dashboard template and SKILL.md."""
+    root = Path(root)
+    # Fails on a used folder: files already in Done/ would count as finished
+    (root / "Vault").mkdir(parents=True)
+    for folder in ("Inbox", "Needs_Action", "Done"):
+        (root / "Vault" / folder).mkdir()
+    shutil.copy(REPO / "Vault" / "Dashboard.md", root / "Vault" / "Dashboard.md")
+    (root / "skills" / "file-triage").mkdir(parents=True, exist_ok=True)
+    shutil.copy(REPO / "skills" / "file-triage" / "SKILL.md", root / "skills" / "file-triage" / "SKILL.md")
+    return root
+
+
+def peak_rss_mb(pid):
+    """Peak resident set size of a running process (Linux /proc only; None elsewhere)."""
+    try:
+        with open(f"/proc/{pid}/status", encoding='ascii') as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+class Pipeline:
+    """watcher.py + agent.py (or daemon.py) running as subprocesses on one vault."""
+
+    def __init__(self, base_path, base_url, workers=4, daemon=False, settle_time=0.5, rpm=6000, extra_args=()):
+        self.base_path = Path(base_path)
+        self.state = self.base_path / "bench"
+        self.state.mkdir(exist_ok=True)
+        self.env = dict(os.environ, GROQ_API_KEY="bench-key", GROQ_BASE_URL=base_url,
+                        GROQ_RPM=str(rpm), GROQ_TPM=str(rpm * 10000), PYTHONUNBUFFERED="1")
+        common = ["--base-path", str(self.base_path), "--log-format", "json", "--metrics-interval", "3600"]
+        agent_args = ["--workers", str(workers), "--max-inflight", str(workers), "--no-cache", *extra_args]
+        if daemon:
+            self.commands = {
+                'daemon': ["daemon.py", *common, "--settle-time", str(settle_time), *agent_args],
+            }
+        else:
+            self.commands = {
+                'watcher': ["watcher.py", *common, "--settle-time", str(settle_time)],
+                # Below two workers agent.py falls back to the polling loop
+                'agent': ["agent.py", *common, "--interval", "1", *agent_args],
+            }
+        self.processes = {}
+        self.peak_rss = {}
+
+    def start(self):
+        for name, (script, *args) in self.commands.items():
+            log = open(self.state / f"{name}.log", "w", encoding='utf-8')
+            self.processes[name] = subprocess.Popen(
+                [sys.executable, str(REPO / script), *args, "--metrics-file", str(self.state / f"{name}-metrics.json")],
+                cwd=REPO, env=self.env, stdout=log, stderr=subprocess.STDOUT,
+            )
+            log.close()
+        return self
+
+    def check_alive(self):
+        for name, process in self.processes.items():
+            if process.poll() is not None:
+                raise RuntimeError(f"{name} exited with status {process.returncode}; see {self.state / (name + '.log')}")
+
+    def stop(self, timeout=30):
+        """Record peak RSS, then Ctrl+C each process so it flushes its metrics file."""
+        for name, process in self.processes.items():
+            self.peak_rss[name] = peak_rss_mb(process.pid)
+            if process.poll() is None:
+                process.send_signal(signal.SIGINT if os.name != 'nt' else signal.CTRL_C_EVENT)
+        for process in self.processes.values():
+            try:
+                process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+    def metrics(self):
+        """Merged counters from each process's final metrics snapshot."""
+        counters = {}
+        for name in self.processes:
+            try:
+                snapshot = json.loads((self.state / f"{name}-metrics.json").read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                continue
+            for metric, series in snapshot['counters'].items():
+                counters[metric] = counters.get(metric, 0) + sum(series.values())
+        return counters
+
+
+def wait_for_done(done_path, names, timeout, arrivals, poll=0.005):
+    """Poll Done/ until every name has arrived (or timeout); records arrival times."""
+    deadline = time.monotonic() + timeout
+    missing = set(names) - set(arrivals)
+    while missing and time.monotonic() < deadline:
+        with os.scandir(done_path) as entries:
+            now = time.monotonic()
+            for entry in entries:
+                if entry.name in missing:
+                    arrivals[entry.name] = now
+                    missing.discard(entry.name)
+        if missing:
+            time.sleep(poll)
+    return missing
+
+
+def drop(path, inbox):
+    """Atomically rename a staged file into the Inbox; returns the drop time."""
+    os.replace(path, inbox / path.name)
+    return time.monotonic()
+
+
+def run_benchmark(files=200, mix=None, min_kb=0.5, max_kb=8.0, seed=0, rate=0.0, workers=4,
+                  latency=0.2, rate_429=0.05, daemon=False, timeout=600, base_path=None, extra_args=()):
+    """Run one end-to-end benchmark; returns the report dict."""
+    scratch = None
+    if base_path is None:
+        scratch = tempfile.TemporaryDirectory(prefix="bench_pipeline_")
+        base_path = scratch.name
+    vault = make_vault(base_path)
+    inbox, done = vault / "Vault" / "Inbox", vault / "Vault" / "Done"
+    staged = generate_inbox(vault / "bench" / "staging", files, mix, min_kb, max_kb, seed)
+    warmup = vault / "bench" / "warmup.md"
+    warmup.write_text("What is on the agenda today?", encoding='utf-8')
+
+    try:
+        with FakeGroqServer(latency=latency, rate_429=rate_429) as server:
+            pipeline = Pipeline(vault, server.base_url, workers=workers, daemon=daemon,
+                                extra_args=extra_args).start()
+            try:
+                # Both processes are up once the warm-up file makes it through
+                arrivals = {}
+                drop(warmup, inbox)
+                if wait_for_done(done, [warmup.name], 60, arrivals):
+                    pipeline.check_alive()
+                    raise RuntimeError(f"warm-up file never reached Done/; see {pipeline.state}")
+                requests_before, rejected_before = server.requests, server.rejected
+
+                arrivals = {}
+                dropped = {}
+                started = time.monotonic()
+                for i, path in enumerate(staged):
+                    if rate > 0:
+                        time.sleep(max(0.0, started + i / rate - time.monotonic()))
+                    dropped[path.name] = drop(path, inbox)
+                missing = wait_for_done(done, dropped, timeout, arrivals)
+                finished = max(arrivals.values(), default=started)
+            finally:
+                pipeline.stop()
+            counters = pipeline.metrics()
+            requests = server.requests - requests_before
+            rejected = server.rejected - rejected_before
+        dashboard_size = (vault / "Vault" / "Dashboard.md").stat().st_size
+    finally:
+        if scratch is not None:
+            scratch.cleanup()
+
+    latencies = [arrivals[name] - dropped[name] for name in arrivals]
+    elapsed = finished - started
+    tasks = files + 1  # the dashboard counters include the warm-up file
+    writes = counters.get('triage_dashboard_writes_total', 0)
+    written = counters.get('triage_dashboard_bytes_total', 0)
+    return {
+        'mode': 'daemon' if daemon else 'watcher+agent',
+        'files': files,
+        'done': len(arrivals),
+        'missing': sorted(missing),
+        'workers': workers,
+        'latency': latency,
+        'rate_429': rate_429,
+        'elapsed': elapsed,
+        'files_per_minute': len(arrivals) / elapsed * 60 if elapsed > 0 else 0.0,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99),
+        'max': max(latencies, default=None),
+        'llm_requests': requests,
+        'llm_429s': rejected,
+        'dashboard_writes_per_task': writes / tasks,
+        'dashboard_bytes_per_task': written / tasks,
+        'dashboard_write_amplification': written / tasks / dashboard_size if dashboard_size else None,
+        'peak_rss_mb': pipeline.peak_rss,
+    }
+
+
+def print_report(report):
+    def seconds(value):
+        return "n/a" if value is None else f"{value:.3f}s"
+
+    print("=" * 60)
+    print(f"Pipeline benchmark ({report['mode']}, {report['workers']} workers, "
+          f"LLM {report['latency']}s, {report['rate_429']:.0%} 429s)")
+    print("=" * 60)
+    print(f"Files:       {report['done']}/{report['files']} reached Done/ in {report['elapsed']:.2f}s")
+    print(f"Throughput:  {report['files_per_minute']:.1f} files/min")
+    print(f"Latency:     p50 {seconds(report['p50'])}, p95 {seconds(report['p95'])}, "
+          f"p99 {seconds(report['p99'])}, max {seconds(report['max'])}")
+    print(f"LLM:         {report['llm_requests']} requests, {report['llm_429s']} answered 429")
+    amplification = report['dashboard_write_amplification']
+    print(f"Dashboard:   {report['dashboard_writes_per_task']:.2f} writes/task, "
+          f"{report['dashboard_bytes_per_task'] / 1024:.1f} KB written/task"
+          + (f" ({amplification:.2f}x the final file)" if amplification is not None else ""))
+    rss = ", ".join(f"{name} {'n/a' if mb is None else f'{mb:.1f} MB'}" for name, mb in report['peak_rss_mb'].items())
+    print(f"Peak RSS:    {rss}")
+    if report['missing']:
+        print(f"Missing:     {', '.join(report['missing'][:10])}{' ...' if len(report['missing']) > 10 else ''}")
+
+
+def compare(report, baseline, tolerance):
+    """Regressions beyond `tolerance` (a fraction) against a saved report."""
+    regressions = []
+    if report['files_per_minute'] < baseline['files_per_minute'] * (1 - tolerance):
+        regressions.append(f"throughput {report['files_per_minute']:.1f} < {baseline['files_per_minute']:.1f} files/min")
+    for key in ('p50', 'p95', 'p99', 'dashboard_bytes_per_task'):
+        if report[key] is not None and baseline.get(key) and report[key] > baseline[key] * (1 + tolerance):
+            regressions.append(f"{key} {report[key]:.3f} > {baseline[key]:.3f}")
+    if report['missing']:
+        regressions.append(f"{len(report['missing'])} file(s) never reached Done/")
+    return regressions
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(','):
+        extension, _, weight = part.partition('=')
+        mix[extension.strip().lstrip('.')] = float(weight or 1)
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Inbox-to-Done pipeline against a fake Groq server")
+    parser.add_argument('--files', type=int, default=200)
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix("md=2,txt=1,docx=1"),
+                        help='Relative weights of file types (default: md=2,txt=1,docx=1)')
+    parser.add_argument('--min-kb', type=float, default=0.5)
+    parser.add_argument('--max-kb', type=float, default=8.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--rate', type=float, default=0.0, help='Files dropped per second (default: 0, all at once)')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--latency', type=float, default=0.2, help='Fake LLM latency in seconds')
+    parser.add_argument('--rate-429', type=float, default=0.05, help='Fraction of requests answered 429')
+    parser.add_argument('--daemon', action='store_true', help='Run daemon.py instead of watcher.py + agent.py')
+    parser.add_argument('--batch', action='store_true', help='Pass --batch to the agent')
+    parser.add_argument('--stream', action='store_true', help='Pass --stream to the agent')
+    parser.add_argument('--timeout', type=float, default=600)
+    parser.add_argument('--keep', type=Path, default=None, help='Run in this new folder and keep it (logs in bench/)')
+    parser.add_argument('--json', type=Path, default=None, help='Write the report to this file')
+    parser.add_argument('--baseline', type=Path, default=None, help='Fail if worse than this saved report')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed regression vs. --baseline (default: 0.2)')
+    args = parser.parse_args()
+
+    extra_args = [flag for flag, on in (("--batch", args.batch), ("--stream", args.stream)) if on]
+    report = run_benchmark(files=args.files, mix=args.mix, min_kb=args.min_kb, max_kb=args.max_kb, seed=args.seed,
+                           rate=args.rate, workers=args.workers, latency=args.latency, rate_429=args.rate_429,
+                           daemon=args.daemon, timeout=args.timeout, base_path=args.keep, extra_args=extra_args)
+    print_report(report)
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding='utf-8')
+
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text(encoding='utf-8')), args.tolerance)
+        for regression in regressions:
+            print(f"[X] Regression: {regression}")
+        if regressions:
+            return 1
+    return 1 if report['missing'] else 0
+
+
+if __name__ == "__main__":
+    exit(main())
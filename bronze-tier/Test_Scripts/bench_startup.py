@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: agent startup cost.
+Runs `python -X importtime -c "import agent"` and reports the total import
+time and the slowest modules, then times an idle `agent.py --once` (empty
+Needs_Action) end to end. The Groq SDK and python-docx are imported lazily, so
+neither should show up in the import list.
+
+Usage: python Test_Scripts/bench_startup.py [--runs 5] [--top 15]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+def import_times(module, cwd=REPO):
+    """{module: (self_us, cumulative_us)} from `python -X importtime -c "import <module>"`."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=cwd, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def idle_run_seconds(vault):
+    """Wall time of `agent.py --once` against an empty Needs_Action."""
+    env = dict(os.environ, GROQ_API_KEY="bench-key")
+    start = time.perf_counter()
+    subprocess.run([sys.executable, str(REPO / "agent.py"), "--once", "--base-path", str(vault)],
+                   cwd=REPO, env=env, capture_output=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark agent startup")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15)
+    args = parser.parse_args()
+
+    runs = [import_times("agent") for _ in range(args.runs)]
+    totals = [times["agent"][1] / 1000 for times in runs]
+    fastest = runs[totals.index(min(totals))]
+
+    print("=" * 60)
+    print(f"import agent: median {statistics.median(totals):.1f} ms, best {min(totals):.1f} ms "
+          f"({len(fastest)} modules)")
+    print("=" * 60)
+    print(f"{'Module':<40}{'Self ms':>10}{'Cumul. ms':>10}")
+    slowest = sorted(fastest.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (self_us, cumulative_us) in slowest[:args.top]:
+        print(f"{name:<40}{self_us / 1000:>10.1f}{cumulative_us / 1000:>10.1f}")
+
+    heavy = sorted({name.split('.')[0] for name in fastest} & {"groq", "docx", "lxml", "httpx"})
+    print(f"\nHeavy dependencies loaded at import: {', '.join(heavy) or 'none'}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for folder in ("Inbox", "Needs_Action", "Done"):
+            (Path(tmp) / "Vault" / folder).mkdir(parents=True)
+        idle = [idle_run_seconds(tmp) for _ in range(args.runs)]
+    print(f"Idle `agent.py --once`: median {statistics.median(idle) * 1000:.0f} ms, "
+          f"best {min(idle) * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
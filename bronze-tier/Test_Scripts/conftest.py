@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Shared test setup: puts the bronze-tier modules on sys.path, builds
+throwaway project folders laid out like the real one, and builds agents that
+talk to a fake Groq server.
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+
+
+@pytest.fixture
+def make_vault():
+    """Build a project folder at `root` and return it.
+
+    It holds Vault/Inbox, Vault/Needs_Action and Vault/Done, a copy of the
+    repo's Dashboard.md (with its legacy rows) and the file-triage SKILL.md,
+    so an agent or watcher can be pointed at it with `base_path=root`.
+    """
+    def build(root):
+        root = Path(root)
+        for folder in ("Inbox", "Needs_Action", "Done"):
+            (root / "Vault" / folder).mkdir(parents=True)
+        shutil.copy(REPO / "Vault" / "Dashboard.md", root / "Vault" / "Dashboard.md")
+        (root / "skills" / "file-triage").mkdir(parents=True)
+        shutil.copy(REPO / "skills" / "file-triage" / "SKILL.md", root / "skills" / "file-triage" / "SKILL.md")
+        return root
+
+    return build
+
+
+@pytest.fixture
+def vault(make_vault, tmp_path):
+    """A project folder in tmp_path (see make_vault); task folders are under vault / "Vault"."""
+    return make_vault(tmp_path)
+
+
+@pytest.fixture
+def new_agent(monkeypatch):
+    """Build agents pointed at a FakeGroqServer: new_agent(vault, server, **kwargs).
+
+    Keyword arguments go to FileTriageAgent; the response cache is off unless
+    `use_cache=True` is passed. At teardown every agent built is closed: its
+    Groq client, its claim folder (agent.close()) and its SQLite stores.
+    """
+    agents = []
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    monkeypatch.setenv("GROQ_RPM", "6000")
+
+    def build(vault, server, **kwargs):
+        monkeypatch.setenv("GROQ_BASE_URL", server.base_url)
+        from agent import FileTriageAgent
+        kwargs.setdefault('use_cache', False)
+        agent = FileTriageAgent(vault, **kwargs)
+        agents.append(agent)
+        return agent
+
+    yield build
+    for agent in agents:
+        agent.groq_client.close()
+        agent.close()
+        agent.dashboard.flush()
+        for store in (agent.dashboard.store, agent.journal, agent.content_index, agent.response_cache):
+            if store is not None:
+                store.close()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Fake Groq-compatible HTTP server for tests and benchmarks.
+Serves POST /openai/v1/chat/completions with configurable latency, 429 rate
+and x-ratelimit-* headers, so the agent can run without a real API key.
+Requests with "stream": true get the reply as server-sent event chunks.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def default_reply(body):
+    """Echo the request; batched prompts get one marked answer per task."""
+    prompt = body['messages'][-1]['content']
+    tasks = re.findall(r'<<<TASK (\d+)>>>\n(.*?)\n<<<END TASK \1>>>', prompt, re.DOTALL)
+    if tasks:
+        return '\n\n'.join(f"<<<ANSWER {n}>>>\nFake response to: {text[:80]}\n<<<END ANSWER {n}>>>" for n, text in tasks)
+    return f"Fake response to: {prompt[:80]}"
+
+
+class FakeGroqServer:
+    """Local stand-in for the Groq chat completions endpoint."""
+
+    def __init__(self, latency=0.0, rate_429=0.0, fail_first=0, retry_after="0.05",
+                 remaining_requests=1000, remaining_tokens=100000, reply=None,
+                 chunk_size=16, chunk_delay=0.0):
+        self.latency = latency
+        self.rate_429 = rate_429
+        self.fail_first = fail_first
+        self.retry_after = retry_after
+        self.remaining_requests = remaining_requests
+        self.remaining_tokens = remaining_tokens
+        self.reply = reply or default_reply
+        self.chunk_size = chunk_size
+        self.chunk_delay = chunk_delay
+
+        self.requests = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Start serving on an ephemeral localhost port."""
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _should_reject(self):
+        with self._lock:
+            self.requests += 1
+            if self.requests <= self.fail_first or random.random() < self.rate_429:
+                self.rejected += 1
+                return True
+            return False
+
+    def _limit_headers(self):
+        return [
+            ("x-ratelimit-remaining-requests", str(self.remaining_requests)),
+            ("x-ratelimit-reset-requests", "1m0s"),
+            ("x-ratelimit-remaining-tokens", str(self.remaining_tokens)),
+            ("x-ratelimit-reset-tokens", "6s"),
+        ]
+
+    def _make_handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, payload, headers=()):
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+
+                if not self.path.endswith("/chat/completions"):
+                    self._send(404, {"error": {"message": "not found"}})
+                    return
+
+                if fake._should_reject():
+                    self._send(429, {"error": {"message": "Rate limit reached", "type": "tokens"}},
+                               [("retry-after", fake.retry_after)])
+                    return
+
+                with fake._lock:
+                    fake.in_flight += 1
+                    fake.max_in_flight = max(fake.max_in_flight, fake.in_flight)
+                try:
+                    if fake.latency:
+                        time.sleep(fake.latency)
+                    content = fake.reply(body)
+                finally:
+                    with fake._lock:
+                        fake.in_flight -= 1
+
+                prompt_tokens = sum(len(m.get("content", "")) // 4 for m in body.get("messages", []))
+                completion_tokens = max(1, len(content) // 4)
+                usage = {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                }
+                if body.get("stream"):
+                    self._stream(body, content, usage)
+                    return
+
+                payload = {
+                    "id": f"chatcmpl-fake-{fake.requests}",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": body.get("model", "fake"),
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }],
+                    "usage": usage,
+                }
+                self._send(200, payload, fake._limit_headers())
+
+            def _stream(self, body, content, usage):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                for name, value in fake._limit_headers():
+                    self.send_header(name, value)
+                self.end_headers()
+
+                pieces = [content[i:i + fake.chunk_size] for i in range(0, len(content), fake.chunk_size)]
+                for index, piece in enumerate(pieces + [None]):
+                    last = piece is None
+                    chunk = {
+                        "id": f"chatcmpl-fake-{fake.requests}",
+                        "object": "chat.completion.chunk",
+                        "created": int(time.time()),
+                        "model": body.get("model", "fake"),
+                        "choices": [{
+                            "index": 0,
+                            "delta": {} if last else ({"role": "assistant", "content": piece} if index == 0 else {"content": piece}),
+                            "finish_reason": "stop" if last else None,
+                        }],
+                    }
+                    if last:
+                        chunk["x_groq"] = {"id": "req_fake", "usage": usage}
+                    elif fake.chunk_delay:
+                        time.sleep(fake.chunk_delay)
+                    self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode('utf-8'))
+                    self.wfile.flush()
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+
+        return Handler
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fake Groq-compatible server")
+    parser.add_argument('--latency', type=float, default=0.5, help='Seconds per completion')
+    parser.add_argument('--rate-429', type=float, default=0.0, help='Fraction of requests rejected with 429')
+    args = parser.parse_args()
+
+    server = FakeGroqServer(latency=args.latency, rate_429=args.rate_429).start()
+    print(f"Fake Groq server listening on {server.base_url}")
+    print(f"Set GROQ_BASE_URL={server.base_url} and any GROQ_API_KEY to use it")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
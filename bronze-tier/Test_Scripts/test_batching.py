@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Batched prompt tests: packing, reply parsing, and the agent answering several
+small files with one Groq request (falling back per file on a bad reply).
+Run with: python -m pytest Test_Scripts/test_batching.py
+"""
+
+from batching import build_batch_prompt, pack_batches, parse_batch_response
+from fake_groq import FakeGroqServer
+
+
+def test_pack_batches_respects_budget_and_task_limit():
+    items = [("a", "x" * 400), ("b", "x" * 400), ("c", "x" * 400), ("big", "x" * 4000), ("d", "x" * 40)]
+
+    assert pack_batches(items, token_budget=250, max_tasks=8) == [["a", "b"], ["c"], ["big"], ["d"]]
+    assert pack_batches(items[:3], token_budget=1000, max_tasks=2) == [["a", "b"], ["c"]]
+
+
+def test_parse_batch_response_keeps_only_well_formed_answers():
+    reply = ("<<<ANSWER 1>>>\nFirst answer\n<<<END ANSWER 1>>>\n"
+             "<<<ANSWER 2>>>\n\n<<<END ANSWER 2>>>\n"
+             "<<<ANSWER 3>>>\nUnterminated\n"
+             "<<<ANSWER 9>>>\nOut of range\n<<<END ANSWER 9>>>")
+
+    assert parse_batch_response(reply, 3) == {1: "First answer"}
+    assert parse_batch_response("not structured at all", 3) == {}
+
+
+def test_prompt_markers_are_not_parsed_as_answers():
+    prompt = build_batch_prompt([("Question", "What is the Q3 budget?"), ("Writing", "Draft a status update")])
+
+    assert "<<<TASK 2>>>\nTask Type: Writing" in prompt
+    assert parse_batch_response(prompt, 2) == {}
+
+
+def add_tasks(vault, files):
+    for name, text in files.items():
+        (vault / "Vault" / "Needs_Action" / name).write_text(text)
+
+
+def run_batch(agent):
+    agent.task_queue.seed()
+    results = agent.run_batch(agent.claim_batch(timeout=0))
+    agent.dashboard.flush()
+    return results
+
+
+def test_agent_answers_small_files_with_one_request(vault, new_agent):
+    files = {f"status_{i}.txt": f"Status update {i}: what is blocking release?" for i in range(5)}
+    add_tasks(vault, files)
+
+    with FakeGroqServer() as server:
+        results = run_batch(new_agent(vault, server, batch=True))
+
+    assert results == {name: True for name in files}
+    assert server.requests == 1
+    for i in range(5):
+        done = (vault / "Vault" / "Done" / f"status_{i}.txt").read_text()
+        assert f"Fake response to: Task Type: Question\n\nStatus update {i}:" in done
+
+
+def test_agent_falls_back_to_single_requests_on_unparseable_reply(vault, new_agent):
+    files = {f"note_{i}.md": f"Draft note {i}" for i in range(3)}
+    add_tasks(vault, files)
+
+    with FakeGroqServer(reply=lambda body: "Sorry, here is everything in one blob.") as server:
+        results = run_batch(new_agent(vault, server, batch=True))
+
+    assert results == {name: True for name in files}
+    assert server.requests == 1 + 3
+    assert not list((vault / "Vault" / "Needs_Action").glob("*.md"))
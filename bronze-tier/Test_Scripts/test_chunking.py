@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Chunking tests: token-bounded splits at heading/paragraph boundaries with
+overlap, and map-reduce over a large document against the fake Groq server.
+Run with: python -m pytest Test_Scripts/test_chunking.py
+"""
+
+import re
+
+from chunking import split_document
+from fake_groq import FakeGroqServer
+from llm import estimate_tokens
+
+
+def make_report(sections=12, paragraphs=8):
+    lines = []
+    for section in range(sections):
+        lines.append(f"## Section {section}")
+        for paragraph in range(paragraphs):
+            lines.append(f"Section {section} paragraph {paragraph}: budget variance notes and follow-up actions "
+                         f"for the quarterly review, owner team {paragraph}.")
+    return '\n\n'.join(lines)
+
+
+def test_chunks_stay_within_budget_and_keep_paragraphs_whole():
+    report = make_report()
+    paragraphs = set(report.split('\n\n'))
+    chunks = split_document(report, chunk_tokens=300)
+
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert estimate_tokens(chunk) <= 300
+        assert set(chunk.split('\n\n')) <= paragraphs
+    # Without overlap every paragraph appears exactly once, in order
+    assert '\n\n'.join(chunks) == report
+
+
+def test_chunks_prefer_heading_boundaries():
+    chunks = split_document(make_report(), chunk_tokens=400)
+
+    assert sum(chunk.startswith("## Section") for chunk in chunks) >= len(chunks) - 1
+
+
+def test_overlap_repeats_trailing_paragraphs():
+    chunks = split_document(make_report(), chunk_tokens=300, overlap_tokens=60)
+
+    for previous, chunk in zip(chunks, chunks[1:]):
+        previous, chunk = previous.split('\n\n'), chunk.split('\n\n')
+        start = previous.index(chunk[0])
+        assert start > 0
+        assert previous[start:] == chunk[:len(previous) - start]
+
+
+def test_docx_style_text_splits_by_line():
+    text = '\n'.join(f"Line {i} of a long report without blank lines between paragraphs." for i in range(500))
+    chunks = split_document(text, chunk_tokens=200)
+
+    assert len(chunks) > 10
+    assert all(estimate_tokens(chunk) <= 200 for chunk in chunks)
+
+
+def test_agent_map_reduces_large_document(vault, monkeypatch, new_agent):
+    (vault / "Vault" / "Needs_Action" / "report.md").write_text("Please analyze this report.\n\n" + make_report(40))
+
+    def reply(body):
+        prompt = body['messages'][-1]['content']
+        part = re.search(r"This is part (\d+) of", prompt)
+        if part:
+            return f"notes for part {part.group(1)}"
+        return "FINAL:" + ",".join(re.findall(r"notes for part (\d+)", prompt))
+
+    monkeypatch.setenv("CHUNK_THRESHOLD_TOKENS", "1000")
+    monkeypatch.setenv("CHUNK_TOKENS", "600")
+    monkeypatch.setenv("GROQ_TPM", "10000000")
+    with FakeGroqServer(latency=0.1, reply=reply) as server:
+        agent = new_agent(vault, server, max_inflight=4)
+        assert agent.process_single_file()
+        agent.dashboard.flush()
+
+    done = (vault / "Vault" / "Done" / "report.md").read_text()
+    merged = re.search(r"FINAL:([\d,]+)", done).group(1).split(",")
+    assert merged == [str(n) for n in range(1, len(merged) + 1)]
+    assert server.requests == len(merged) + 1
+    assert server.max_in_flight > 1
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Claim ownership tests: a starting agent leaves claims of a running agent
+alone, recovers those of one that is gone (also in --once mode), and neither
+claiming nor releasing a file ever replaces another file with the same name.
+Run with: python -m pytest Test_Scripts/test_claims.py
+"""
+
+from argparse import Namespace
+
+import pytest
+
+from fake_groq import FakeGroqServer
+from vault_io import move_no_replace
+
+
+def test_move_no_replace_keeps_existing_file(tmp_path):
+    (tmp_path / "a.md").write_text("new")
+    (tmp_path / "b.md").write_text("stranded")
+
+    with pytest.raises(FileExistsError):
+        move_no_replace(tmp_path / "a.md", tmp_path / "b.md")
+    assert (tmp_path / "b.md").read_text() == "stranded" and (tmp_path / "a.md").exists()
+
+    move_no_replace(tmp_path / "a.md", tmp_path / "c.md")
+    assert not (tmp_path / "a.md").exists() and (tmp_path / "c.md").read_text() == "new"
+
+
+def test_drain_leaves_a_running_agents_claim_alone(vault, new_agent):
+    (vault / "Vault" / "Needs_Action" / "job.md").write_text("What is the status of the job?")
+    needs_action = vault / "Vault" / "Needs_Action"
+
+    with FakeGroqServer() as server:
+        running = new_agent(vault, server)
+        claimed = running.claim(needs_action / "job.md")
+
+        summary = new_agent(vault, server).run_drain(workers=2)
+        assert summary.as_dict()['files'] == 0 and server.requests == 0
+        assert claimed.exists()
+
+        assert running.run_pipeline(claimed) is True
+        assert server.requests == 1
+
+
+def test_claims_of_a_stopped_agent_are_recovered(vault, new_agent):
+    (vault / "Vault" / "Needs_Action" / "job.md").write_text("What is the status of the job?")
+    needs_action = vault / "Vault" / "Needs_Action"
+
+    with FakeGroqServer() as server:
+        stopped = new_agent(vault, server)
+        stopped.claim(needs_action / "job.md")
+        stopped.close()
+
+        summary = new_agent(vault, server).run_drain(workers=2)
+
+    assert summary.as_dict()['files'] == 1 and not summary.failures
+    assert (vault / "Vault" / "Done" / "job.md").exists()
+    assert not stopped.claim_path.exists()
+
+
+def test_once_recovers_a_stopped_agents_claim(vault, new_agent):
+    (vault / "Vault" / "Needs_Action" / "job.md").write_text("What is the status of the job?")
+    needs_action = vault / "Vault" / "Needs_Action"
+    from agent import run_mode
+
+    with FakeGroqServer() as server:
+        stopped = new_agent(vault, server)
+        stopped.claim(needs_action / "job.md")
+        stopped.close()
+
+        with pytest.raises(SystemExit) as exit_info:
+            run_mode(new_agent(vault, server), Namespace(recount=False, once=True))
+
+    assert exit_info.value.code == 0 and server.requests == 1
+    assert "## AI Response" in (vault / "Vault" / "Done" / "job.md").read_text()
+
+
+def test_release_does_not_replace_a_new_file_with_the_same_name(vault, new_agent):
+    (vault / "Vault" / "Needs_Action" / "job.md").write_text("What is the status of the job?")
+    needs_action = vault / "Vault" / "Needs_Action"
+
+    with FakeGroqServer() as server:
+        agent = new_agent(vault, server)
+        claimed = agent.claim(needs_action / "job.md")
+        task_id = agent.resolve_task(claimed)
+        (needs_action / "job.md").write_text("A different job, dropped straight in.")
+
+        # Same name in Needs_Action: the claim is refused rather than clobbering
+        assert agent.claim(needs_action / "job.md") is None
+
+        released = agent.release(claimed)
+
+    assert released == needs_action / "job-2.md"
+    assert released.read_text() == "What is the status of the job?"
+    assert (needs_action / "job.md").read_text() == "A different job, dropped straight in."
+    assert agent.dashboard.find_task("job-2.md") == task_id
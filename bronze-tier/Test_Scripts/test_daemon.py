@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Daemon tests: files dropped in the Inbox are handed to the in-process agent
+without polling, with one Dashboard row per task, and the daemon stops cleanly.
+Run with: python -m pytest Test_Scripts/test_daemon.py
+"""
+
+import threading
+import time
+
+from fake_groq import FakeGroqServer
+
+
+def wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_inbox_to_done_without_polling(vault, new_agent):
+    (vault / "Vault" / "Inbox" / "backlog.md").write_text("What is left from last week?")
+
+    with FakeGroqServer(latency=0.1) as server:
+        from daemon import TriageDaemon
+
+        agent = new_agent(vault, server)
+        daemon = TriageDaemon(agent, settle_time=5.0)
+        stop = threading.Event()
+        # An idle rescan interval far above the expected latency
+        thread = threading.Thread(target=daemon.run, kwargs={'workers': 2, 'interval': 60, 'stop_event': stop})
+        thread.start()
+        try:
+            done = vault / "Vault" / "Done"
+            assert wait_for(lambda: (done / "backlog.md").exists())
+
+            latencies = []
+            for i in range(3):
+                staging = vault / "Vault" / "Inbox" / f"task_{i}.md.partial"
+                staging.write_text(f"How do we ship item {i}?")
+                start = time.monotonic()
+                staging.rename(vault / "Vault" / "Inbox" / f"task_{i}.md")
+                assert wait_for(lambda: (done / f"task_{i}.md").exists())
+                latencies.append(time.monotonic() - start)
+        finally:
+            stop.set()
+            thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    # LLM time (0.1 s) plus milliseconds: no settle wait, no polling delay
+    assert max(latencies) < 0.5
+    # One row per task (the handler's), completed by the agent
+    rows = [row for row in agent.dashboard.store.rows() if row[1] in ("backlog", "task_0", "task_1", "task_2")]
+    assert sorted(row[1] for row in rows) == ["backlog", "task_0", "task_1", "task_2"]
+    assert {row[2] for row in rows} == {"Completed"}
+    assert server.requests == 4
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Dashboard state store tests.
+Run with: python -m pytest Test_Scripts/test_dashboard.py
+"""
+
+import shutil
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+import dashboard as dashboard_module
+from dashboard import Dashboard, TaskStore, archive_page_name
+
+VAULT_DASHBOARD = Path(__file__).resolve().parent.parent / "Vault" / "Dashboard.md"
+
+
+def make_dashboard(tmp_path, **kwargs):
+    dashboard_path = tmp_path / "Dashboard.md"
+    shutil.copy(VAULT_DASHBOARD, dashboard_path)
+    return Dashboard(dashboard_path, **kwargs)
+
+
+def strip_last_updated(text):
+    return [line for line in text.splitlines() if 'Last Updated:' not in line]
+
+
+def test_legacy_dashboard_round_trips(tmp_path):
+    dashboard = make_dashboard(tmp_path, debounce=0)
+    dashboard.render()
+
+    rendered = (tmp_path / "Dashboard.md").read_text(encoding='utf-8')
+    original = VAULT_DASHBOARD.read_text(encoding='utf-8')
+    assert strip_last_updated(rendered) == strip_last_updated(original)
+
+
+def test_burst_of_transitions_renders_once(tmp_path):
+    dashboard = make_dashboard(tmp_path, debounce=60, max_rows=1000)
+
+    task_ids = [dashboard.add_task(f"task_{i}", f"task_{i}.md") for i in range(500)]
+    for i, task_id in enumerate(task_ids):
+        dashboard.update_status(task_id, "Completed", f"task_{i}.md")
+    dashboard.flush()
+
+    assert dashboard.renders == 1
+    assert dashboard.store.stats() == {'total': 506, 'completed': 506, 'pending': 0, 'errors': 0}
+    content = (tmp_path / "Dashboard.md").read_text(encoding='utf-8')
+    assert 'Done/task_499.md' in content
+
+
+def test_repeated_transition_does_not_drift(tmp_path):
+    dashboard = make_dashboard(tmp_path, debounce=0)
+
+    task_id = dashboard.add_task("report", "report.md")
+    dashboard.update_status(task_id, "Error", "report.md")
+    dashboard.update_status(task_id, "Completed", "report.md")
+    dashboard.update_status(task_id, "Completed", "report.md")
+
+    assert dashboard.store.counters() == {'total': 7, 'completed': 7, 'pending': 0, 'errors': 0}
+
+
+def test_counters_commit_with_the_status_change(tmp_path):
+    dashboard = make_dashboard(tmp_path, debounce=60)
+    task_id = dashboard.add_task("report", "report.md")
+    dashboard.update_status(task_id, "Error", "report.md")
+
+    # A process that dies before its debounced render loses nothing
+    restarted = Dashboard(tmp_path / "Dashboard.md", debounce=0)
+    assert restarted.store.counters() == {'total': 7, 'completed': 6, 'pending': 0, 'errors': 1}
+    dashboard.flush()
+
+
+def test_counters_do_not_double_count_other_processes(tmp_path):
+    watcher = make_dashboard(tmp_path, debounce=60)
+    agent = Dashboard(tmp_path / "Dashboard.md", debounce=0)
+    watcher.add_tasks([(f"task_{i}", f"task_{i}.md") for i in range(3)])
+
+    # The agent renders before the watcher's debounced render fires
+    agent.render()
+    watcher.flush()
+
+    assert agent.store.counters() == agent.store.stats() == {'total': 9, 'completed': 6, 'pending': 3, 'errors': 0}
+    content = (tmp_path / "Dashboard.md").read_text(encoding='utf-8')
+    assert '>9</h3>' in content
+
+
+def test_same_stem_tasks_are_tracked_separately(tmp_path):
+    dashboard = make_dashboard(tmp_path, debounce=0)
+
+    md_id = dashboard.add_task("report", "report.md")
+    txt_id = dashboard.add_task("report", "report.txt")
+    assert md_id != txt_id
+    assert dashboard.find_task("report.txt") == txt_id
+
+    dashboard.update_status(dashboard.find_task("report.md"), "Completed", "report.md")
+
+    statuses = {row[0]: row[2] for row in dashboard.store.rows()}
+    assert statuses[md_id] == "Completed"
+    assert statuses[txt_id] == "Pending"
+    assert dashboard.find_task("report.md") is None
+
+
+def test_recount_rebuilds_from_vault_folders(tmp_path):
+    vault = tmp_path
+    for folder in ("Done", "Needs_Action"):
+        (vault / folder).mkdir()
+    (vault / "Done" / "a.md").write_text("a")
+    (vault / "Done" / "b.docx").write_text("b")
+    (vault / "Needs_Action" / "c.txt").write_text("c")
+    (vault / "Needs_Action" / "d.md").write_text("d")
+    (vault / "Needs_Action" / "notes.csv").write_text("ignored")
+
+    dashboard = make_dashboard(tmp_path, debounce=0)
+    task_id = dashboard.add_task("d", "d.md")
+    dashboard.update_status(task_id, "Error", "d.md")
+
+    stats = dashboard.recount(vault)
+
+    assert stats == {'total': 4, 'completed': 2, 'pending': 1, 'errors': 1}
+    assert dashboard.store.counters() == stats
+
+
+def test_completed_rows_roll_into_monthly_archive(tmp_path):
+    dashboard = make_dashboard(tmp_path, debounce=0, max_rows=10, archive_batch=5)
+    pending_id = dashboard.add_task("still_pending", "still_pending.md")
+
+    for i in range(40):
+        task_id = dashboard.add_task(f"task_{i}", f"task_{i}.md")
+        dashboard.update_status(task_id, "Completed", f"task_{i}.md")
+
+    rows = dashboard.store.rows()
+    completed = [row for row in rows if row[2] == "Completed"]
+    assert len(completed) <= 15
+    assert pending_id in [row[0] for row in rows]
+
+    archive = tmp_path / "Archive"
+    month = completed[-1][3][:7]
+    page = (archive / f"Dashboard-{month}.md").read_text(encoding='utf-8')
+    assert '../Done/task_0.md' in page
+    assert f'Dashboard-{month}.md' in (archive / "index.md").read_text(encoding='utf-8')
+
+    content = (tmp_path / "Dashboard.md").read_text(encoding='utf-8')
+    assert 'Archive/index.md' in content
+    assert 'Done/task_39.md' in content
+    assert 'Done/task_0.md' not in content
+
+
+def test_archive_fills_fixed_size_pages_and_rewrites_only_the_last(tmp_path):
+    dashboard = make_dashboard(tmp_path, debounce=0, max_rows=5, archive_batch=5, archive_page_rows=8)
+    writes = []
+    original_write = dashboard_module.atomic_write
+
+    def recording_write(path, content, *args, **kwargs):
+        writes.append(Path(path).name)
+        return original_write(path, content, *args, **kwargs)
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(dashboard_module, "atomic_write", recording_write)
+        for i in range(60):
+            task_id = dashboard.add_task(f"task_{i}", f"task_{i}.md")
+            dashboard.update_status(task_id, "Completed", f"task_{i}.md")
+
+    pages = dashboard.store.archive_pages()
+    assert all(count <= 8 for _, _, count in pages)
+    assert sum(count for _, _, count in pages) == dashboard.store.archived_count()
+
+    archive = tmp_path / "Archive"
+    archived = [sno for month, page, _ in pages for sno, *_ in dashboard.store.archived_rows(month, page)]
+    assert len(archived) == len(set(archived)) == dashboard.store.archived_count()
+    for month, page, count in pages:
+        text = (archive / archive_page_name(month, page)).read_text(encoding='utf-8')
+        assert text.count('font-weight: 700; color: #6366f1') == count
+    index = (archive / "index.md").read_text(encoding='utf-8')
+    assert all(archive_page_name(month, page) in index for month, page, _ in pages)
+
+    # Each batch rewrote the one or two pages it touched, never every page of the month
+    page_writes = [name for name in writes if name.startswith("Dashboard-")]
+    batches = writes.count("index.md")
+    assert batches > 1 and len(page_writes) <= 2 * batches
+
+
+def test_archived_rows_from_before_page_split_are_migrated(tmp_path):
+    dashboard = make_dashboard(tmp_path, debounce=0)
+    task_id = dashboard.add_task("old", "old.md", status="Completed")
+    dashboard.store.close()
+
+    conn = sqlite3.connect(tmp_path / ".state" / "dashboard.db")
+    conn.execute('DROP TABLE archive_pages')
+    conn.execute('DROP INDEX tasks_archive')
+    conn.execute('ALTER TABLE tasks DROP COLUMN archive_page')
+    conn.execute('ALTER TABLE tasks DROP COLUMN archive_month')
+    conn.execute('UPDATE tasks SET archived = 1 WHERE sno = ?', (task_id,))
+    conn.commit()
+    conn.close()
+
+    store = TaskStore(tmp_path / ".state" / "dashboard.db")
+    ((month, page, count),) = store.archive_pages()
+    assert page == 1 and count == 1
+    assert [row[0] for row in store.archived_rows(month, page)] == [task_id]
+    store.close()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Dashboard cross-process stress test.
+Runs a watcher-style writer (adds Pending tasks) and an agent-style writer
+(completes them) in two processes against the same vault, while a reader
+checks Dashboard.md is never seen truncated.
+Run with: python -m pytest Test_Scripts/test_dashboard_stress.py
+"""
+
+import multiprocessing
+import re
+import shutil
+import threading
+import time
+from pathlib import Path
+
+from dashboard import Dashboard
+
+VAULT_DASHBOARD = Path(__file__).resolve().parent.parent / "Vault" / "Dashboard.md"
+TASKS = 300
+
+
+def watcher_writer(dashboard_path, count):
+    dashboard = Dashboard(dashboard_path, debounce=0.01)
+    for i in range(count):
+        dashboard.add_task(f"stress_{i}", f"stress_{i}.md")
+    dashboard.flush()
+
+
+def agent_writer(dashboard_path, count):
+    dashboard = Dashboard(dashboard_path, debounce=0.01)
+    for i in range(count):
+        # The agent only sees a task once the watcher has recorded it
+        while (task_id := dashboard.find_task(f"stress_{i}.md")) is None:
+            time.sleep(0.001)
+        dashboard.update_status(task_id, "Completed", f"stress_{i}.md")
+    dashboard.flush()
+
+
+def test_parallel_writers_keep_every_transition(tmp_path):
+    dashboard_path = tmp_path / "Dashboard.md"
+    shutil.copy(VAULT_DASHBOARD, dashboard_path)
+    Dashboard(dashboard_path, debounce=0).render()
+
+    torn_reads = []
+    stop = threading.Event()
+
+    def reader():
+        while not stop.is_set():
+            content = dashboard_path.read_text(encoding='utf-8')
+            if not content.rstrip().endswith('</div>'):
+                torn_reads.append(len(content))
+
+    reader_thread = threading.Thread(target=reader)
+    reader_thread.start()
+
+    context = multiprocessing.get_context('spawn')
+    processes = [
+        context.Process(target=watcher_writer, args=(dashboard_path, TASKS)),
+        context.Process(target=agent_writer, args=(dashboard_path, TASKS)),
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=120)
+        assert process.exitcode == 0
+
+    stop.set()
+    reader_thread.join()
+
+    # A fresh process renders the final view from the shared store
+    Dashboard(dashboard_path, debounce=0).render()
+    content = dashboard_path.read_text(encoding='utf-8')
+    archived = ''.join(page.read_text(encoding='utf-8') for page in (tmp_path / "Archive").glob("Dashboard-*.md"))
+
+    assert torn_reads == []
+    for i in range(TASKS):
+        assert f'Done/stress_{i}.md' in content or f'../Done/stress_{i}.md' in archived
+    stats = [int(n) for n in re.findall(r'font-size: 48px[^"]*">(\d+)</h3>', content)]
+    assert stats == [TASKS + 6, TASKS + 6, 0, 0]
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Ingest deduplication tests: streamed content hashing, unique names for
+colliding drops, exact duplicates linked to the first task's result without
+another Groq request, and no file in Needs_Action/ or Done/ is ever overwritten.
+Run with: python -m pytest Test_Scripts/test_dedup.py
+"""
+
+import hashlib
+
+import pytest
+
+import watcher
+from content_index import ContentIndex, file_digest
+from fake_groq import FakeGroqServer
+from vault_io import unique_name
+from watcher import InboxHandler
+
+
+def make_handler(vault):
+    tasks = vault / "Vault"
+    return InboxHandler(tasks / "Inbox", tasks / "Needs_Action", tasks / "Dashboard.md")
+
+
+def rows_named(dashboard, *names):
+    return sorted((row[1], row[2], row[5], row[6]) for row in dashboard.store.rows() if row[1] in names)
+
+
+def test_file_digest_streams_in_chunks(tmp_path):
+    path = tmp_path / "big.txt"
+    path.write_bytes(b"quarterly budget review\n" * 100000)
+
+    assert file_digest(path, chunk_size=4096) == hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def test_unique_name_skips_names_taken_anywhere(tmp_path):
+    for folder in ("a", "b"):
+        (tmp_path / folder).mkdir()
+    (tmp_path / "a" / "report.md").write_text("x")
+    (tmp_path / "b" / "report-2.md").write_text("x")
+    folders = [tmp_path / "a", tmp_path / "b"]
+
+    assert unique_name("notes.md", folders) == "notes.md"
+    assert unique_name("report.md", folders) == "report-3.md"
+    assert unique_name("report.md", folders, taken={"report-3.md"}) == "report-4.md"
+
+
+def test_index_persists_and_links_waiting_duplicates(tmp_path):
+    index = ContentIndex(tmp_path / "content.db")
+    index.add("abc", "report.md")
+    assert index.add_duplicate("abc", 7, "report-2.md") is None
+    index.close()
+
+    index = ContentIndex(tmp_path / "content.db")
+    assert index.lookup("abc") == ("report.md", None)
+    assert index.complete("report.md", "report.md") == [(7, "report-2.md")]
+    assert index.lookup("abc") == ("report.md", "report.md")
+    # Once the original is done, a new duplicate links straight away
+    assert index.add_duplicate("abc", 8, "report-3.md") == "report.md"
+    assert index.complete("report.md", "report.md") == []
+
+
+def test_same_name_with_new_content_gets_a_unique_task(vault):
+    (vault / "Vault" / "Done" / "report.md").write_text("Last week's report, already answered.")
+    (vault / "Vault" / "Inbox" / "report.md").write_text("This week's report: what changed?")
+
+    handler = make_handler(vault)
+    handler.process_file(vault / "Vault" / "Inbox" / "report.md")
+    handler.dashboard.flush()
+
+    assert (vault / "Vault" / "Needs_Action" / "report-2.md").read_text() == "This week's report: what changed?"
+    assert (vault / "Vault" / "Done" / "report.md").read_text() == "Last week's report, already answered."
+    assert rows_named(handler.dashboard, "report-2") == [("report-2", "Pending", "Needs_Action", "report-2.md")]
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_ingest_never_replaces_a_file_released_meanwhile(vault, monkeypatch, bulk):
+    needs_action = vault / "Vault" / "Needs_Action"
+    (vault / "Vault" / "Inbox" / "job.md").write_text("A new job from the Inbox.")
+    choose_name = watcher.unique_name
+
+    def release_after_choosing(filename, folders, taken=()):
+        name = choose_name(filename, folders, taken)
+        if not (needs_action / "job.md").exists():
+            # An agent releases its claim on job.md between the name check and the move
+            (needs_action / "job.md").write_text("A claimed job, released for a retry.")
+        return name
+    monkeypatch.setattr(watcher, "unique_name", release_after_choosing)
+
+    handler = make_handler(vault)
+    if bulk:
+        handler.process_existing_files()
+    else:
+        handler.process_file(vault / "Vault" / "Inbox" / "job.md")
+    handler.dashboard.flush()
+
+    assert (needs_action / "job.md").read_text() == "A claimed job, released for a retry."
+    assert (needs_action / "job-2.md").read_text() == "A new job from the Inbox."
+    assert rows_named(handler.dashboard, "job") == [("job", "Pending", "Needs_Action", "job-2.md")]
+    assert handler.content_index.lookup(file_digest(needs_action / "job-2.md")) == ("job-2.md", None)
+
+
+def test_duplicate_of_a_completed_task_links_its_result(vault, tmp_path):
+    handler = make_handler(vault)
+    (vault / "Vault" / "Done" / "invoice.md").write_text("Pay invoice 42?\n\n## AI Response\n\nYes.")
+    handler.content_index.add(file_digest_of(tmp_path, "Pay invoice 42?"), "invoice.md")
+    handler.content_index.complete("invoice.md", "invoice.md")
+
+    (vault / "Vault" / "Inbox" / "invoice copy.md").write_text("Pay invoice 42?")
+    handler.process_file(vault / "Vault" / "Inbox" / "invoice copy.md")
+    handler.dashboard.flush()
+
+    linked = vault / "Vault" / "Done" / "invoice copy.md"
+    assert linked.read_text() == (vault / "Vault" / "Done" / "invoice.md").read_text()
+    assert list((vault / "Vault" / "Inbox").iterdir()) == []
+    assert list((vault / "Vault" / "Needs_Action").iterdir()) == []
+    assert rows_named(handler.dashboard, "invoice copy") == [("invoice copy", "Completed", "Done", "invoice copy.md")]
+
+
+def file_digest_of(tmp_path, text):
+    path = tmp_path / "digest.tmp"
+    path.write_text(text)
+    digest = file_digest(path)
+    path.unlink()
+    return digest
+
+
+def test_duplicates_in_backlog_share_one_request(vault, new_agent):
+    for name in ("plan.md", "plan (1).md", "plan (2).md"):
+        (vault / "Vault" / "Inbox" / name).write_text("Draft a launch plan for the beta.")
+    (vault / "Vault" / "Inbox" / "other.md").write_text("What is the vendor's deadline?")
+
+    handler = make_handler(vault)
+    handler.process_existing_files()
+    queued = sorted(p.name for p in (vault / "Vault" / "Needs_Action").glob("*.md"))
+    parked = sorted(p.name for p in (vault / "Vault" / "Needs_Action" / ".duplicates").iterdir())
+    assert len(queued) == 2 and "other.md" in queued and len(parked) == 2
+
+    with FakeGroqServer() as server:
+        agent = new_agent(vault, server)
+        summary = agent.run_drain(workers=2)
+
+    assert summary.failures == [] and server.requests == 2
+    done = vault / "Vault" / "Done"
+    answered = {(done / name).read_text() for name in ("plan.md", "plan (1).md", "plan (2).md")}
+    assert len(answered) == 1 and "## AI Response" in answered.pop()
+    assert list((vault / "Vault" / "Needs_Action" / ".duplicates").iterdir()) == []
+    rows = rows_named(agent.dashboard, "plan", "plan (1)", "plan (2)", "other")
+    assert [(name, status) for name, status, _, _ in rows] == [
+        ("other", "Completed"), ("plan", "Completed"), ("plan (1)", "Completed"), ("plan (2)", "Completed")]
+
+
+def test_finalize_never_overwrites_an_earlier_result(vault, new_agent):
+    (vault / "Vault" / "Done" / "status.md").write_text("Answered last month.")
+    (vault / "Vault" / "Needs_Action" / "status.md").write_text("What is the project status?")
+
+    with FakeGroqServer() as server:
+        agent = new_agent(vault, server)
+        assert agent.process_single_file() is True
+
+    assert (vault / "Vault" / "Done" / "status.md").read_text() == "Answered last month."
+    assert "## AI Response" in (vault / "Vault" / "Done" / "status-2.md").read_text()
+    assert rows_named(agent.dashboard, "status")[-1] == ("status", "Completed", "Done", "status-2.md")
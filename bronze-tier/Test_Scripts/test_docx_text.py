@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Streamed .docx extraction tests: paragraph text matches python-docx, table
+rows are included in document order, and the agent reads .docx tasks with it.
+Run with: python -m pytest Test_Scripts/test_docx_text.py
+"""
+
+from pathlib import Path
+
+from docx import Document
+
+from agent import FileTriageAgent
+from docx_text import extract_docx_text
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+def paragraph_text(path):
+    return '\n'.join(paragraph.text for paragraph in Document(path).paragraphs)
+
+
+def test_matches_python_docx_paragraphs_on_vault_samples():
+    samples = sorted((REPO / "Vault").glob("*/*.docx"))
+
+    assert samples
+    for path in samples:
+        assert extract_docx_text(path) == paragraph_text(path)
+
+
+def test_runs_tabs_and_breaks(tmp_path):
+    doc = Document()
+    doc.add_paragraph("Name:\tQ3 budget")
+    paragraph = doc.add_paragraph()
+    paragraph.add_run("Line one").add_break()
+    paragraph.add_run("line ")
+    paragraph.add_run("two").bold = True
+    doc.add_paragraph()
+    doc.add_paragraph("End")
+    path = tmp_path / "runs.docx"
+    doc.save(path)
+
+    assert extract_docx_text(path) == "Name:\tQ3 budget\nLine one\nline two\n\nEnd"
+    assert extract_docx_text(path) == paragraph_text(path)
+
+
+def test_table_rows_in_document_order(tmp_path):
+    doc = Document()
+    doc.add_paragraph("Budget summary:")
+    table = doc.add_table(rows=3, cols=2)
+    for row, (item, cost) in zip(table.rows, [("Item", "Cost"), ("Design", "$4,000"), ("Hosting", "")]):
+        row.cells[0].text, row.cells[1].text = item, cost
+    table.rows[1].cells[0].add_paragraph("(phase 2)")
+    doc.add_table(rows=1, cols=2)
+    doc.add_paragraph("What is the total?")
+    path = tmp_path / "table.docx"
+    doc.save(path)
+
+    assert extract_docx_text(path).split('\n') == [
+        "Budget summary:",
+        "Item | Cost",
+        "Design (phase 2) | $4,000",
+        "Hosting | ",
+        "What is the total?",
+    ]
+
+
+def test_agent_reads_docx_without_building_a_document(tmp_path, monkeypatch):
+    doc = Document()
+    doc.add_paragraph("Please review the costs below.")
+    doc.add_table(rows=1, cols=2).rows[0].cells[0].text = "Licenses"
+    path = tmp_path / "costs.docx"
+    doc.save(path)
+
+    def no_document(*args, **kwargs):
+        raise AssertionError("load_task built a python-docx Document")
+    monkeypatch.setattr("docx.Document", no_document)
+
+    agent = FileTriageAgent.__new__(FileTriageAgent)
+    ctx = agent.load_task(path)
+
+    assert ctx.content == "Please review the costs below.\nLicenses | "
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Drain mode tests: concurrent workers empty Needs_Action and return, --max-files
+stops after N files, and the run summary reports latency percentiles.
+Run with: python -m pytest Test_Scripts/test_drain.py
+"""
+
+from fake_groq import FakeGroqServer
+from metrics import RunSummary, percentile
+
+
+def add_tasks(vault, count):
+    for i in range(count):
+        (vault / "Vault" / "Needs_Action" / f"task_{i:02}.md").write_text(f"What is the status of item {i}?")
+
+
+def test_percentile_nearest_rank():
+    values = [float(n) for n in range(1, 101)]
+
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([], 50) is None
+
+
+def test_summary_counts_failures_and_throughput():
+    summary = RunSummary()
+    summary.record("a.md", 0.5, True)
+    summary.record("b.md", 1.5, False)
+    summary.finish()
+    report = summary.as_dict()
+
+    assert report['files'] == 2 and report['succeeded'] == 1
+    assert report['failed'] == ["b.md"]
+    assert report['max'] == 1.5
+    assert report['files_per_minute'] > 0
+
+
+def test_drain_processes_backlog_concurrently_and_returns(vault, new_agent):
+    add_tasks(vault, 12)
+
+    with FakeGroqServer(latency=0.1) as server:
+        summary = new_agent(vault, server, max_inflight=4).run_drain(workers=4)
+
+    report = summary.as_dict()
+    assert report['files'] == 12 and not report['failed']
+    assert not list((vault / "Vault" / "Needs_Action").glob("*.md"))
+    assert len(list((vault / "Vault" / "Done").glob("*.md"))) == 12
+    assert server.max_in_flight > 1
+    assert 0.1 <= report['p50'] <= report['p95'] <= report['p99'] <= report['max']
+
+
+def test_max_files_stops_after_n(vault, new_agent):
+    add_tasks(vault, 10)
+
+    with FakeGroqServer() as server:
+        summary = new_agent(vault, server, max_inflight=4).run_drain(workers=3, max_files=4)
+
+    assert summary.as_dict()['files'] == 4
+    assert server.requests == 4
+    assert len(list((vault / "Vault" / "Done").glob("*.md"))) == 4
+    assert len(list((vault / "Vault" / "Needs_Action").glob("*.md"))) == 6
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Task journal tests: an agent that dies after the response was generated (or
+written into the file) finishes the task on restart without another Groq call
+or a second "AI Response" section, one that died right after the move to
+Done/ under a new name is completed under that name, and stale entries are
+ignored.
+Run with: python -m pytest Test_Scripts/test_journal.py
+"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from docx import Document
+
+from content_index import file_digest
+from fake_groq import FakeGroqServer
+from journal import RESPONDED, UPDATED, TaskJournal
+
+
+class Crash(BaseException):
+    """Stands in for the process dying: not caught by the agent's error handling."""
+
+
+def make_task(vault, name):
+    path = vault / "Vault" / "Needs_Action" / name
+    if path.suffix == '.docx':
+        doc = Document()
+        doc.add_paragraph("Please summarize the vendor contract.")
+        doc.save(path)
+    else:
+        path.write_text("Please summarize the vendor contract.", encoding='utf-8')
+    return path
+
+
+def response_sections(path):
+    if path.suffix == '.docx':
+        return [p.text for p in Document(path).paragraphs].count("AI Response")
+    return path.read_text(encoding='utf-8').count("## AI Response")
+
+
+def crash(self, ctx):
+    raise Crash()
+
+
+def crash_run(agent, file_path):
+    claimed = agent.claim(file_path)
+    with pytest.raises(Crash):
+        agent.run_pipeline(claimed)
+    # The process is gone: its claims are up for recovery
+    agent.close()
+    return claimed
+
+
+@pytest.mark.parametrize("name", ["contract.md", "contract.docx"])
+def test_restart_after_update_only_finalizes(vault, monkeypatch, new_agent, name):
+    file_path = make_task(vault, name)
+
+    with FakeGroqServer() as server:
+        agent = new_agent(vault, server)
+        with monkeypatch.context() as patch:
+            patch.setattr(type(agent), "finalize", crash)
+            claimed = crash_run(agent, file_path)
+        assert agent.journal.get(name).stage == UPDATED
+
+        restarted = new_agent(vault, server)
+        restarted.recover_claims()
+
+    done = vault / "Vault" / "Done" / name
+    assert done.exists() and not claimed.exists()
+    assert response_sections(done) == 1
+    assert server.requests == 1
+    assert len(restarted.journal) == 0
+    assert restarted.dashboard.store.rows()[-1][1:3] == (Path(name).stem, "Completed")
+
+
+@pytest.mark.parametrize("name", ["contract.md", "contract.docx"])
+def test_restart_after_unjournaled_write_does_not_append_twice(vault, monkeypatch, new_agent, name):
+    file_path = make_task(vault, name)
+    record = TaskJournal.record
+
+    def crash_on_updated(self, name, stage, *args, **kwargs):
+        if stage == UPDATED:
+            raise Crash()
+        return record(self, name, stage, *args, **kwargs)
+
+    with FakeGroqServer() as server:
+        agent = new_agent(vault, server)
+        with monkeypatch.context() as patch:
+            patch.setattr(TaskJournal, "record", crash_on_updated)
+            crash_run(agent, file_path)
+        assert agent.journal.get(name).stage == RESPONDED
+
+        restarted = new_agent(vault, server)
+        restarted.recover_claims()
+
+    done = vault / "Vault" / "Done" / name
+    assert response_sections(done) == 1
+    assert server.requests == 1
+
+
+def test_restart_after_move_to_a_new_done_name(vault, monkeypatch, new_agent):
+    (vault / "Vault" / "Done" / "contract.md").write_text("Answered last month.", encoding='utf-8')
+    file_path = make_task(vault, "contract.md")
+    digest = file_digest(file_path)
+
+    with FakeGroqServer() as server:
+        agent = new_agent(vault, server)
+        agent.content_index.add(digest, "contract.md")
+        with monkeypatch.context() as patch:
+            # Dies after the rename into Done/, before the Dashboard is updated
+            patch.setattr(type(agent), "_update_dashboard", lambda self, *args: crash(self, None))
+            crash_run(agent, file_path)
+        assert agent.journal.get("contract.md").done_name == "contract-2.md"
+
+        restarted = new_agent(vault, server)
+        restarted.recover_claims()
+
+    assert (vault / "Vault" / "Done" / "contract.md").read_text(encoding='utf-8') == "Answered last month."
+    assert response_sections(vault / "Vault" / "Done" / "contract-2.md") == 1
+    assert len(restarted.journal) == 0 and server.requests == 1
+    _, _, status, _, _, folder, filename = restarted.dashboard.store.rows()[-1]
+    assert (status, folder, filename) == ("Completed", "Done", "contract-2.md")
+    assert restarted.content_index.lookup(digest) == ("contract.md", "contract-2.md")
+
+
+def test_journal_without_done_name_column_is_migrated(tmp_path):
+    conn = sqlite3.connect(tmp_path / "journal.db")
+    conn.execute('CREATE TABLE journal (name TEXT PRIMARY KEY, stage TEXT NOT NULL, task_id INTEGER, '
+                 'task_type TEXT, response TEXT, size INTEGER, updated REAL NOT NULL)')
+    conn.execute("INSERT INTO journal VALUES ('contract.md', 'updated', 1, 'General', NULL, 3, 0)")
+    conn.commit()
+    conn.close()
+
+    journal = TaskJournal(tmp_path / "journal.db")
+    assert journal.get("contract.md").done_name is None
+    journal.set_done_name("contract.md", "contract-2.md")
+    assert journal.pending()[0].done_name == "contract-2.md"
+    journal.close()
+
+
+def test_restart_before_update_reuses_journaled_response(vault, monkeypatch, new_agent):
+    file_path = make_task(vault, "contract.md")
+
+    with FakeGroqServer(reply=lambda body: "Journaled answer.") as server:
+        agent = new_agent(vault, server)
+        with monkeypatch.context() as patch:
+            patch.setattr(type(agent), "update", crash)
+            crash_run(agent, file_path)
+        assert agent.journal.get("contract.md").response == "Journaled answer."
+
+        restarted = new_agent(vault, server)
+        assert restarted.recover_claims() == 1
+
+    done = (vault / "Vault" / "Done" / "contract.md").read_text(encoding='utf-8')
+    assert done.count("## AI Response") == 1 and "Journaled answer." in done
+    assert server.requests == 1
+
+
+def test_failed_move_is_retried_without_groq(vault, new_agent):
+    file_path = make_task(vault, "contract.md")
+
+    with FakeGroqServer() as server:
+        agent = new_agent(vault, server)
+        done_path, agent.done_path = agent.done_path, vault / "Vault" / "Unmounted"
+        assert agent.run_pipeline(agent.claim(file_path)) is False
+        # Released to Needs_Action with the response already appended
+        assert response_sections(file_path) == 1
+        agent.done_path = done_path
+
+        assert agent.run_pipeline(agent.claim(file_path)) is True
+
+    assert response_sections(vault / "Vault" / "Done" / "contract.md") == 1
+    assert server.requests == 1
+
+
+def test_stale_entry_for_a_new_file_is_ignored(vault, new_agent):
+    file_path = make_task(vault, "contract.md")
+
+    with FakeGroqServer() as server:
+        agent = new_agent(vault, server)
+        agent.journal.record("contract.md", UPDATED, 1, "General", size=3)
+        assert agent.run_pipeline(agent.claim(file_path)) is True
+
+    assert response_sections(vault / "Vault" / "Done" / "contract.md") == 1
+    assert server.requests == 1
+    assert len(agent.journal) == 0
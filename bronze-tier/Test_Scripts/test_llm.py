@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Async Groq layer tests against the local fake Groq server.
+Run with: python -m pytest Test_Scripts/test_llm.py
+"""
+
+import time
+
+from fake_groq import FakeGroqServer
+from llm import GroqGenerator, parse_duration
+
+MESSAGES = [{"role": "user", "content": "What is the status of the project?"}]
+
+
+def make_generator(server, **kwargs):
+    options = dict(api_key="test-key", model="fake-model", base_url=server.base_url,
+                   requests_per_minute=6000, tokens_per_minute=10_000_000,
+                   backoff_base=0.01, backoff_cap=0.05)
+    options.update(kwargs)
+    return GroqGenerator(**options)
+
+
+def test_parse_duration():
+    assert parse_duration("2m59.56s") == 179.56
+    assert parse_duration("7.66s") == 7.66
+    assert parse_duration("120ms") == 0.12
+    assert parse_duration("3") == 3.0
+    assert parse_duration(None) is None
+
+
+def test_retries_429_before_succeeding():
+    with FakeGroqServer(fail_first=2) as server:
+        generator = make_generator(server)
+        try:
+            response = generator.generate(MESSAGES)
+        finally:
+            generator.close()
+
+    assert response.startswith("Fake response to:")
+    assert server.rejected == 2
+    assert generator.stats['retries'] == 2
+    assert generator.stats['rate_limited'] == 2
+    assert generator.stats['requests'] == 1
+
+
+def test_gives_up_after_max_retries():
+    with FakeGroqServer(fail_first=100) as server:
+        generator = make_generator(server, max_retries=2)
+        try:
+            generator.generate(MESSAGES)
+        except Exception as e:
+            assert getattr(e, 'status_code', None) == 429
+        else:
+            raise AssertionError("expected a rate limit error")
+        finally:
+            generator.close()
+
+    assert server.requests == 3
+
+
+def test_keeps_requests_in_flight_concurrently():
+    with FakeGroqServer(latency=0.2) as server:
+        generator = make_generator(server, max_concurrency=8)
+        try:
+            start = time.perf_counter()
+            results = generator.generate_many([MESSAGES] * 8)
+            elapsed = time.perf_counter() - start
+        finally:
+            generator.close()
+
+    assert all(isinstance(r, str) for r in results)
+    assert server.max_in_flight > 1
+    assert elapsed < 8 * 0.2
+
+
+def test_request_bucket_paces_calls():
+    with FakeGroqServer() as server:
+        # 120 RPM = 2 per second; a full bucket allows the burst, then paces
+        generator = make_generator(server, requests_per_minute=120)
+        try:
+            generator.generate(MESSAGES)
+            generator.request_bucket.tokens = 0
+            start = time.perf_counter()
+            generator.generate(MESSAGES)
+            elapsed = time.perf_counter() - start
+        finally:
+            generator.close()
+
+    assert elapsed >= 0.4
+
+
+def test_stream_yields_chunks_and_records_usage():
+    with FakeGroqServer(fail_first=1, chunk_size=8) as server:
+        generator = make_generator(server)
+        try:
+            chunks = list(generator.stream(MESSAGES))
+        finally:
+            generator.close()
+
+    assert len(chunks) > 1
+    assert ''.join(chunks).startswith("Fake response to: What is the status")
+    assert generator.stats['retries'] == 1
+    assert generator.stats['requests'] == 1
+    assert generator.stats['completion_tokens'] > 0
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Pipeline metrics tests: registry counters and histograms, the Prometheus text
+and JSON file exporters, JSON-lines log output, per-stage timings from a drain
+run against the fake Groq server, and the watcher's ingest metrics.
+Run with: python -m pytest Test_Scripts/test_metrics.py
+"""
+
+import io
+import json
+import urllib.request
+
+from fake_groq import FakeGroqServer
+from jsonlog import JsonLinesWriter
+from metrics import REGISTRY, MetricsFile, MetricsServer, Registry
+from watcher import InboxHandler
+
+
+def add_tasks(vault, count):
+    for i in range(count):
+        (vault / "Vault" / "Needs_Action" / f"task_{i:02}.md").write_text(f"Please summarize item {i}.")
+
+
+def test_registry_counters_histograms_and_prometheus_text():
+    registry = Registry()
+    registry.inc('triage_errors_total', stage='llm', type='TimeoutError')
+    registry.inc('triage_errors_total', 2, stage='llm', type='TimeoutError')
+    registry.observe('triage_stage_seconds', 0.02, stage='read')
+    registry.observe('triage_stage_seconds', 3.0, stage='read')
+    registry.gauge('triage_queue_depth', lambda: 7)
+    registry.task_done(True)
+
+    assert registry.counter('triage_errors_total', stage='llm', type='TimeoutError') == 3
+    assert registry.files_per_minute() == 1
+
+    text = registry.render_prometheus()
+    assert '# TYPE triage_errors_total counter' in text
+    assert 'triage_errors_total{stage="llm",type="TimeoutError"} 3' in text
+    assert 'triage_stage_seconds_bucket{stage="read",le="0.025"} 1' in text
+    assert 'triage_stage_seconds_bucket{stage="read",le="+Inf"} 2' in text
+    assert 'triage_stage_seconds_count{stage="read"} 2' in text
+    assert 'triage_queue_depth 7' in text
+    assert 'triage_files_total{outcome="completed"} 1' in text
+
+    read = registry.snapshot()['histograms']['triage_stage_seconds']['stage=read']
+    assert read['count'] == 2 and read['max'] == 3.0 and read['p50'] == 0.02
+
+
+def test_metrics_server_and_file(tmp_path):
+    registry = Registry()
+    registry.inc('triage_llm_requests_total')
+
+    server = MetricsServer(0, registry=registry).start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics") as response:
+            assert 'triage_llm_requests_total 1' in response.read().decode('utf-8')
+    finally:
+        server.stop()
+
+    path = tmp_path / "metrics.json"
+    exporter = MetricsFile(path, interval=60, registry=registry).start()
+    exporter.stop()
+    assert json.loads(path.read_text())['counters']['triage_llm_requests_total'] == {'': 1}
+
+
+def test_json_lines_writer_levels_and_banners():
+    stream = io.StringIO()
+    writer = JsonLinesWriter(stream)
+    print("\x1b[34m" + "=" * 60 + "\x1b[0m", file=writer)
+    print("  \x1b[32m[OK] Moved report.md\x1b[0m", file=writer)
+    print("[X] ERROR: Failed to read file", file=writer)
+    print("[RETRY] 429 from Groq", file=writer)
+    print("", file=writer)
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [(r['level'], r['tag'], r['msg']) for r in records] == [
+        ('info', 'OK', 'Moved report.md'),
+        ('error', 'X', 'ERROR: Failed to read file'),
+        ('warning', 'RETRY', '429 from Groq'),
+    ]
+
+
+def test_drain_records_stage_llm_and_file_metrics(vault, new_agent):
+    add_tasks(vault, 4)
+    REGISTRY.reset()
+
+    with FakeGroqServer(latency=0.05) as server:
+        new_agent(vault, server, max_inflight=2).run_drain(workers=2)
+
+    stages = REGISTRY.snapshot()['histograms']['triage_stage_seconds']
+    for stage in ('read', 'classify', 'llm', 'write_back', 'finalize', 'dashboard_render'):
+        assert stages[f'stage={stage}']['count'] >= 1
+    assert stages['stage=llm']['count'] == 4
+    assert REGISTRY.counter('triage_files_total', outcome='completed') == 4
+    assert REGISTRY.counter('triage_llm_requests_total') == 4
+    assert REGISTRY.counter('triage_llm_completion_tokens_total') > 0
+    assert 'triage_queue_depth' in REGISTRY.snapshot()['gauges']
+
+
+def test_watcher_records_ingest_metrics(vault):
+    tasks = vault / "Vault"
+    (tasks / "Inbox" / "backlog.md").write_text("What is left on the backlog?")
+    REGISTRY.reset()
+
+    handler = InboxHandler(tasks / "Inbox", tasks / "Needs_Action", tasks / "Dashboard.md")
+    handler.process_existing_files()
+    handler.start()
+    (tasks / "Inbox" / "new.md").write_text("Please review the new proposal.")
+    (tasks / "Inbox" / "new copy.md").write_text("Please review the new proposal.")
+    handler._track(tasks / "Inbox" / "new.md", writer_done=True)
+    handler._track(tasks / "Inbox" / "new copy.md", writer_done=True)
+    handler.stop()
+    handler.dashboard.flush()
+
+    assert REGISTRY.counter('triage_ingested_total') == 2
+    assert REGISTRY.counter('triage_duplicates_total') == 1
+    assert REGISTRY.snapshot()['histograms']['triage_stage_seconds']['stage=ingest']['count'] == 2
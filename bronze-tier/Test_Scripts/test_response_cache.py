@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Response cache tests: key normalization, TTL and size eviction, and the agent
+answering a repeated request without a second Groq call.
+Run with: python -m pytest Test_Scripts/test_response_cache.py
+"""
+
+import time
+
+from fake_groq import FakeGroqServer
+from response_cache import ResponseCache, cache_key
+
+
+def test_key_ignores_formatting_but_not_parameters():
+    key = cache_key("What is  the budget?\r\n", "Question", "model", 0.7, "system")
+
+    assert key == cache_key("What is the budget?", "Question", "model", 0.7, "system")
+    assert key != cache_key("What is the budget?", "Question", "model", 0.2, "system")
+    assert key != cache_key("What is the budget?", "General", "model", 0.7, "system")
+    assert key != cache_key("What is the budget?", "Question", "other", 0.7, "system")
+    assert key != cache_key("What is the budget?", "Question", "model", 0.7, "other")
+
+
+def test_counts_hits_and_expires_entries(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.db", ttl=0.2)
+    cache.put("a", "answer")
+
+    assert cache.get("a") == "answer"
+    assert cache.get("b") is None
+    time.sleep(0.3)
+    assert cache.get("a") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used_beyond_size_limit(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.db", max_bytes=250)
+    for key in ("a", "b", "c"):
+        cache.put(key, key * 100)
+        time.sleep(0.01)
+    # "a" was evicted when "c" pushed the cache over 250 bytes
+    assert cache.get("a") is None
+    assert cache.get("b") == "b" * 100
+
+    cache.put("d", "d" * 100)
+    assert cache.get("b") == "b" * 100
+    assert cache.get("c") is None
+
+
+def test_agent_reuses_response_for_duplicate_request(vault, new_agent):
+    for name in ("first.md", "second.md"):
+        (vault / "Vault" / "Needs_Action" / name).write_text("What is the Q3 budget?\n")
+
+    with FakeGroqServer() as server:
+        agent = new_agent(vault, server, use_cache=True)
+        assert agent.process_single_file()
+        assert agent.process_single_file()
+
+    assert server.requests == 1
+    assert (agent.response_cache.hits, agent.response_cache.misses) == (1, 1)
+    first = (vault / "Vault" / "Done" / "first.md").read_text()
+    second = (vault / "Vault" / "Done" / "second.md").read_text()
+    assert first.split("## AI Response")[1].split("**Completed:**")[0] == \
+        second.split("## AI Response")[1].split("**Completed:**")[0]
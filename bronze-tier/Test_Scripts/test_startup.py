@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Startup tests: importing the agent does not load the Groq SDK or python-docx,
+and an idle --once/--drain run exits before building the agent.
+Run with: python -m pytest Test_Scripts/test_startup.py
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from agent import has_pending_files
+from bench_startup import import_times
+
+REPO = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ("groq", "docx", "lxml", "httpx", "pydantic")
+
+
+def run_agent(*args, cwd=REPO):
+    env = dict(os.environ, GROQ_API_KEY="test-key", PYTHONIOENCODING="utf-8")
+    return subprocess.run([sys.executable, str(REPO / "agent.py"), *args],
+                          cwd=cwd, env=env, capture_output=True, text=True, timeout=60)
+
+
+def make_bare_vault(tmp_path):
+    # Task folders only; no Dashboard.md or SKILL.md, so building the agent would raise
+    for folder in ("Inbox", "Needs_Action", "Done"):
+        (tmp_path / "Vault" / folder).mkdir(parents=True)
+    return tmp_path
+
+
+def test_import_does_not_load_heavy_dependencies():
+    modules = import_times("agent", cwd=REPO)
+
+    assert "agent" in modules
+    loaded = sorted(name for name in modules if name.split('.')[0] in HEAVY_MODULES)
+    assert loaded == []
+
+
+def test_idle_once_exits_before_building_agent(tmp_path):
+    vault = make_bare_vault(tmp_path)
+
+    result = run_agent("--once", "--base-path", str(vault))
+
+    assert result.returncode == 1
+    assert "No files found" in result.stdout
+    assert "Groq API initialized" not in result.stdout
+    assert not (vault / "Vault" / ".state").exists()
+
+
+def test_idle_runs_count_claimed_files_as_work(tmp_path):
+    vault = make_bare_vault(tmp_path)
+    needs_action = vault / "Vault" / "Needs_Action"
+
+    assert run_agent("--drain", "--base-path", str(vault)).returncode == 0
+    assert not has_pending_files(needs_action)
+
+    # Left in an agent's claim folder by a run that stopped mid-task
+    (needs_action / ".processing" / "4242-abcd").mkdir(parents=True)
+    (needs_action / ".processing" / "4242-abcd" / "left_over.md").write_text("What happened here?")
+
+    assert has_pending_files(needs_action)
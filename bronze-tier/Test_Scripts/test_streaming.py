@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Streaming response tests: chunks go to a temp copy of the task file while the
+original stays intact, the finished file matches the non-streamed layout and
+keeps the original bytes, and a crash after the swap does not stream twice.
+Run with: python -m pytest Test_Scripts/test_streaming.py
+"""
+
+import re
+import threading
+import time
+
+import pytest
+
+from fake_groq import FakeGroqServer
+from journal import UPDATED, TaskJournal
+
+REQUEST = "What is blocking the Q3 release?\n"
+REPLY = "Here is a long, carefully streamed answer. " * 40
+
+
+def add_request(vault):
+    (vault / "Vault" / "Needs_Action" / "release.md").write_text(REQUEST)
+    return vault
+
+
+def test_streamed_chunks_land_in_temp_copy_then_swap(vault, new_agent):
+    add_request(vault)
+    processing = vault / "Vault" / "Needs_Action" / ".processing"
+    temp_sizes = set()
+    originals = []
+
+    with FakeGroqServer(reply=lambda body: REPLY, chunk_size=64, chunk_delay=0.02) as server:
+        agent = new_agent(vault, server, stream=True)
+        worker = threading.Thread(target=agent.process_single_file)
+        worker.start()
+        while worker.is_alive():
+            for path in agent.claim_path.glob(".release.md.*.tmp"):
+                try:
+                    temp_sizes.add(path.stat().st_size)
+                    originals.append((agent.claim_path / "release.md").read_text())
+                except FileNotFoundError:
+                    pass
+            time.sleep(0.005)
+        worker.join()
+        agent.dashboard.flush()
+        agent.close()
+
+    # The temp copy grew chunk by chunk while the claimed file was untouched
+    assert len(temp_sizes) > 3
+    assert set(originals) == {REQUEST}
+
+    done = (vault / "Vault" / "Done" / "release.md").read_text()
+    assert re.fullmatch(
+        re.escape(REQUEST) + r"\n---\n\n## AI Response\n\n\*\*Processed:\*\* [\d\- :]+\n\n"
+        + re.escape(REPLY) + r"\n\n\*\*Task Type:\*\* Question\n\*\*Status:\*\* Completed\n",
+        done,
+    )
+    # Nothing left behind, not even the agent's claim folder
+    assert [path.name for path in processing.iterdir()] == [".recover.lock"]
+
+
+def test_streamed_file_matches_buffered_layout(make_vault, tmp_path, new_agent):
+    outputs = []
+    for stream in (False, True):
+        vault = add_request(make_vault(tmp_path / str(stream)))
+        with FakeGroqServer(reply=lambda body: REPLY) as server:
+            agent = new_agent(vault, server, stream=stream)
+            assert agent.process_single_file()
+            agent.dashboard.flush()
+        done = (vault / "Vault" / "Done" / "release.md").read_text()
+        outputs.append(re.sub(r"\*\*Processed:\*\* .*", "", done))
+
+    assert outputs[0] == outputs[1]
+
+
+def test_recover_claims_discards_partial_stream(vault, new_agent):
+    add_request(vault)
+    processing = vault / "Vault" / "Needs_Action" / ".processing"
+    processing.mkdir()
+    (vault / "Vault" / "Needs_Action" / "release.md").rename(processing / "release.md")
+    (processing / ".release.md.abc123.tmp").write_text(REQUEST + "half a resp")
+
+    with FakeGroqServer() as server:
+        agent = new_agent(vault, server, stream=True)
+        agent.recover_claims()
+        agent.dashboard.flush()
+        agent.close()
+
+    assert [path.name for path in processing.iterdir()] == [".recover.lock"]
+    assert (vault / "Vault" / "Needs_Action" / "release.md").read_text() == REQUEST
+
+
+def test_streamed_text_file_keeps_original_bytes(vault, new_agent):
+    original = b'line one\r\nWhat is two?\r\n'
+    (vault / "Vault" / "Needs_Action" / "two.txt").write_bytes(original)
+
+    with FakeGroqServer(reply=lambda body: REPLY) as server:
+        agent = new_agent(vault, server, stream=True)
+        assert agent.process_single_file()
+
+    done = (vault / "Vault" / "Done" / "two.txt").read_bytes()
+    assert done.startswith(original + b"\n---\n\n## AI Response")
+    assert REPLY.encode('utf-8') in done
+
+
+class Crash(BaseException):
+    """Stands in for the process dying: not caught by the agent's error handling."""
+
+
+def test_crash_after_streamed_swap_resumes_without_groq(vault, monkeypatch, new_agent):
+    add_request(vault)
+    record = TaskJournal.record
+
+    def crash_on_updated(self, name, stage, *args, **kwargs):
+        if stage == UPDATED:
+            raise Crash()
+        return record(self, name, stage, *args, **kwargs)
+
+    with FakeGroqServer(reply=lambda body: REPLY) as server:
+        agent = new_agent(vault, server, stream=True)
+        with monkeypatch.context() as patch:
+            patch.setattr(TaskJournal, "record", crash_on_updated)
+            with pytest.raises(Crash):
+                agent.process_single_file()
+        agent.close()
+
+        restarted = new_agent(vault, server, stream=True)
+        restarted.recover_claims()
+
+    done = (vault / "Vault" / "Done" / "release.md").read_text()
+    assert done.count("## AI Response") == 1 and REPLY in done
+    assert server.requests == 1
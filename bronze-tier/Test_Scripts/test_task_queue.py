@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Needs_Action task queue tests: seed order, dedupe, and event-driven pickup.
+Run with: python -m pytest Test_Scripts/test_task_queue.py
+"""
+
+import os
+import threading
+import time
+
+from task_queue import TaskQueue
+
+
+def test_seed_pops_oldest_first_and_skips_unsupported(tmp_path):
+    for i, name in enumerate(["c.md", "a.txt", "b.docx"]):
+        (tmp_path / name).write_text("x")
+        os.utime(tmp_path / name, ns=(i * 10**9, (3 - i) * 10**9))
+    (tmp_path / "notes.csv").write_text("ignored")
+    (tmp_path / ".processing").mkdir()
+
+    queue = TaskQueue(tmp_path)
+    queue.seed()
+    queue.seed()
+
+    assert len(queue) == 3
+    assert [queue.pop(timeout=0).name for _ in range(3)] == ["b.docx", "a.txt", "c.md"]
+    assert queue.pop(timeout=0) is None
+
+
+def test_push_ignores_duplicates_and_other_folders(tmp_path):
+    (tmp_path / "task.md").write_text("x")
+    (tmp_path / "Done").mkdir()
+    (tmp_path / "Done" / "old.md").write_text("x")
+
+    queue = TaskQueue(tmp_path)
+    queue.push(tmp_path / "task.md")
+    queue.push(tmp_path / "task.md")
+    queue.push(tmp_path / "Done" / "old.md")
+    queue.push(tmp_path / "gone.md")
+
+    assert len(queue) == 1
+
+
+def test_new_file_is_picked_up_without_polling(tmp_path):
+    queue = TaskQueue(tmp_path)
+    queue.start()
+    try:
+        queue.seed()
+        staging = tmp_path.parent / f"{tmp_path.name}_staging.md"
+        staging.write_text("What is the Q3 budget?")
+        start = time.monotonic()
+        os.rename(staging, tmp_path / "report.md")
+
+        picked = queue.pop(timeout=5)
+        latency = time.monotonic() - start
+    finally:
+        queue.stop()
+
+    assert picked == tmp_path / "report.md"
+    assert latency < 1.0
+
+
+def test_stop_wakes_waiting_consumer(tmp_path):
+    queue = TaskQueue(tmp_path)
+    queue.start()
+    start = time.monotonic()
+    threading.Timer(0.1, queue.stop).start()
+
+    assert queue.pop(timeout=10) is None
+    assert time.monotonic() - start < 5
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Append-only text update tests: memory and bytes written scale with the
+response, not the task file, and an interrupted append is rolled back.
+Run with: python -m pytest Test_Scripts/test_text_update.py
+"""
+
+import tracemalloc
+from pathlib import Path
+
+from agent import FileTriageAgent, TaskContext
+from journal import TaskJournal
+
+RESPONSE = "A short answer to the request.\n" * 20
+PROC_IO = Path("/proc/self/io")
+
+
+def make_agent(tmp_path):
+    agent = FileTriageAgent.__new__(FileTriageAgent)
+    agent.processing_path = tmp_path / ".processing"
+    agent.needs_action_path = tmp_path
+    agent.journal = TaskJournal(tmp_path / "journal.db")
+    agent.processing_path.mkdir()
+    agent.claim_path = agent.processing_path / "agent"
+    agent.claim_path.mkdir()
+    return agent
+
+
+def make_task(agent, megabytes):
+    path = agent.processing_path / f"notes_{megabytes}mb.md"
+    line = "Meeting notes: review the quarterly budget line items.\n"
+    with open(path, 'w', encoding='utf-8') as f:
+        for _ in range(megabytes * 1024 * 1024 // len(line)):
+            f.write(line)
+    return TaskContext(file_path=path, task_type="Analysis", response=RESPONSE)
+
+
+def bytes_written():
+    for line in PROC_IO.read_text().splitlines():
+        if line.startswith("wchar:"):
+            return int(line.split()[1])
+
+
+def measure_update(agent, ctx):
+    before = bytes_written() if PROC_IO.exists() else None
+    tracemalloc.start()
+    assert agent._update_text_file(ctx)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    written = bytes_written() - before if before is not None else None
+    return peak, written
+
+
+def test_update_appends_without_rewriting_original(tmp_path):
+    agent = make_agent(tmp_path)
+    ctx = make_task(agent, 1)
+    original = ctx.file_path.read_bytes()
+
+    agent._update_text_file(ctx)
+
+    updated = ctx.file_path.read_bytes()
+    assert updated.startswith(original)
+    appended = updated[len(original):].decode('utf-8')
+    assert appended.startswith("\n---\n\n## AI Response\n\n**Processed:** ")
+    assert appended.endswith(f"\n\n{RESPONSE}\n\n**Task Type:** Analysis\n**Status:** Completed\n")
+    assert list(agent.processing_path.glob(".*")) == []
+
+
+def test_cost_scales_with_response_not_file(tmp_path):
+    agent = make_agent(tmp_path)
+    small_peak, small_written = measure_update(agent, make_task(agent, 1))
+    large_peak, large_written = measure_update(agent, make_task(agent, 16))
+
+    # Well under the 16 MB file: only the response section is held and written
+    assert large_peak < 256 * 1024
+    assert large_peak < small_peak * 2 + 64 * 1024
+    if large_written is not None:
+        assert large_written < 64 * 1024
+        assert abs(large_written - small_written) < 1024
+
+
+def test_recover_claims_rolls_back_interrupted_append(tmp_path):
+    agent = make_agent(tmp_path)
+    ctx = make_task(agent, 1)
+    original = ctx.file_path.read_bytes()
+
+    # Simulate a crash after the marker was written and part of the response appended
+    agent._append_marker(ctx.file_path).write_text(str(len(original)))
+    with open(ctx.file_path, 'a', encoding='utf-8') as f:
+        f.write("\n---\n\n## AI Response\n\nhalf of the resp")
+
+    agent.recover_claims()
+
+    released = tmp_path / ctx.file_path.name
+    assert released.read_bytes() == original
+    assert [path.name for path in agent.processing_path.rglob("*") if path.is_file()] == [".recover.lock"]
+
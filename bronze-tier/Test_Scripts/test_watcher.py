@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Inbox watcher tests: write-completion detection and event coalescing.
+Run with: python -m pytest Test_Scripts/test_watcher.py
+"""
+
+import time
+
+from watchdog.observers import Observer
+
+from watcher import InboxHandler
+
+
+def make_handler(vault, **kwargs):
+    tasks = vault / "Vault"
+    return InboxHandler(tasks / "Inbox", tasks / "Needs_Action", tasks / "Dashboard.md", **kwargs)
+
+
+def start_watcher(vault, **kwargs):
+    handler = make_handler(vault, **kwargs)
+    observer = Observer()
+    observer.schedule(handler, str(vault / "Vault" / "Inbox"), recursive=False)
+    handler.start()
+    observer.start()
+    return handler, observer
+
+
+def stop_watcher(handler, observer):
+    observer.stop()
+    observer.join()
+    handler.stop()
+    handler.dashboard.flush()
+
+
+def wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_slow_writer_is_not_moved_half_written(vault):
+    handler, observer = start_watcher(vault, settle_time=0.5, poll_interval=0.05)
+    try:
+        chunk = b"x" * 4096
+        with open(vault / "Vault" / "Inbox" / "big.md", "wb") as f:
+            for _ in range(10):
+                f.write(chunk)
+                f.flush()
+                time.sleep(0.1)
+                assert not (vault / "Vault" / "Needs_Action" / "big.md").exists()
+
+        assert wait_for(lambda: (vault / "Vault" / "Needs_Action" / "big.md").exists())
+    finally:
+        stop_watcher(handler, observer)
+
+    assert (vault / "Vault" / "Needs_Action" / "big.md").stat().st_size == 10 * len(chunk)
+
+
+def test_atomic_rename_writer_is_picked_up(vault):
+    handler, observer = start_watcher(vault, settle_time=5.0, poll_interval=0.05)
+    try:
+        staging = vault / "Vault" / "Inbox" / "report.md.partial"
+        staging.write_text("What is the Q3 budget?")
+        staging.rename(vault / "Vault" / "Inbox" / "report.md")
+
+        # Well under settle_time: the rename marks the file complete
+        assert wait_for(lambda: (vault / "Vault" / "Needs_Action" / "report.md").exists(), timeout=2.0)
+    finally:
+        stop_watcher(handler, observer)
+
+
+def test_burst_drop_is_ingested_once_each(vault):
+    handler, observer = start_watcher(vault, settle_time=0.2, poll_interval=0.05)
+    try:
+        for i in range(300):
+            (vault / "Vault" / "Inbox" / f"task_{i}.txt").write_text(f"Draft note {i}")
+        assert wait_for(lambda: len(list((vault / "Vault" / "Needs_Action").iterdir())) == 300, timeout=30.0)
+    finally:
+        stop_watcher(handler, observer)
+
+    assert list((vault / "Vault" / "Inbox").iterdir()) == []
+    assert handler.dashboard.store.stats()['pending'] == 300
+
+
+def test_startup_backlog_is_ingested_in_one_commit(vault):
+    for i in range(500):
+        (vault / "Vault" / "Inbox" / f"backlog_{i}.md").write_text(f"Review item {i}")
+    (vault / "Vault" / "Inbox" / "notes.csv").write_text("ignored")
+
+    handler = make_handler(vault)
+    handler.dashboard.debounce = 60
+    handler.process_existing_files()
+
+    assert len(list((vault / "Vault" / "Needs_Action").iterdir())) == 500
+    assert [p.name for p in (vault / "Vault" / "Inbox").iterdir()] == ["notes.csv"]
+    assert handler.dashboard.renders == 1
+    assert handler.dashboard.store.counters()['pending'] == 500
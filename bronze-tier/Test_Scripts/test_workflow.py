@@ -1,112 +1,49 @@
 #!/usr/bin/env python3
 """
-Bronze Tier Test Suite
-Validates the complete workflow from Inbox to Done.
+Bronze Tier workflow test: watcher.py and agent.py run as separate processes
+on a scratch vault against the fake Groq server, and every file dropped in
+Inbox/ ends up in Done/ with an AI response and a Completed Dashboard row.
+Run with: python -m pytest Test_Scripts/test_workflow.py
 """
 
-import time
-import subprocess
-from pathlib import Path
+from docx import Document
 
+from bench_pipeline import generate_inbox, run_benchmark
+from dashboard import TaskStore
+from docx_text import extract_docx_text
 
-def test_workflow():
-    """Test the complete Bronze Tier workflow."""
-    print("=" * 60)
-    print("Bronze Tier Workflow Test")
-    print("=" * 60)
-    print()
 
-    base_path = Path(__file__).parent
-    inbox = base_path / "Vault" / "Inbox"
-    needs_action = base_path / "Vault" / "Needs_Action"
-    done = base_path / "Vault" / "Done"
+def test_generate_inbox_mix_and_sizes(tmp_path):
+    paths = generate_inbox(tmp_path, 30, mix={'md': 1, 'txt': 1, 'docx': 1}, min_kb=1, max_kb=2, seed=7)
 
-    # Check if sample task exists
-    sample_file = inbox / "sample-task.md"
-    if not sample_file.exists():
-        print("[X] Sample task not found in Inbox/")
-        print(f"   Expected: {sample_file}")
-        return False
+    assert {path.suffix for path in paths} == {'.md', '.txt', '.docx'}
+    for path in paths:
+        text = extract_docx_text(path) if path.suffix == '.docx' else path.read_text(encoding='utf-8')
+        assert 1024 <= len(text) <= 2048 + 120
+    # Same seed, same inbox
+    again = generate_inbox(tmp_path / "again", 30, mix={'md': 1, 'txt': 1, 'docx': 1}, min_kb=1, max_kb=2, seed=7)
+    assert [path.name for path in again] == [path.name for path in paths]
 
-    print("[OK] Sample task found in Inbox/")
-    print()
 
-    # Step 1: Test Watcher (manual simulation)
-    print("STEP 1: File Watcher Simulation")
-    print("-" * 60)
-    print("In a real scenario, watcher.py would:")
-    print("  1. Detect sample-task.md in Inbox/")
-    print("  2. Move it to Needs_Action/")
-    print("  3. Update Dashboard with 'Pending' status")
-    print()
-    print("To test manually:")
-    print("  Terminal 1: python watcher.py")
-    print("  Terminal 2: Watch the file move to Needs_Action/")
-    print()
+def test_inbox_to_done_with_watcher_and_agent(tmp_path):
+    report = run_benchmark(files=6, mix={'md': 1, 'txt': 1, 'docx': 1}, min_kb=0.2, max_kb=1, workers=2,
+                           latency=0.05, rate_429=0.2, timeout=60, base_path=tmp_path)
 
-    # Step 2: Test Agent (manual simulation)
-    print("STEP 2: Agent Processing Simulation")
-    print("-" * 60)
-    print("After the file is in Needs_Action/, agent.py would:")
-    print("  1. Read the file content")
-    print("  2. Analyze the request")
-    print("  3. Generate an AI response")
-    print("  4. Append response to the file")
-    print("  5. Move file to Done/")
-    print("  6. Update Dashboard to 'Completed'")
-    print()
-    print("To test manually:")
-    print("  Terminal 1: python watcher.py (if not already running)")
-    print("  Terminal 2: python agent.py")
-    print("  Terminal 3: Watch the complete workflow")
-    print()
+    assert report['done'] == 6 and report['missing'] == []
+    assert report['p50'] <= report['p95'] <= report['p99'] <= report['max']
+    assert report['llm_requests'] >= 6
+    assert report['dashboard_writes_per_task'] > 0
+    assert set(report['peak_rss_mb']) == {'watcher', 'agent'}
 
-    # Step 3: Verification
-    print("STEP 3: Verification Checklist")
-    print("-" * 60)
-    print("After running both systems, verify:")
-    print("  [ ] sample-task.md moved from Inbox/ to Needs_Action/")
-    print("  [ ] Dashboard shows 'sample-task' with 'Pending' status")
-    print("  [ ] Agent processed the file and added AI Response section")
-    print("  [ ] File moved from Needs_Action/ to Done/")
-    print("  [ ] Dashboard updated to 'Completed' status")
-    print()
+    done = sorted((tmp_path / "Vault" / "Done").glob("bench_*"))
+    assert len(done) == 6
+    for path in done:
+        if path.suffix == '.docx':
+            assert "AI Response" in [paragraph.text for paragraph in Document(path).paragraphs]
+        else:
+            assert "## AI Response" in path.read_text(encoding='utf-8')
+    assert not list((tmp_path / "Vault" / "Inbox").iterdir())
 
-    # Quick Start Commands
-    print("QUICK START COMMANDS")
-    print("=" * 60)
-    print()
-    print("1. Install dependencies:")
-    print("   pip install -r requirements.txt")
-    print()
-    print("2. Start the watcher (Terminal 1):")
-    print("   python watcher.py")
-    print()
-    print("3. Start the agent (Terminal 2):")
-    print("   python agent.py")
-    print()
-    print("4. The sample-task.md file will be automatically processed!")
-    print()
-    print("5. Check results:")
-    print("   - View Dashboard: cat Vault/Dashboard.md")
-    print("   - View completed file: cat Vault/Done/sample-task.md")
-    print()
-
-    return True
-
-
-def main():
-    """Run the test suite."""
-    try:
-        test_workflow()
-    except KeyboardInterrupt:
-        print("\n\nTest interrupted by user.")
-    except Exception as e:
-        print(f"\n[ERROR] Test failed: {e}")
-        return 1
-
-    return 0
-
-
-if __name__ == "__main__":
-    exit(main())
+    rows = [row for row in TaskStore(tmp_path / "Vault" / ".state" / "dashboard.db").rows()
+            if row[1].startswith("bench_")]
+    assert len(rows) == 6 and {row[2] for row in rows} == {"Completed"}
@@ -7,33 +7,102 @@ AI Provider: Groq API
 """
 
 import os
+import shutil
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-# Third-party imports
-from groq import Groq
-from docx import Document
-from dotenv import load_dotenv
+# Third-party imports (python-docx, python-dotenv and the Groq SDK are
+# imported where they are first needed, to keep startup fast)
 from colorama import Fore, Back, Style, init
 
+from dashboard import Dashboard
+from docx_text import extract_docx_text
+from batching import build_batch_prompt, pack_batches, parse_batch_response
+from classifier import Classifier
+from content_index import ContentIndex
+from chunking import build_map_prompt, build_reduce_prompt, split_document
+from llm import GroqGenerator, estimate_tokens
+from jsonlog import enable_json_logs, log_event
+from journal import RESPONDED, UPDATED, TaskJournal
+from metrics import REGISTRY, RunSummary, add_observability_arguments, start_exporters
+from response_cache import ResponseCache, cache_key
+from task_queue import SUPPORTED_EXTENSIONS, TaskQueue
+from vault_io import (atomic_write, atomic_writer, claim_folders, file_lock, link_or_copy, move_no_replace,
+                      try_lock, unique_name)
+
 # Initialize colorama for Windows compatibility
 init(autoreset=True)
 
+SYSTEM_PROMPT = """You are a professional AI assistant working in an automated file triage system.
+Your role is to read user requests from files and provide helpful, accurate, and well-structured responses.
+
+Guidelines:
+- Be professional and clear
+- Provide actionable information
+- Use proper formatting (markdown)
+- Be thorough but concise
+- If you cannot fulfill a request, explain why"""
+
+
+@dataclass
+class TaskContext:
+    """Per-task state carried through MONITOR -> PROCESS -> UPDATE -> FINALIZE.
+
+    The content is read once when the context is loaded; later stages reuse
+    `content` instead of re-reading. Only the .docx write-back opens the file
+    again, to parse it with python-docx.
+    """
+    file_path: Path
+    task_id: Optional[int] = None
+    content: Optional[str] = None
+    task_type: Optional[str] = None
+    response: Optional[str] = None
+    metadata: dict = field(default_factory=dict)
+
+
+# Held by a running agent in its claim folder; free once the agent is gone
+OWNER_LOCK = ".owner.lock"
+
+
+def has_pending_files(needs_action_path):
+    """Whether Needs_Action holds a supported file, claimed or not.
+
+    A few scandirs and no heavy imports, so an idle run can exit before the
+    agent (Groq client, dashboard store, response cache) is built.
+    """
+    folders = [Path(needs_action_path), *claim_folders(Path(needs_action_path) / ".processing")]
+    for folder in folders:
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_file() and os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS:
+                        return True
+        except FileNotFoundError:
+            continue
+    return False
+
 
 class FileTriageAgent:
     """AI Agent that processes files according to the SKILL.md manual."""
 
-    def __init__(self, base_path=None):
+    def __init__(self, base_path=None, max_inflight=None, use_cache=True, batch=False, stream=False):
         """Initialize the agent with vault paths and Groq API."""
         self.base_path = Path(base_path) if base_path else Path(__file__).parent
         self.needs_action_path = self.base_path / "Vault" / "Needs_Action"
+        self.processing_path = self.needs_action_path / ".processing"
+        self.duplicates_path = self.needs_action_path / ".duplicates"
         self.done_path = self.base_path / "Vault" / "Done"
         self.dashboard_path = self.base_path / "Vault" / "Dashboard.md"
         self.skill_path = self.base_path / "skills" / "file-triage" / "SKILL.md"
 
         # Load environment variables
+        from dotenv import load_dotenv
         load_dotenv()
 
         # Initialize Groq client
@@ -42,17 +111,80 @@ class FileTriageAgent:
         self.max_tokens = int(os.getenv("MAX_TOKENS", "2048"))
         self.temperature = float(os.getenv("TEMPERATURE", "0.7"))
 
+        # Bound concurrent Groq calls across worker threads
+        self.max_inflight = max_inflight or int(os.getenv("MAX_INFLIGHT_REQUESTS", "4"))
+
+        # Documents above the threshold are answered by map-reduce over chunks
+        self.chunk_threshold_tokens = int(os.getenv("CHUNK_THRESHOLD_TOKENS", "6000"))
+        self.chunk_tokens = int(os.getenv("CHUNK_TOKENS", "3000"))
+        self.chunk_overlap_tokens = int(os.getenv("CHUNK_OVERLAP_TOKENS", "200"))
+        self.chunk_notes_tokens = int(os.getenv("CHUNK_NOTES_MAX_TOKENS", "768"))
+
+        # Optional streaming of responses straight into .md/.txt files
+        self.stream = stream
+
+        # Optional batching of small files into one completion request
+        self.batch = batch
+        self.batch_max_tasks = int(os.getenv("BATCH_MAX_TASKS", "8"))
+        self.batch_token_budget = int(os.getenv("BATCH_TOKEN_BUDGET", "3000"))
+        self.batch_max_file_tokens = int(os.getenv("BATCH_MAX_FILE_TOKENS", "500"))
+        self.batch_max_output_tokens = int(os.getenv("BATCH_MAX_OUTPUT_TOKENS", "8192"))
+
         if not self.groq_api_key:
             print(f"{Fore.YELLOW}[!] WARNING: GROQ_API_KEY not found in .env file{Style.RESET_ALL}")
             print(f"{Fore.YELLOW}            Agent will run in simulation mode{Style.RESET_ALL}")
             self.groq_client = None
         else:
-            self.groq_client = Groq(api_key=self.groq_api_key)
+            self.groq_client = GroqGenerator(
+                api_key=self.groq_api_key,
+                model=self.groq_model,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                base_url=os.getenv("GROQ_BASE_URL") or None,
+                requests_per_minute=int(os.getenv("GROQ_RPM", "30")),
+                tokens_per_minute=int(os.getenv("GROQ_TPM", "12000")),
+                max_retries=int(os.getenv("GROQ_MAX_RETRIES", "5")),
+                max_concurrency=self.max_inflight,
+            )
             print(f"{Fore.GREEN}[OK] Groq API initialized: {Fore.CYAN}{self.groq_model}{Style.RESET_ALL}")
 
         # Verify paths exist
         self._verify_paths()
 
+        # Keyword weights come from CLASSIFIER_CONFIG (JSON) or the SKILL.md table
+        classifier_config = os.getenv("CLASSIFIER_CONFIG")
+        self.classifier = (Classifier.from_json(classifier_config) if classifier_config
+                           else Classifier.from_skill(self.skill_path))
+
+        # Task state store; Dashboard.md is re-rendered from it
+        self.dashboard = Dashboard(self.dashboard_path)
+
+        # Oldest-first queue of Needs_Action files, fed by filesystem events
+        self.task_queue = TaskQueue(self.needs_action_path)
+        REGISTRY.gauge('triage_queue_depth', lambda: len(self.task_queue))
+
+        # Groq responses reused for repeated requests (disabled with --no-cache)
+        self.response_cache = None
+        if use_cache and self.groq_client:
+            self.response_cache = ResponseCache(
+                self.base_path / "Vault" / ".state" / "responses.db",
+                ttl=float(os.getenv("RESPONSE_CACHE_TTL_HOURS", "168")) * 3600,
+                max_bytes=int(float(os.getenv("RESPONSE_CACHE_MAX_MB", "50")) * 1024 * 1024),
+            )
+
+        # Write-ahead record of task stages, so a restart never redoes a response
+        self.journal = TaskJournal(self.base_path / "Vault" / ".state" / "journal.db")
+
+        # Content digests from ingest; duplicates waiting on a task are linked when it completes
+        self.content_index = ContentIndex(self.base_path / "Vault" / ".state" / "content.db")
+
+        # Claims go to a folder of this agent's own, locked for as long as it runs,
+        # so recovery in another process can tell them from abandoned ones
+        self.processing_path.mkdir(exist_ok=True)
+        with file_lock(self.processing_path / ".recover.lock"):
+            self.claim_path = Path(tempfile.mkdtemp(prefix=f"{os.getpid()}-", dir=self.processing_path))
+            self._owner_lock = try_lock(self.claim_path / OWNER_LOCK)
+
     def _verify_paths(self):
         """Verify all required paths exist."""
         required_paths = [
@@ -70,86 +202,289 @@ class FileTriageAgent:
         """STEP 1: MONITOR - Identify files requiring processing."""
         print(f"\n{Fore.BLUE}[STEP 1: MONITOR]{Style.RESET_ALL}")
 
-        # Get all supported files in Needs_Action
-        supported_extensions = ['*.md', '*.txt', '*.docx']
-        all_files = []
-
-        for ext in supported_extensions:
-            all_files.extend(self.needs_action_path.glob(ext))
-
-        # Sort by modification time (FIFO)
-        all_files = sorted(all_files, key=lambda p: p.stat().st_mtime)
+        if not self.task_queue.seeded:
+            self.task_queue.seed()
+        selected_file = self.task_queue.pop(timeout=0)
 
-        if not all_files:
+        if not selected_file:
             print(f"  {Fore.YELLOW}[EMPTY] No files found in Needs_Action/{Style.RESET_ALL}")
             return None
 
-        selected_file = all_files[0]
         print(f"  {Fore.GREEN}[OK] Selected: {Fore.CYAN}{selected_file.name}{Fore.GREEN} ({selected_file.suffix}){Style.RESET_ALL}")
         return selected_file
 
+    def claim(self, file_path):
+        """Atomically claim a file by moving it into this agent's claim folder.
+
+        The move succeeds for exactly one caller, so concurrent workers (or
+        agent processes) never pick up the same file, and it never replaces an
+        existing file. Returns the claimed path, or None if another worker got
+        there first.
+        """
+        claimed_path = self.claim_path / file_path.name
+        try:
+            move_no_replace(file_path, claimed_path)
+        except (FileNotFoundError, FileExistsError):
+            return None
+        return claimed_path
+
+    def release(self, file_path):
+        """Return a claimed file to Needs_Action so it can be retried.
+
+        If a file with the same name arrived there in the meantime, the
+        released one is renamed (`report-2.md`) rather than replacing it.
+        """
+        if self.processing_path not in file_path.parents or not file_path.exists():
+            return file_path
+        name = file_path.name
+        while True:
+            destination = self.needs_action_path / name
+            try:
+                move_no_replace(file_path, destination)
+                break
+            except FileExistsError:
+                name = unique_name(file_path.name, [self.needs_action_path, self.duplicates_path,
+                                                    *claim_folders(self.processing_path)])
+            except OSError as e:
+                print(f"  {Fore.RED}[X] ERROR: Failed to release {file_path.name}: {e}{Style.RESET_ALL}")
+                return file_path
+        if name != file_path.name:
+            self._rename_task(file_path.name, name)
+        return destination
+
+    def _rename_task(self, old_name, new_name):
+        """Point the Dashboard row, journal entry and content index at a task's new name."""
+        task_id = self.dashboard.find_task(old_name)
+        if task_id is not None:
+            self.dashboard.update_status(task_id, "Pending", new_name)
+        self.journal.rename(old_name, new_name)
+        self.content_index.rename(old_name, new_name)
+        print(f"  {Fore.YELLOW}[!] {old_name} is taken in Needs_Action/; released as {new_name}{Style.RESET_ALL}")
+
+    def close(self):
+        """Give up this agent's claim folder, as if the process had exited.
+
+        Whatever is still claimed in it is recovered by the next agent to start.
+        """
+        if self._owner_lock is None:
+            return
+        with file_lock(self.processing_path / ".recover.lock"):
+            self._owner_lock.close()
+            self._owner_lock = None
+            self._remove_claim_folder(self.claim_path)
+
+    def _remove_claim_folder(self, folder):
+        """Delete a claim folder's lock and the folder itself, if no claims are left in it."""
+        if any(not path.name.startswith('.') for path in folder.iterdir()):
+            return
+        for path in folder.iterdir():
+            path.unlink(missing_ok=True)
+        folder.rmdir()
+
+    def _abandoned_claim_folders(self):
+        """Claim folders whose agent is no longer running, and the names claimed by running ones.
+
+        Must be called with the recovery lock held. Files directly in
+        .processing/ predate per-agent folders and are always abandoned.
+        """
+        abandoned, live_names = [self.processing_path], set()
+        for folder in claim_folders(self.processing_path)[1:]:
+            if folder == self.claim_path:
+                continue
+            lock = try_lock(folder / OWNER_LOCK)
+            if lock is None:
+                live_names.update(path.name for path in folder.iterdir())
+                continue
+            lock.close()
+            abandoned.append(folder)
+        return abandoned, live_names
+
+    def recover_claims(self):
+        """Finish or release claims left behind by agents that stopped mid-task.
+
+        Claims held by a running agent (in this process or another) are left
+        alone. Abandoned ones are adopted into this agent's claim folder, then
+        only their unfinished journal entries are replayed: a task whose
+        response was generated is written back and moved to Done/ without
+        calling Groq again. Every other adopted file goes back to Needs_Action.
+        Returns the number of tasks finished this way.
+        """
+        with file_lock(self.processing_path / ".recover.lock"):
+            abandoned, live_names = self._abandoned_claim_folders()
+            adopted = []
+            for folder in abandoned:
+                # Roll back appends that were interrupted before they completed
+                for marker in folder.glob('.*.append'):
+                    claimed_path = folder / marker.name[1:-len('.append')]
+                    if claimed_path.exists():
+                        with open(claimed_path, 'r+b') as f:
+                            f.truncate(int(marker.read_text()))
+                            os.fsync(f.fileno())
+                    marker.unlink()
+
+                for file_path in folder.iterdir():
+                    if file_path.name.startswith('.') and file_path.suffix == '.tmp':
+                        # Partial streamed response; the claimed original is intact
+                        file_path.unlink()
+                    elif file_path.is_file() and not file_path.name.startswith('.'):
+                        claimed_path = self.claim(file_path)
+                        if claimed_path:
+                            adopted.append(claimed_path)
+                if folder != self.processing_path:
+                    self._remove_claim_folder(folder)
+
+        adopted_names = {path.name for path in adopted}
+        finished = 0
+        for entry in self.journal.pending():
+            done_name = entry.done_name or entry.name
+            if entry.name in adopted_names:
+                ctx = self._resume(self.claim_path / entry.name)
+                if ctx is not None and self._write_back(ctx):
+                    finished += 1
+            elif entry.name in live_names or (self.claim_path / entry.name).exists():
+                continue
+            elif (self.done_path / done_name).exists():
+                # Moved to Done/ before the stop; only the Dashboard is behind
+                self._update_dashboard(entry.task_id, "Completed", done_name)
+                self._complete_duplicates(entry.name, done_name)
+                self.journal.finish(entry.name)
+            elif not (self.needs_action_path / entry.name).exists():
+                self.journal.finish(entry.name)
+
+        for claimed_path in adopted:
+            self.release(claimed_path)
+        return finished
+
+    def claim_next(self, skip=(), timeout=None):
+        """Claim the oldest queued file, skipping names in `skip`.
+
+        Waits up to `timeout` seconds for a file to arrive; returns None if
+        nothing could be claimed in that time.
+        """
+        while True:
+            file_path = self.task_queue.pop(timeout=timeout)
+            if file_path is None:
+                return None
+            if file_path.name in skip:
+                continue
+            claimed_path = self.claim(file_path)
+            if claimed_path:
+                return claimed_path
+
+    def claim_batch(self, skip=(), timeout=None, limit=None):
+        """Claim the next file and, in batch mode, small files queued behind it.
+
+        Extra files are only taken while they are small .md/.txt files that fit
+        the batch token budget; the first file that does not fit is requeued.
+        At most `limit` files are claimed.
+        """
+        first = self.claim_next(skip=skip, timeout=timeout)
+        if first is None:
+            return []
+        claimed = [first]
+        used = self._batch_tokens(first) if self.batch else None
+        if used is None:
+            return claimed
+
+        while len(claimed) < min(self.batch_max_tasks, limit or self.batch_max_tasks):
+            file_path = self.task_queue.pop(timeout=0)
+            if file_path is None:
+                break
+            if file_path.name in skip:
+                continue
+            tokens = self._batch_tokens(file_path)
+            if tokens is None or used + tokens > self.batch_token_budget:
+                self.task_queue.push(file_path)
+                break
+            claimed_path = self.claim(file_path)
+            if claimed_path:
+                claimed.append(claimed_path)
+                used += tokens
+        return claimed
+
+    def _batch_tokens(self, file_path):
+        """Estimated prompt tokens of a small .md/.txt file, or None if it should run alone."""
+        if file_path.suffix.lower() not in ('.md', '.txt'):
+            return None
+        try:
+            tokens = file_path.stat().st_size // 4
+        except FileNotFoundError:
+            return None
+        return tokens if tokens <= self.batch_max_file_tokens else None
+
     def read_file_content(self, file_path: Path) -> Optional[str]:
         """Read content from different file types."""
+        return self.load_task(file_path).content
+
+    def load_task(self, file_path: Path, task_id=None) -> TaskContext:
+        """Read and parse a file once into a TaskContext (content None on failure)."""
+        ctx = TaskContext(file_path=file_path, task_id=task_id)
         try:
-            if file_path.suffix.lower() == '.docx':
-                # Read .docx file
-                doc = Document(file_path)
-                content = '\n'.join([paragraph.text for paragraph in doc.paragraphs])
-                return content
-            elif file_path.suffix.lower() in ['.md', '.txt']:
-                # Read text-based files
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return f.read()
-            else:
-                print(f"  {Fore.RED}[X] ERROR: Unsupported file type: {file_path.suffix}{Style.RESET_ALL}")
-                return None
+            with self._stage(ctx, 'read'):
+                if file_path.suffix.lower() == '.docx':
+                    # Stream paragraph and table text; no python-docx object model
+                    ctx.content = extract_docx_text(file_path)
+                elif file_path.suffix.lower() in ['.md', '.txt']:
+                    # Read text-based files
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        ctx.content = f.read()
+                else:
+                    print(f"  {Fore.RED}[X] ERROR: Unsupported file type: {file_path.suffix}{Style.RESET_ALL}")
+                    return ctx
         except Exception as e:
+            REGISTRY.inc('triage_errors_total', stage='read', type=type(e).__name__)
             print(f"  {Fore.RED}[X] ERROR: Failed to read file: {e}{Style.RESET_ALL}")
-            return None
+            return ctx
+
+        ctx.metadata['size'] = file_path.stat().st_size
+        ctx.metadata['chars'] = len(ctx.content)
+        return ctx
 
-    def process(self, file_path):
+    def process(self, ctx):
         """STEP 2: PROCESS - Read, analyze, and perform the task."""
         print(f"\n{Fore.BLUE}[STEP 2: PROCESS]{Style.RESET_ALL}")
 
-        # Read the file content
-        content = self.read_file_content(file_path)
+        # Content was read when the task context was loaded
+        content = ctx.content
         if not content:
             return None
 
-        print(f"  {Fore.GREEN}[OK] Read {Fore.CYAN}{len(content)}{Fore.GREEN} characters from {Fore.CYAN}{file_path.name}{Style.RESET_ALL}")
+        print(f"  {Fore.GREEN}[OK] Read {Fore.CYAN}{len(content)}{Fore.GREEN} characters from {Fore.CYAN}{ctx.file_path.name}{Style.RESET_ALL}")
 
         # Analyze the intent
         print(f"  {Fore.YELLOW}[ANALYZE] Analyzing request...{Style.RESET_ALL}")
-        task_type = self._classify_task(content)
-        print(f"  {Fore.GREEN}[OK] Task type: {Fore.MAGENTA}{task_type}{Style.RESET_ALL}")
+        with self._stage(ctx, 'classify'):
+            ctx.task_type = self._classify_task(content)
+        print(f"  {Fore.GREEN}[OK] Task type: {Fore.MAGENTA}{ctx.task_type}{Style.RESET_ALL}")
 
         # Perform the task
         print(f"  {Fore.YELLOW}[AI] Generating response...{Style.RESET_ALL}")
-        response = self._generate_response(content, task_type)
+        with self._stage(ctx, 'llm'):
+            if (self.stream and self.groq_client and ctx.file_path.suffix.lower() in ('.md', '.txt')
+                    and estimate_tokens(content) <= self.chunk_threshold_tokens):
+                key, ctx.response = self._cached_response(content, ctx.task_type)
+                if ctx.response is None and self._stream_response(ctx, key):
+                    print(f"  {Fore.GREEN}[OK] Response streamed into {Fore.CYAN}{ctx.file_path.name}{Style.RESET_ALL}")
+                    return True
+                if ctx.response is None:
+                    ctx.response = self._request_response(content, ctx.task_type, key)
+            else:
+                ctx.response = self._generate_response(content, ctx.task_type)
 
-        if response:
+        if ctx.response:
             print(f"  {Fore.GREEN}[OK] Response generated successfully{Style.RESET_ALL}")
-            return response
+            return ctx.response
         else:
             print(f"  {Fore.RED}[X] ERROR: Failed to generate response{Style.RESET_ALL}")
             return None
 
+    def _stage(self, ctx, stage):
+        """Time a pipeline stage into the metrics registry and `ctx.metadata['timings']`."""
+        return REGISTRY.stage(stage, ctx.metadata.setdefault('timings', {}))
+
     def _classify_task(self, content):
         """Classify the type of task based on content."""
-        content_lower = content.lower()
-
-        if any(word in content_lower for word in ['?', 'what', 'how', 'why', 'when', 'where']):
-            return "Question"
-        elif any(word in content_lower for word in ['analyze', 'review', 'examine']):
-            return "Analysis"
-        elif any(word in content_lower for word in ['write', 'create', 'generate', 'draft']):
-            return "Writing"
-        elif any(word in content_lower for word in ['code', 'function', 'script', 'program']):
-            return "Code"
-        elif any(word in content_lower for word in ['calculate', 'compute', 'solve']):
-            return "Calculation"
-        else:
-            return "General"
+        return self.classifier.classify(content)
 
     def _generate_response(self, content, task_type):
         """Generate an AI response using Groq API."""
@@ -157,43 +492,189 @@ class FileTriageAgent:
         if not self.groq_client:
             return self._generate_simulated_response(content, task_type)
 
+        key, cached = self._cached_response(content, task_type)
+        if cached is not None:
+            print(f"  {Fore.GREEN}[CACHE] Reusing response for identical request{Style.RESET_ALL}")
+            return cached
+        return self._request_response(content, task_type, key)
+
+    def _cached_response(self, content, task_type):
+        """Return (cache key, cached response or None); the key is None when caching is off."""
+        if self.response_cache is None:
+            return None, None
+        key = cache_key(content, task_type, self.groq_model, self.temperature, SYSTEM_PROMPT)
+        return key, self.response_cache.get(key)
+
+    def _request_response(self, content, task_type, key=None):
+        """Call Groq for a single task and cache the answer under `key`."""
         try:
-            # Create the prompt for Groq
-            system_prompt = """You are a professional AI assistant working in an automated file triage system.
-Your role is to read user requests from files and provide helpful, accurate, and well-structured responses.
+            if estimate_tokens(content) > self.chunk_threshold_tokens:
+                response = self._map_reduce_response(content, task_type)
+            else:
+                # Call Groq API (paced and retried on the shared async loop)
+                response = self.groq_client.generate([
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": self._user_prompt(content, task_type)}
+                ])
+        except Exception as e:
+            REGISTRY.inc('triage_errors_total', stage='llm', type=type(e).__name__)
+            print(f"  {Fore.RED}[X] ERROR: Groq API call failed after retries: {e}{Style.RESET_ALL}")
+            print(f"  {Fore.YELLOW}[!] Falling back to simulation mode{Style.RESET_ALL}")
+            return self._generate_simulated_response(content, task_type)
 
-Guidelines:
-- Be professional and clear
-- Provide actionable information
-- Use proper formatting (markdown)
-- Be thorough but concise
-- If you cannot fulfill a request, explain why"""
+        if key is not None and response:
+            self.response_cache.put(key, response)
+        return response
+
+    def _map_reduce_response(self, content, task_type):
+        """Answer a large document by condensing its chunks in parallel, then merging."""
+        chunks = split_document(content, self.chunk_tokens, self.chunk_overlap_tokens)
+        print(f"  {Fore.YELLOW}[CHUNK] ~{estimate_tokens(content)} tokens split into "
+              f"{Fore.CYAN}{len(chunks)}{Fore.YELLOW} chunks{Style.RESET_ALL}")
+        notes = self._map_chunks(chunks, task_type)
+
+        # Condense again while the notes are still too long for one request
+        while len(notes) > 1 and estimate_tokens('\n\n'.join(notes)) > self.chunk_threshold_tokens:
+            chunks = split_document('\n\n'.join(notes), self.chunk_tokens)
+            if len(chunks) >= len(notes):
+                break
+            notes = self._map_chunks(chunks, task_type)
+
+        print(f"  {Fore.YELLOW}[CHUNK] Merging notes from {Fore.CYAN}{len(notes)}{Fore.YELLOW} parts{Style.RESET_ALL}")
+        return self.groq_client.generate([
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": build_reduce_prompt(task_type, notes)}
+        ])
+
+    def _map_chunks(self, chunks, task_type):
+        """Condense chunks into notes concurrently; a failed chunk leaves a gap note."""
+        results = self.groq_client.generate_many([
+            [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": build_map_prompt(task_type, chunk, number, len(chunks))}
+            ]
+            for number, chunk in enumerate(chunks, 1)
+        ], max_tokens=self.chunk_notes_tokens)
+
+        failures = [result for result in results if isinstance(result, Exception)]
+        if len(failures) == len(results):
+            raise failures[0]
+        if failures:
+            print(f"  {Fore.YELLOW}[!] {len(failures)}/{len(results)} chunks failed; merging the rest{Style.RESET_ALL}")
+        return [
+            f"(This part could not be read: {result})" if isinstance(result, Exception) else result
+            for result in results
+        ]
 
-            user_prompt = f"""Task Type: {task_type}
+    def _user_prompt(self, content, task_type):
+        return f"""Task Type: {task_type}
 
 User Request:
 {content}
 
 Please provide a comprehensive response to this request."""
 
-            # Call Groq API
-            chat_completion = self.groq_client.chat.completions.create(
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                model=self.groq_model,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-            )
+    def _stream_response(self, ctx, key=None):
+        """Stream the Groq response into a temp copy of a text file, then swap it in.
 
-            response = chat_completion.choices[0].message.content
-            return response
+        The original bytes are copied unchanged (line endings included) and
+        chunks are written as they arrive. The full response is journaled
+        before the swap, so a restart never asks Groq again or appends a
+        second response. Returns False if streaming failed; the original file
+        is then untouched.
+        """
+        header, footer = self._response_section_parts(ctx.task_type)
+        parts = []
+        start = time.monotonic()
 
+        try:
+            with atomic_writer(ctx.file_path, binary=True) as f:
+                with open(ctx.file_path, 'rb') as original:
+                    shutil.copyfileobj(original, f)
+                f.write(header.encode('utf-8'))
+                streamed = 0
+                for chunk in self.groq_client.stream([
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": self._user_prompt(ctx.content, ctx.task_type)}
+                ]):
+                    if not streamed:
+                        print(f"  {Fore.GREEN}[STREAM] First chunk after {time.monotonic() - start:.2f}s{Style.RESET_ALL}")
+                    f.write(chunk.encode('utf-8'))
+                    f.flush()
+                    streamed += len(chunk)
+                    parts.append(chunk)
+                if not streamed:
+                    raise ValueError("empty response")
+                f.write(footer.encode('utf-8'))
+                ctx.response = ''.join(parts)
+                self.journal.record(ctx.file_path.name, RESPONDED, ctx.task_id, ctx.task_type, ctx.response,
+                                    ctx.file_path.stat().st_size)
         except Exception as e:
-            print(f"  {Fore.RED}[X] ERROR: Groq API call failed: {e}{Style.RESET_ALL}")
-            print(f"  {Fore.YELLOW}[!] Falling back to simulation mode{Style.RESET_ALL}")
-            return self._generate_simulated_response(content, task_type)
+            REGISTRY.inc('triage_errors_total', stage='llm', type=type(e).__name__)
+            print(f"  {Fore.RED}[X] ERROR: Streaming response failed: {e}{Style.RESET_ALL}")
+            print(f"  {Fore.YELLOW}[!] Retrying without streaming{Style.RESET_ALL}")
+            return False
+
+        ctx.metadata['streamed'] = streamed
+        ctx.metadata['written'] = True
+        if key is not None:
+            self.response_cache.put(key, ctx.response)
+        return True
+
+    def _generate_batch(self, contexts):
+        """Fill in `response` for several tasks, packing uncached ones into shared requests.
+
+        Tasks the batched reply does not answer cleanly fall back to one
+        request each.
+        """
+        if not self.groq_client:
+            for ctx in contexts:
+                ctx.response = self._generate_simulated_response(ctx.content, ctx.task_type)
+            return
+
+        keys = {}
+        for index, ctx in enumerate(contexts):
+            keys[index], ctx.response = self._cached_response(ctx.content, ctx.task_type)
+            if ctx.response is not None:
+                print(f"  {Fore.GREEN}[CACHE] Reusing response for {ctx.file_path.name}{Style.RESET_ALL}")
+
+        pending = [(index, ctx.content) for index, ctx in enumerate(contexts) if ctx.response is None]
+        for batch in pack_batches(pending, self.batch_token_budget, self.batch_max_tasks):
+            answers = {}
+            if len(batch) > 1:
+                print(f"  {Fore.YELLOW}[AI] Generating {Fore.CYAN}{len(batch)}{Fore.YELLOW} responses in one request...{Style.RESET_ALL}")
+                prompt = build_batch_prompt([(contexts[i].task_type, contexts[i].content) for i in batch])
+                try:
+                    reply = self.groq_client.generate([
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ], max_tokens=min(self.max_tokens * len(batch), self.batch_max_output_tokens))
+                    answers = parse_batch_response(reply, len(batch))
+                except Exception as e:
+                    REGISTRY.inc('triage_errors_total', stage='llm', type=type(e).__name__)
+                    print(f"  {Fore.RED}[X] ERROR: Batched Groq call failed: {e}{Style.RESET_ALL}")
+                if len(answers) < len(batch):
+                    print(f"  {Fore.YELLOW}[!] Batched reply answered {len(answers)}/{len(batch)} tasks; "
+                          f"falling back to per-file requests{Style.RESET_ALL}")
+
+            for number, index in enumerate(batch, 1):
+                ctx = contexts[index]
+                if number in answers:
+                    ctx.response = answers[number]
+                    if keys[index] is not None:
+                        self.response_cache.put(keys[index], ctx.response)
+                else:
+                    ctx.response = self._request_response(ctx.content, ctx.task_type, keys[index])
+
+    def print_cache_stats(self):
+        """Print response cache hit/miss counters."""
+        if self.response_cache is None:
+            return
+        hits, misses = self.response_cache.hits, self.response_cache.misses
+        total = hits + misses
+        rate = hits / total * 100 if total else 0
+        print(f"{Fore.CYAN}[CACHE] {Fore.WHITE}{hits}{Fore.CYAN} hits, {Fore.WHITE}{misses}{Fore.CYAN} misses "
+              f"({rate:.0f}% hit rate), {Fore.WHITE}{len(self.response_cache)}{Fore.CYAN} cached responses{Style.RESET_ALL}")
 
     def _generate_simulated_response(self, content, task_type):
         """Generate a simulated response when Groq API is unavailable."""
@@ -220,55 +701,79 @@ Get your free Groq API key at: https://console.groq.com/
 """
         return response
 
-    def update(self, file_path, response, task_type):
+    def update(self, ctx):
         """STEP 3: UPDATE - Write the response back into the file."""
         print(f"\n{Fore.BLUE}[STEP 3: UPDATE]{Style.RESET_ALL}")
 
         try:
+            # A streamed (or resumed) response is already in the file
+            if ctx.metadata.get('written'):
+                print(f"  {Fore.GREEN}[OK] {Fore.CYAN}{ctx.file_path.name}{Fore.GREEN} already holds the response{Style.RESET_ALL}")
+                return True
+
             # For .docx files, we need to append to the document
-            if file_path.suffix.lower() == '.docx':
-                return self._update_docx(file_path, response, task_type)
+            if ctx.file_path.suffix.lower() == '.docx':
+                return self._update_docx(ctx)
             else:
                 # For text-based files (.md, .txt)
-                return self._update_text_file(file_path, response, task_type)
+                return self._update_text_file(ctx)
 
         except Exception as e:
+            REGISTRY.inc('triage_errors_total', stage='write_back', type=type(e).__name__)
             print(f"  {Fore.RED}[X] ERROR: Failed to update file: {e}{Style.RESET_ALL}")
             return False
 
-    def _update_text_file(self, file_path, response, task_type):
-        """Update text-based files (.md, .txt)."""
-        # Read current content
-        with open(file_path, 'r', encoding='utf-8') as f:
-            original_content = f.read()
+    def _update_text_file(self, ctx):
+        """Append the response section to a text file (.md, .txt) in place.
+
+        The original bytes are never read back or rewritten, so the cost scales
+        with the response, not the file. A marker recording the original length
+        is written first; if the agent dies mid-append, recover_claims truncates
+        the file back to that length.
+        """
+        file_path = ctx.file_path
+        header, footer = self._response_section_parts(ctx.task_type)
+
+        marker = self._append_marker(file_path)
+        atomic_write(marker, str(file_path.stat().st_size))
+        with open(file_path, 'a', encoding='utf-8') as f:
+            f.write(header)
+            f.write(ctx.response)
+            f.write(footer)
+            f.flush()
+            os.fsync(f.fileno())
+        marker.unlink()
+
+        print(f"  {Fore.GREEN}[OK] Updated {Fore.CYAN}{file_path.name}{Fore.GREEN} with AI response{Style.RESET_ALL}")
+        return True
+
+    def _append_marker(self, file_path):
+        """Sidecar recording a text file's length before a response is appended."""
+        return file_path.parent / f".{file_path.name}.append"
 
-        # Prepare the response section
+    def _response_section_parts(self, task_type):
+        """Markdown written before and after the response in a text file."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-        response_section = f"""
+        header = f"""
 ---
 
 ## AI Response
 
 **Processed:** {timestamp}
 
-{response}
+"""
+        footer = f"""
 
 **Task Type:** {task_type}
 **Status:** Completed
 """
+        return header, footer
 
-        # Append response to original content
-        updated_content = original_content + response_section
-
-        # Write back to file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
-
-        print(f"  {Fore.GREEN}[OK] Updated {Fore.CYAN}{file_path.name}{Fore.GREEN} with AI response{Style.RESET_ALL}")
-        return True
-
-    def _update_docx(self, file_path, response, task_type):
+    def _update_docx(self, ctx):
         """Update .docx files by appending response."""
+        file_path, response, task_type = ctx.file_path, ctx.response, ctx.task_type
+        # python-docx is only needed here, to write the response back
+        from docx import Document
         doc = Document(file_path)
 
         # Add separator
@@ -290,172 +795,86 @@ Get your free Groq API key at: https://console.groq.com/
         doc.add_paragraph(f"Task Type: {task_type}")
         doc.add_paragraph(f"Status: Completed")
 
-        # Save the document
-        doc.save(file_path)
+        # Save to a temp copy and swap it in, so a crash never leaves a torn file
+        tmp_path = file_path.parent / f".{file_path.name}.tmp"
+        doc.save(tmp_path)
+        with open(tmp_path, 'r+b') as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
 
         print(f"  {Fore.GREEN}[OK] Updated {Fore.CYAN}{file_path.name}{Fore.GREEN} with AI response{Style.RESET_ALL}")
         return True
 
-    def finalize(self, file_path):
+    def finalize(self, ctx):
         """STEP 4: FINALIZE - Move to Done and update Dashboard."""
         print(f"\n{Fore.BLUE}[STEP 4: FINALIZE]{Style.RESET_ALL}")
 
+        file_path = ctx.file_path
         filename = file_path.name
         task_name = file_path.stem
+        task_id = ctx.task_id if ctx.task_id is not None else self.resolve_task(file_path)
 
-        # Move file to Done
+        # Move file to Done (under a free name, never over an earlier result)
         try:
-            destination = self.done_path / filename
+            done_name = unique_name(filename, [self.done_path])
+            destination = self.done_path / done_name
+            # Journaled first, so recovery can tell a finished move under a new name
+            self.journal.set_done_name(filename, done_name)
             file_path.rename(destination)
-            print(f"  {Fore.GREEN}[OK] Moved {Fore.CYAN}{filename}{Fore.GREEN} -> {Fore.MAGENTA}Done/{Style.RESET_ALL}")
+            print(f"  {Fore.GREEN}[OK] Moved {Fore.CYAN}{filename}{Fore.GREEN} -> {Fore.MAGENTA}Done/"
+                  f"{done_name if done_name != filename else ''}{Style.RESET_ALL}")
         except Exception as e:
+            REGISTRY.inc('triage_errors_total', stage='finalize', type=type(e).__name__)
             print(f"  {Fore.RED}[X] ERROR: Failed to move file: {e}{Style.RESET_ALL}")
             return False
 
         # Update Dashboard
         try:
-            self._update_dashboard(task_name, "Completed", filename)
+            self._update_dashboard(task_id, "Completed", done_name)
             print(f"  {Fore.GREEN}[OK] Updated Dashboard: {Fore.CYAN}{task_name}{Fore.GREEN} -> {Fore.YELLOW}Completed{Style.RESET_ALL}")
         except Exception as e:
+            REGISTRY.inc('triage_errors_total', stage='finalize', type=type(e).__name__)
             print(f"  {Fore.RED}[X] ERROR: Failed to update Dashboard: {e}{Style.RESET_ALL}")
             return False
 
+        # Exact duplicates dropped while this task was pending share its result
+        try:
+            self._complete_duplicates(filename, done_name)
+        except Exception as e:
+            REGISTRY.inc('triage_errors_total', stage='finalize', type=type(e).__name__)
+            print(f"  {Fore.RED}[X] ERROR: Failed to link duplicates: {e}{Style.RESET_ALL}")
+
         # Log completion
         completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         print(f"\n{Fore.GREEN}[DONE] Task completed: {Fore.CYAN}{filename}{Fore.GREEN} at {Fore.WHITE}{completion_time}{Style.RESET_ALL}")
 
         return True
 
-    def _update_dashboard(self, task_name, new_status, filename=None):
+    def _complete_duplicates(self, filename, done_name):
+        """Link the duplicates parked on this task to its result in Done/ and complete them."""
+        for task_id, name in self.content_index.complete(filename, done_name):
+            link_name = unique_name(name, [self.done_path])
+            link_or_copy(self.done_path / done_name, self.done_path / link_name)
+            (self.duplicates_path / name).unlink(missing_ok=True)
+            self._update_dashboard(task_id, "Completed", link_name)
+            print(f"  {Fore.GREEN}[OK] Duplicate {Fore.CYAN}{name}{Fore.GREEN} -> {Fore.MAGENTA}Done/{link_name}"
+                  f"{Fore.GREEN} (no new request){Style.RESET_ALL}")
+
+    def resolve_task(self, file_path):
+        """Return the Dashboard task ID for a file, adding a row if it has none.
+
+        Files dropped straight into Needs_Action (bypassing the watcher) get a
+        Pending row here so their outcome is still tracked.
+        """
+        task_id = self.dashboard.find_task(file_path.name)
+        if task_id is None:
+            task_id = self.dashboard.add_task(file_path.stem, file_path.name)
+        return task_id
+
+    def _update_dashboard(self, task_id, new_status, filename=None):
         """Update the status of a task in the Dashboard."""
-        import re
-
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        current_time = datetime.now().strftime("%H:%M:%S")
-        current_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        # Read dashboard
-        with open(self.dashboard_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Determine status badge style and statistics update
-        if new_status == "Completed":
-            status_badge = '<span style="background: linear-gradient(135deg, #10b981 0%, #059669 100%); color: white; padding: 6px 16px; border-radius: 20px; font-size: 12px; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px; box-shadow: 0 2px 8px rgba(16, 185, 129, 0.4);">Completed</span>'
-            stats_update = {'completed_delta': 1, 'pending_delta': -1}
-        elif new_status == "Error":
-            status_badge = '<span style="background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%); color: white; padding: 6px 16px; border-radius: 20px; font-size: 12px; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px; box-shadow: 0 2px 8px rgba(239, 68, 68, 0.4);">Error</span>'
-            stats_update = {'error_delta': 1, 'pending_delta': -1}
-        else:
-            status_badge = f'<span style="background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%); color: white; padding: 6px 16px; border-radius: 20px; font-size: 12px; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px; box-shadow: 0 2px 8px rgba(245, 158, 11, 0.4);">{new_status}</span>'
-            stats_update = {}
-
-        # Find and update the task row
-        # Pattern to match the entire row containing the task name
-        pattern = rf'(<tr style="[^"]*">\s*<td style="padding: 16px; text-align: center; font-weight: 700; color: #6366f1; font-size: 16px;">\d+</td>\s*<td style="padding: 16px; color: #e4e6eb; font-size: 14px;">){re.escape(task_name)}(</td>\s*<td style="padding: 16px; text-align: center;">).*?(</td>\s*<td style="padding: 16px; text-align: center; color: #9ca3af; font-size: 14px;">).*?(</td>\s*<td style="padding: 16px; text-align: center; color: #9ca3af; font-size: 14px;">).*?(</td>\s*<td style="padding: 16px;">).*?(</td>\s*</tr>)'
-
-        def replace_row(match):
-            # Extract the filename from the existing link if not provided
-            nonlocal filename
-            if filename is None:
-                link_match = re.search(r'href="[^"]*?/([^"]+)"', match.group(0))
-                if link_match:
-                    filename = link_match.group(1)
-                else:
-                    filename = f"{task_name}.md"  # fallback
-
-            # Build the updated row
-            return (
-                f'{match.group(1)}{task_name}{match.group(2)}\n        {status_badge}\n      '
-                f'{match.group(3)}{current_date}{match.group(4)}{current_time}'
-                f'{match.group(5)}<a href="Done/{filename}" style="color: #6366f1; text-decoration: none; font-weight: 500; font-size: 14px;">📄 Done/{filename}</a>'
-                f'{match.group(6)}'
-            )
-
-        content = re.sub(pattern, replace_row, content, flags=re.DOTALL)
-
-        # Update statistics
-        if stats_update:
-            content = self._update_statistics(content, **stats_update)
-
-        # Update last updated timestamp (if exists in footer)
-        if 'Last Updated:' in content:
-            content = re.sub(
-                r'<p style="margin: 0; color: #[^"]+;"><strong>Last Updated:</strong> [^<]+</p>',
-                f'<p style="margin: 0; color: #9ca3af;"><strong>Last Updated:</strong> {current_timestamp}</p>',
-                content
-            )
-
-        # Write back
-        with open(self.dashboard_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-    def _update_statistics(self, content, total_delta=0, completed_delta=0, pending_delta=0, error_delta=0):
-        """Update the statistics section in the Dashboard."""
-        import re
-
-        # Extract current statistics - updated pattern for new Dashboard format
-        # Pattern: <h3 style="...font-size: 48px...">NUMBER</h3>
-        total_match = re.search(
-            r'<h3 style="[^"]*font-size: 48px[^"]*">(\d+)</h3>\s*<p style="[^"]*">Total Tasks</p>',
-            content,
-            re.DOTALL
-        )
-        completed_match = re.search(
-            r'<h3 style="[^"]*font-size: 48px[^"]*">(\d+)</h3>\s*<p style="[^"]*">Completed</p>',
-            content,
-            re.DOTALL
-        )
-        pending_match = re.search(
-            r'<h3 style="[^"]*font-size: 48px[^"]*">(\d+)</h3>\s*<p style="[^"]*">Pending</p>',
-            content,
-            re.DOTALL
-        )
-        error_match = re.search(
-            r'<h3 style="[^"]*font-size: 48px[^"]*">(\d+)</h3>\s*<p style="[^"]*">Errors</p>',
-            content,
-            re.DOTALL
-        )
-
-        # Calculate new values
-        total = int(total_match.group(1)) + total_delta if total_match else total_delta
-        completed = int(completed_match.group(1)) + completed_delta if completed_match else completed_delta
-        pending = int(pending_match.group(1)) + pending_delta if pending_match else pending_delta
-        errors = int(error_match.group(1)) + error_delta if error_match else error_delta
-
-        # Update statistics with new values
-        # Pattern to match the number inside h3 tag before "Total Tasks"
-        content = re.sub(
-            r'(<h3 style="[^"]*font-size: 48px[^"]*">)\d+(</h3>\s*<p style="[^"]*">Total Tasks</p>)',
-            rf'\g<1>{total}\g<2>',
-            content,
-            flags=re.DOTALL
-        )
-
-        # Pattern to match the number inside h3 tag before "Completed"
-        content = re.sub(
-            r'(<h3 style="[^"]*font-size: 48px[^"]*">)\d+(</h3>\s*<p style="[^"]*">Completed</p>)',
-            rf'\g<1>{completed}\g<2>',
-            content,
-            flags=re.DOTALL
-        )
-
-        # Pattern to match the number inside h3 tag before "Pending"
-        content = re.sub(
-            r'(<h3 style="[^"]*font-size: 48px[^"]*">)\d+(</h3>\s*<p style="[^"]*">Pending</p>)',
-            rf'\g<1>{pending}\g<2>',
-            content,
-            flags=re.DOTALL
-        )
-
-        # Pattern to match the number inside h3 tag before "Errors"
-        content = re.sub(
-            r'(<h3 style="[^"]*font-size: 48px[^"]*">)\d+(</h3>\s*<p style="[^"]*">Errors</p>)',
-            rf'\g<1>{errors}\g<2>',
-            content,
-            flags=re.DOTALL
-        )
-
-        return content
+        if self.dashboard.update_status(task_id, new_status, filename) is None:
+            print(f"  {Fore.YELLOW}[!] No Dashboard row found for task #{task_id}{Style.RESET_ALL}")
 
     def process_single_file(self):
         """Process one file through the complete workflow."""
@@ -464,26 +883,162 @@ Get your free Groq API key at: https://console.groq.com/
         if not file_path:
             return False
 
-        filename = file_path.name
+        file_path = self.claim(file_path)
+        if not file_path:
+            print(f"  {Fore.YELLOW}[SKIP] File was claimed by another worker{Style.RESET_ALL}")
+            return False
+
+        return self.run_pipeline(file_path)
+
+    def run_pipeline(self, file_path):
+        """Run PROCESS -> UPDATE -> FINALIZE on a claimed file."""
+        ctx = self._resume(file_path)
+        if ctx is not None:
+            return self._write_back(ctx)
+        ctx = self.load_task(file_path, self.resolve_task(file_path))
 
         # STEP 2: PROCESS
-        response = self.process(file_path)
-        if not response:
-            self._update_dashboard(file_path.stem, "Error", filename)
-            return False
+        if not self.process(ctx):
+            released = self.release(file_path)
+            self._update_dashboard(ctx.task_id, "Error", released.name)
+            return self._task_done(ctx, False)
+
+        return self._write_back(ctx)
+
+    def _write_back(self, ctx):
+        """Run UPDATE -> FINALIZE for a task whose response is ready.
 
-        task_type = self._classify_task(self.read_file_content(file_path))
+        Each completed stage is journaled first, so if the agent stops here
+        the task resumes from the journal instead of calling Groq again.
+        """
+        filename = ctx.file_path.name
+        if not ctx.metadata.get('written'):
+            self.journal.record(filename, RESPONDED, ctx.task_id, ctx.task_type, ctx.response,
+                                ctx.file_path.stat().st_size)
 
         # STEP 3: UPDATE
-        if not self.update(file_path, response, task_type):
-            self._update_dashboard(file_path.stem, "Error", filename)
-            return False
+        with self._stage(ctx, 'write_back'):
+            updated = self.update(ctx)
+        if not updated:
+            self.journal.finish(filename)
+            released = self.release(ctx.file_path)
+            self._update_dashboard(ctx.task_id, "Error", released.name)
+            return self._task_done(ctx, False)
+        self.journal.record(filename, UPDATED, ctx.task_id, ctx.task_type, size=ctx.file_path.stat().st_size)
 
         # STEP 4: FINALIZE
-        if not self.finalize(file_path):
+        with self._stage(ctx, 'finalize'):
+            finalized = self.finalize(ctx)
+        if not finalized:
+            # The journal entry stays: a retry only has to finalize
+            self.release(ctx.file_path)
+            return self._task_done(ctx, False)
+
+        self.journal.finish(filename)
+        return self._task_done(ctx, True)
+
+    def _resume(self, file_path):
+        """TaskContext for a claimed file the journal shows already has a response.
+
+        Returns None (and drops any stale entry) when the file must be
+        processed from scratch.
+        """
+        entry = self.journal.get(file_path.name)
+        if entry is None:
+            return None
+        size = file_path.stat().st_size
+        if entry.stage == UPDATED and size == entry.size:
+            written = True
+        elif entry.stage == RESPONDED and self._holds_response(file_path, entry):
+            # Stopped after the write but before it was journaled
+            written = True
+        elif entry.stage == RESPONDED and size == entry.size:
+            written = False
+        else:
+            # A different file that reuses the name
+            self.journal.finish(file_path.name)
+            return None
+
+        task_id = entry.task_id if entry.task_id is not None else self.resolve_task(file_path)
+        ctx = TaskContext(file_path=file_path, task_id=task_id, task_type=entry.task_type, response=entry.response)
+        ctx.metadata['written'] = written
+        REGISTRY.inc('triage_resumed_total', stage=entry.stage)
+        print(f"  {Fore.CYAN}[RESUME] {file_path.name}: response "
+              f"{'already written' if written else 'already generated'}, no Groq call{Style.RESET_ALL}")
+        return ctx
+
+    def _holds_response(self, file_path, entry):
+        """Whether a file already ends with the journaled response section."""
+        if not entry.response:
             return False
+        if file_path.suffix.lower() == '.docx':
+            text = extract_docx_text(file_path)
+            last_line = [line for line in entry.response.split('\n') if line.strip()][-1]
+            return (text.endswith(f"Task Type: {entry.task_type}\nStatus: Completed")
+                    and last_line in text[-len(entry.response) - 200:])
+        _, footer = self._response_section_parts(entry.task_type)
+        tail = (entry.response + footer).encode('utf-8')
+        with open(file_path, 'rb') as f:
+            f.seek(max(0, f.seek(0, os.SEEK_END) - len(tail)))
+            return f.read() == tail
+
+    def _task_done(self, ctx, success):
+        """Count a finished task and log its stage timings; returns `success`."""
+        REGISTRY.task_done(success)
+        timings = ctx.metadata.get('timings', {})
+        log_event('task_done', level='info' if success else 'error', file=ctx.file_path.name,
+                  task_id=ctx.task_id, task_type=ctx.task_type, success=success,
+                  chars=ctx.metadata.get('chars'), seconds=round(sum(timings.values()), 4),
+                  stages={stage: round(seconds, 4) for stage, seconds in timings.items()})
+        return success
+
+    def run_batch(self, file_paths):
+        """Run several claimed files through the pipeline with one shared LLM request.
+
+        Returns {filename: success}.
+        """
+        if len(file_paths) == 1:
+            return {file_paths[0].name: self.run_pipeline(file_paths[0])}
+
+        # Tasks with a journaled response only need writing back
+        results, fresh = {}, []
+        for file_path in file_paths:
+            ctx = self._resume(file_path)
+            if ctx is None:
+                fresh.append(file_path)
+            else:
+                results[file_path.name] = self._write_back(ctx)
+        if not fresh:
+            return results
 
-        return True
+        file_paths = fresh
+
+        contexts = [self.load_task(file_path, self.resolve_task(file_path)) for file_path in file_paths]
+
+        # STEP 2: PROCESS
+        print(f"\n{Fore.BLUE}[STEP 2: PROCESS]{Style.RESET_ALL} {Fore.CYAN}batch of {len(contexts)} files{Style.RESET_ALL}")
+        ready = [ctx for ctx in contexts if ctx.content]
+        for ctx in ready:
+            with self._stage(ctx, 'classify'):
+                ctx.task_type = self._classify_task(ctx.content)
+            print(f"  {Fore.GREEN}[OK] {Fore.CYAN}{ctx.file_path.name}{Fore.GREEN}: {Fore.MAGENTA}{ctx.task_type}{Style.RESET_ALL}")
+        # One shared request: every task in the batch waited the whole time
+        start = time.perf_counter()
+        self._generate_batch(ready)
+        seconds = time.perf_counter() - start
+        REGISTRY.observe('triage_stage_seconds', seconds, stage='llm')
+        for ctx in ready:
+            ctx.metadata.setdefault('timings', {})['llm'] = seconds
+
+        for ctx in contexts:
+            if not ctx.response:
+                print(f"  {Fore.RED}[X] ERROR: Failed to generate response for {ctx.file_path.name}{Style.RESET_ALL}")
+                released = self.release(ctx.file_path)
+                self._update_dashboard(ctx.task_id, "Error", released.name)
+                results[ctx.file_path.name] = self._task_done(ctx, False)
+            else:
+                results[ctx.file_path.name] = self._write_back(ctx)
+        return results
 
     def run_continuous(self, interval=5):
         """Run the agent continuously, checking for new files."""
@@ -493,17 +1048,163 @@ Get your free Groq API key at: https://console.groq.com/
         print(f"{Fore.CYAN}Monitoring: {Fore.WHITE}{self.needs_action_path}{Style.RESET_ALL}")
         print(f"{Fore.CYAN}Supported files: {Fore.WHITE}.md, .txt, .docx{Style.RESET_ALL}")
         print(f"{Fore.CYAN}AI Provider: {Fore.WHITE}Groq API ({self.groq_model}){Style.RESET_ALL}")
-        print(f"{Fore.CYAN}Check interval: {Fore.WHITE}{interval} seconds{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Idle rescan interval: {Fore.WHITE}{interval} seconds{Style.RESET_ALL}")
         print(f"{Fore.CYAN}Press Ctrl+C to stop{Style.RESET_ALL}")
         print()
 
-        try:
-            while True:
-                self.process_single_file()
-                time.sleep(interval)
+        self.recover_claims()
+        self.task_queue.start()
+        self.task_queue.seed()
 
+        try:
+            self._worker_loop(threading.Event(), interval, set())
         except KeyboardInterrupt:
             print(f"\n{Fore.YELLOW}[STOP] Agent stopped by user.{Style.RESET_ALL}")
+        finally:
+            self.task_queue.stop()
+            self.print_cache_stats()
+
+    def run_workers(self, workers=4, interval=5, watch=True, stop_event=None):
+        """Run the agent with a pool of workers draining Needs_Action concurrently.
+
+        With `watch=False` Needs_Action is not watched for new files; the
+        caller pushes them onto `task_queue` (see daemon.py). Setting
+        `stop_event` stops the workers like Ctrl+C does.
+        """
+        print(f"\n{Back.GREEN}{Fore.BLACK}{'=' * 60}{Style.RESET_ALL}")
+        print(f"{Back.GREEN}{Fore.BLACK}  Agent Factory Bronze Tier - File Triage Agent  {Style.RESET_ALL}")
+        print(f"{Back.GREEN}{Fore.BLACK}{'=' * 60}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Monitoring: {Fore.WHITE}{self.needs_action_path}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Supported files: {Fore.WHITE}.md, .txt, .docx{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}AI Provider: {Fore.WHITE}Groq API ({self.groq_model}){Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Workers: {Fore.WHITE}{workers} (max {self.max_inflight} in-flight LLM calls){Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Idle rescan interval: {Fore.WHITE}{interval} seconds{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Press Ctrl+C to stop{Style.RESET_ALL}")
+        print()
+
+        self.recover_claims()
+        if watch:
+            self.task_queue.start()
+        self.task_queue.seed()
+        stop_event = stop_event or threading.Event()
+        failed = set()
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="triage-worker") as pool:
+            for _ in range(workers):
+                pool.submit(self._worker_loop, stop_event, interval, failed)
+
+            try:
+                while not stop_event.wait(1):
+                    pass
+            except KeyboardInterrupt:
+                print(f"\n{Fore.YELLOW}[STOP] Waiting for in-flight tasks to finish...{Style.RESET_ALL}")
+                stop_event.set()
+            # Wake workers blocked on an empty queue
+            self.task_queue.stop()
+
+        print(f"{Fore.YELLOW}[STOP] Agent stopped by user.{Style.RESET_ALL}")
+        self.print_cache_stats()
+
+    def _worker_loop(self, stop_event, interval, failed):
+        """Claim and process files until stopped; block on the queue when idle."""
+        while not stop_event.is_set():
+            file_paths = self.claim_batch(skip=failed, timeout=interval)
+            if not file_paths:
+                # Idle: rescan once in case a filesystem event was missed
+                if not stop_event.is_set():
+                    self.task_queue.seed()
+                continue
+
+            self._run_claimed(file_paths, failed)
+
+    def _run_claimed(self, file_paths, failed, summary=None):
+        """Run claimed files through the pipeline, noting failures (and timings in `summary`)."""
+        start = time.monotonic()
+        try:
+            results = self.run_batch(file_paths)
+        except Exception as e:
+            REGISTRY.inc('triage_errors_total', stage='worker', type=type(e).__name__)
+            print(f"  {Fore.RED}[X] ERROR: Worker failed on {', '.join(p.name for p in file_paths)}: {e}{Style.RESET_ALL}")
+            for file_path in file_paths:
+                self.release(file_path)
+            results = {file_path.name: False for file_path in file_paths}
+
+        if summary is not None:
+            elapsed = time.monotonic() - start
+            for name, success in results.items():
+                summary.record(name, elapsed, success)
+
+        # Errored files stay in Needs_Action for a later run, not a hot retry loop
+        failed.update(name for name, success in results.items() if not success)
+
+    def run_drain(self, workers=4, max_files=None):
+        """Process the current backlog (or up to `max_files` files) back to back, then return.
+
+        Returns a RunSummary of per-file latency and failures.
+        """
+        print(f"\n{Back.GREEN}{Fore.BLACK}{'=' * 60}{Style.RESET_ALL}")
+        print(f"{Back.GREEN}{Fore.BLACK}  Agent Factory Bronze Tier - File Triage Agent  {Style.RESET_ALL}")
+        print(f"{Back.GREEN}{Fore.BLACK}{'=' * 60}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Draining: {Fore.WHITE}{self.needs_action_path}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Workers: {Fore.WHITE}{workers} (max {self.max_inflight} in-flight LLM calls){Style.RESET_ALL}")
+        if max_files:
+            print(f"{Fore.CYAN}Max files: {Fore.WHITE}{max_files}{Style.RESET_ALL}")
+        print()
+
+        self.recover_claims()
+        self.task_queue.seed()
+        summary = RunSummary()
+        failed = set()
+        budget = {'remaining': max_files}
+        budget_lock = threading.Lock()
+
+        def drain():
+            while True:
+                # Reserve up to a batch worth of the --max-files budget before claiming
+                with budget_lock:
+                    remaining = budget['remaining']
+                    if remaining is not None and remaining <= 0:
+                        return
+                    reserved = min(remaining, self.batch_max_tasks if self.batch else 1) if remaining else None
+                    if reserved:
+                        budget['remaining'] -= reserved
+                file_paths = self.claim_batch(skip=failed, timeout=0, limit=reserved)
+                if reserved:
+                    with budget_lock:
+                        budget['remaining'] += reserved - len(file_paths)
+                if not file_paths:
+                    return
+                self._run_claimed(file_paths, failed, summary)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="triage-worker") as pool:
+                for future in [pool.submit(drain) for _ in range(workers)]:
+                    future.result()
+        finally:
+            summary.finish()
+            self.dashboard.flush()
+        return summary
+
+    def print_run_summary(self, summary):
+        """Print throughput, latency percentiles, failures and token use for a drain run."""
+        report = summary.as_dict()
+        print(f"\n{Back.GREEN}{Fore.BLACK}  Run Summary  {Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Files: {Fore.WHITE}{report['files']}{Fore.CYAN} processed, "
+              f"{Fore.GREEN}{report['succeeded']}{Fore.CYAN} succeeded, "
+              f"{Fore.RED if report['failed'] else Fore.WHITE}{len(report['failed'])}{Fore.CYAN} failed{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Elapsed: {Fore.WHITE}{report['elapsed']:.1f}s{Fore.CYAN} "
+              f"({Fore.WHITE}{report['files_per_minute']:.1f}{Fore.CYAN} files/min){Style.RESET_ALL}")
+        if report['files']:
+            print(f"{Fore.CYAN}Latency: {Fore.WHITE}p50 {report['p50']:.2f}s, p95 {report['p95']:.2f}s, "
+                  f"p99 {report['p99']:.2f}s, max {report['max']:.2f}s{Style.RESET_ALL}")
+        if self.groq_client:
+            llm = self.groq_client.stats
+            print(f"{Fore.CYAN}Tokens: {Fore.WHITE}{llm['prompt_tokens'] + llm['completion_tokens']}{Fore.CYAN} "
+                  f"({llm['prompt_tokens']} prompt, {llm['completion_tokens']} completion) over "
+                  f"{Fore.WHITE}{llm['requests']}{Fore.CYAN} requests, {llm['retries']} retries{Style.RESET_ALL}")
+        self.print_cache_stats()
+        for name in report['failed']:
+            print(f"  {Fore.RED}[X] Failed: {name}{Style.RESET_ALL}")
 
 
 def main():
@@ -522,19 +1223,102 @@ def main():
         '--interval',
         type=int,
         default=5,
-        help='Check interval in seconds for continuous mode (default: 5)'
+        help='Idle rescan interval in seconds (default: 5)'
+    )
+    parser.add_argument(
+        '--drain',
+        action='store_true',
+        help='Process every file in Needs_Action with no sleeps, print a summary and exit'
+    )
+    parser.add_argument(
+        '--max-files',
+        type=int,
+        default=None,
+        help='Like --drain, but stop after N files'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of concurrent workers (default: 1, or --max-inflight when draining)'
+    )
+    parser.add_argument(
+        '--max-inflight',
+        type=int,
+        default=None,
+        help='Maximum concurrent Groq API calls (default: MAX_INFLIGHT_REQUESTS or 4)'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Stream Groq responses into .md/.txt files as they are generated'
+    )
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Answer several small .md/.txt files with one Groq request'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always call Groq instead of reusing cached responses for repeated requests'
+    )
+    parser.add_argument(
+        '--base-path',
+        type=Path,
+        default=Path(__file__).parent,
+        help='Folder holding Vault/ and skills/ (default: the agent\'s folder)'
+    )
+    parser.add_argument(
+        '--recount',
+        action='store_true',
+        help='Rebuild Dashboard statistics from the Vault folders and exit'
+    )
+    add_observability_arguments(parser)
 
     args = parser.parse_args()
+    if args.log_format == 'json':
+        enable_json_logs()
 
-    # Initialize agent
-    agent = FileTriageAgent()
+    # Nothing to do: exit before loading the Groq SDK or opening the stores
+    one_shot = args.once or args.drain or args.max_files
+    needs_action_path = args.base_path / "Vault" / "Needs_Action"
+    if one_shot and not args.recount and not has_pending_files(needs_action_path):
+        print(f"{Fore.YELLOW}[EMPTY] No files found in Needs_Action/{Style.RESET_ALL}")
+        exit(1 if args.once else 0)
 
-    # Run in selected mode
-    if args.once:
+    # Initialize agent
+    agent = FileTriageAgent(args.base_path, max_inflight=args.max_inflight, use_cache=not args.no_cache,
+                            batch=args.batch, stream=args.stream)
+    exporters = start_exporters(args.metrics_port, args.metrics_file, args.metrics_interval)
+    try:
+        run_mode(agent, args)
+    finally:
+        agent.close()
+        for exporter in exporters:
+            exporter.stop()
+
+
+def run_mode(agent, args):
+    """Run the agent in the mode selected on the command line."""
+    if args.recount:
+        stats = agent.dashboard.recount(agent.base_path / "Vault")
+        print(f"{Fore.GREEN}[OK] Recounted: {Fore.CYAN}{stats['total']}{Fore.GREEN} total, "
+              f"{Fore.CYAN}{stats['completed']}{Fore.GREEN} completed, {Fore.CYAN}{stats['pending']}{Fore.GREEN} pending, "
+              f"{Fore.CYAN}{stats['errors']}{Fore.GREEN} errors{Style.RESET_ALL}")
+        exit(0)
+    elif args.once:
         print(f"{Fore.CYAN}[MODE] Running in single-file mode...{Style.RESET_ALL}")
-        success = agent.process_single_file()
+        # A task an exited agent left half-done is finished first and counts as this run's file
+        success = agent.recover_claims() > 0 or agent.process_single_file()
+        agent.print_cache_stats()
         exit(0 if success else 1)
+    elif args.drain or args.max_files:
+        summary = agent.run_drain(workers=args.workers or agent.max_inflight, max_files=args.max_files)
+        agent.print_run_summary(summary)
+        exit(1 if summary.failures else 0)
+    elif args.workers and args.workers > 1:
+        agent.run_workers(workers=args.workers, interval=args.interval)
     else:
         agent.run_continuous(interval=args.interval)
 
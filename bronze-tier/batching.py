@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Agent Factory Bronze Tier - Batched Prompts
+Packs several small tasks into one completion request and splits the reply
+back into per-task responses. Each task is wrapped in numbered markers and the
+model is asked to answer inside numbered answer markers, so one request (and one copy
+of the system prompt) covers the whole batch under Groq's per-minute limits.
+"""
+
+import re
+
+from llm import estimate_tokens
+
+BATCH_INSTRUCTIONS = """You will receive {count} independent requests, each between <<<TASK n>>> and <<<END TASK n>>> markers.
+Answer every request separately. Put each answer between answer markers, exactly like this,
+with n replaced by the request number:
+
+<<<ANSWER n>>>
+(your answer to request n)
+<<<END ANSWER n>>>
+
+Answer all {count} requests, in order, and write nothing outside the markers."""
+
+_ANSWER = re.compile(r'<<<ANSWER (\d+)>>>\s*(.*?)\s*<<<END ANSWER \1>>>', re.DOTALL)
+
+
+def pack_batches(items, token_budget, max_tasks):
+    """Group (key, content) items into batches within a prompt token budget.
+
+    Items keep their order; an item larger than the budget gets a batch of its own.
+    """
+    batches, current, used = [], [], 0
+    for key, content in items:
+        tokens = estimate_tokens(content)
+        if current and (used + tokens > token_budget or len(current) >= max_tasks):
+            batches.append(current)
+            current, used = [], 0
+        current.append(key)
+        used += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def build_batch_prompt(tasks):
+    """User prompt for a list of (task_type, content) tasks, numbered from 1."""
+    sections = [BATCH_INSTRUCTIONS.format(count=len(tasks))]
+    for number, (task_type, content) in enumerate(tasks, 1):
+        sections.append(f"<<<TASK {number}>>>\nTask Type: {task_type}\n\n{content.strip()}\n<<<END TASK {number}>>>")
+    return '\n\n'.join(sections)
+
+
+def parse_batch_response(text, count):
+    """Split a batched reply into {task number: answer}.
+
+    Only well-formed, non-empty answers for numbers 1..count are returned;
+    callers fall back to a single-task request for anything missing.
+    """
+    answers = {}
+    for match in _ANSWER.finditer(text or ''):
+        number = int(match.group(1))
+        if 1 <= number <= count and match.group(2) and number not in answers:
+            answers[number] = match.group(2)
+    return answers
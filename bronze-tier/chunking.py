@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Agent Factory Bronze Tier - Document Chunking
+Splits large documents into token-bounded chunks at heading or paragraph
+boundaries (with optional overlap) and builds the map and reduce prompts used
+to answer them: each chunk is condensed into notes in parallel, then one
+request turns the notes into the final response.
+"""
+
+import re
+
+from llm import estimate_tokens
+
+_HEADING = re.compile(r'^(#{1,6}\s|[A-Z][A-Za-z0-9 ,&/\-]{0,60}:?$)')
+_BLANK_LINES = re.compile(r'\n\s*\n')
+
+
+def _blocks(text, max_tokens):
+    """Split text into paragraphs, breaking any paragraph over `max_tokens`."""
+    blocks = []
+    for paragraph in _BLANK_LINES.split(text):
+        if not paragraph.strip():
+            continue
+        if estimate_tokens(paragraph) <= max_tokens:
+            blocks.append(paragraph.strip('\n'))
+            continue
+        # Oversized paragraph (e.g. .docx text, one paragraph per line): one block per line
+        for line in paragraph.split('\n'):
+            if not line.strip():
+                continue
+            # A single line longer than a chunk is cut at the character limit
+            while estimate_tokens(line) > max_tokens:
+                blocks.append(line[:max_tokens * 4])
+                line = line[max_tokens * 4:]
+            blocks.append(line)
+    return blocks
+
+
+def is_heading(block):
+    """Whether a block starts with a markdown heading or a short title line."""
+    return bool(_HEADING.match(block.split('\n', 1)[0]))
+
+
+def split_document(text, chunk_tokens, overlap_tokens=0):
+    """Split `text` into chunks of about `chunk_tokens` tokens.
+
+    Chunks break between paragraphs, preferring to start a new chunk at a
+    heading once the current one is half full. Each chunk after the first
+    repeats up to `overlap_tokens` of trailing paragraphs from the previous one.
+    """
+    # Sizes are counted in characters (4 per token), separators included
+    limit, overlap = chunk_tokens * 4, overlap_tokens * 4
+    chunks, current, used = [], [], 0
+    for block in _blocks(text, chunk_tokens):
+        size = len(block) + 2
+        at_heading = is_heading(block) and used >= limit // 2
+        if current and (used + size > limit or at_heading):
+            chunks.append('\n\n'.join(current))
+            carried, carried_size = [], 0
+            for previous in reversed(current):
+                previous_size = len(previous) + 2
+                if carried_size + previous_size > overlap or carried_size + previous_size + size > limit:
+                    break
+                carried.insert(0, previous)
+                carried_size += previous_size
+            current, used = carried, carried_size
+        current.append(block)
+        used += size
+    if current:
+        chunks.append('\n\n'.join(current))
+    return chunks
+
+
+def build_map_prompt(task_type, chunk, number, count):
+    return f"""Task Type: {task_type}
+
+The user's request is a long document that has been split into {count} parts. This is part {number} of {count}:
+
+{chunk}
+
+Extract everything in this part that is needed to respond to the document's request: key facts, figures, questions, decisions and action items. Be concise and do not answer the request yet."""
+
+
+def build_reduce_prompt(task_type, notes):
+    parts = '\n\n'.join(f"--- Part {number} ---\n{note}" for number, note in enumerate(notes, 1))
+    return f"""Task Type: {task_type}
+
+A long document was read in {len(notes)} parts. These are the notes taken from each part, in order:
+
+{parts}
+
+Using these notes, please provide a comprehensive response to the document's request."""
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Agent Factory Bronze Tier - Task Classifier
+Scores every task type from one lowercased copy of the content. Each keyword
+is located with str.find on its stem (the prefix shared by its inflections),
+which runs at memory speed; only the positions found are checked with a small
+word-boundary regex, and each match adds its weight to its category. Keyword
+weights come from the "Classification Keywords" table in SKILL.md or a JSON
+config.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+
+# Categories in tie-break order (the order the original classifier checked them)
+DEFAULT_KEYWORDS = {
+    'Question': {'?': 1.0, 'what': 1.0, 'how': 1.0, 'why': 1.0, 'when': 1.0, 'where': 1.0},
+    'Analysis': {'analyze': 1.0, 'review': 1.0, 'examine': 1.0},
+    'Writing': {'write': 1.0, 'create': 1.0, 'generate': 1.0, 'draft': 1.0},
+    'Code': {'code': 1.0, 'function': 1.0, 'script': 1.0, 'program': 1.0},
+    'Calculation': {'calculate': 1.0, 'compute': 1.0, 'solve': 1.0},
+}
+DEFAULT_TYPE = 'General'
+
+_TABLE_ROW = re.compile(r'^\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*$')
+
+
+def is_word(term):
+    """Whether a term starts and ends with a word character (and needs word boundaries)."""
+    return term[:1].isalnum() and term[-1:].isalnum()
+
+
+def word_forms(keyword):
+    """Common inflections of a keyword ("analyze" -> analyzes, analyzed, analyzing)."""
+    forms = {keyword, keyword + 's', keyword + 'ing', keyword + 'ed'}
+    if keyword.endswith('e'):
+        forms |= {keyword + 'd', keyword[:-1] + 'ing'}
+    elif keyword.endswith(('s', 'sh', 'ch', 'x', 'z')):
+        forms.add(keyword + 'es')
+    return forms
+
+
+def trie_pattern(terms):
+    """Regex source matching any of `terms`, factored into a character trie."""
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            # A term ends here and longer terms continue; regex alternation is
+            # greedy left to right, so the longer match is preferred
+            return '(?:' + body + ')?' if len(branches) == 1 else body + '?'
+        return body
+
+    return build(trie)
+
+
+def term_pattern(terms):
+    """Regex matching any of `terms`: words need word boundaries, and
+    punctuation terms only count at the end of a sentence, so the "?" in a URL
+    query string is not a question."""
+    words = [t for t in terms if is_word(t)]
+    symbols = [re.escape(t) for t in terms if not is_word(t)]
+    patterns = [r'\b' + trie_pattern(words) + r'\b'] if words else []
+    patterns.extend(s + r'(?=\s|$)' for s in symbols)
+    return re.compile('|'.join(patterns) or r'(?!)')
+
+
+class Classifier:
+    """Single-pass, weighted keyword classifier."""
+
+    def __init__(self, keywords=None):
+        self.keywords = keywords or DEFAULT_KEYWORDS
+        self.categories = list(self.keywords)
+
+        # Every matchable (lowercase) term maps to (category, weight), and
+        # every term starts with its keyword's stem
+        self._terms = {}
+        stems = {}
+        for category, weights in self.keywords.items():
+            for keyword, weight in weights.items():
+                keyword = keyword.lower()
+                forms = word_forms(keyword) if keyword.isalnum() else {keyword}
+                for form in forms:
+                    self._terms.setdefault(form, (category, float(weight)))
+                stems.setdefault(os.path.commonprefix(sorted(forms)), set()).update(forms)
+        self._stems = [(stem, term_pattern(terms)) for stem, terms in stems.items()]
+
+    @classmethod
+    def from_skill(cls, skill_path):
+        """Load keyword weights from the "Classification Keywords" table in SKILL.md.
+
+        Rows look like `| Question | ?:2, what, how |`; a keyword without
+        `:weight` counts 1. Returns the default classifier if there is no table.
+        """
+        keywords = {}
+        in_section = False
+        for line in Path(skill_path).read_text(encoding='utf-8').splitlines():
+            if line.startswith('#'):
+                in_section = line.lstrip('#').strip().lower() == 'classification keywords'
+                continue
+            match = _TABLE_ROW.match(line.strip()) if in_section else None
+            if not match or set(match.group(2)) <= set('-: '):
+                continue
+            category, cell = match.groups()
+            if category.lower() in ('task type', 'category'):
+                continue
+            keywords[category] = parse_keywords(cell)
+        return cls(keywords or None)
+
+    @classmethod
+    def from_json(cls, config_path):
+        """Load `{"Category": {"keyword": weight, ...}, ...}` from a JSON file."""
+        with open(config_path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def scores(self, content):
+        """Weighted keyword score per category for `content`."""
+        text = content.lower()
+        find = text.find
+        matches = []
+        for stem, pattern in self._stems:
+            pos = find(stem)
+            while pos != -1:
+                match = pattern.match(text, pos)
+                if match:
+                    matches.append((pos, -match.end(), match.group()))
+                pos = find(stem, pos + 1)
+
+        # Terms never overlap: the longest match at the leftmost position wins
+        totals = dict.fromkeys(self.categories, 0.0)
+        terms = self._terms
+        end = 0
+        for start, neg_end, match in sorted(matches):
+            if start >= end:
+                category, weight = terms[match]
+                totals[category] += weight
+                end = -neg_end
+        return totals
+
+    def classify(self, content):
+        """Highest-scoring category; ties go to the earlier category, no match is General."""
+        totals = self.scores(content)
+        best = max(self.categories, key=lambda category: totals[category], default=None)
+        if best is None or totals[best] <= 0:
+            return DEFAULT_TYPE
+        return best
+
+
+def parse_keywords(cell):
+    """Parse "what, how:2, ?" into {'what': 1.0, 'how': 2.0, '?': 1.0}."""
+    weights = {}
+    for item in cell.split(','):
+        item = item.strip().strip('`')
+        if not item:
+            continue
+        keyword, _, weight = item.rpartition(':') if ':' in item[1:] else (item, '', '')
+        weights[keyword.strip().lower()] = float(weight) if weight else 1.0
+    return weights
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Agent Factory Bronze Tier - Content Index
+Persistent SHA-256 index of ingested files in Vault/.state/content.db, so an
+exact duplicate dropped in the Inbox is linked to the first task's result
+instead of becoming another Groq request. Lookups are primary-key hits, so
+they stay O(1) however large Done/ grows.
+
+Each digest maps to the first task's name in Needs_Action/ and, once the
+agent has finished it, its name in Done/. Duplicates that arrive while that
+task is still pending wait in Needs_Action/.duplicates/ and are linked into
+Done/ by the agent when the task completes.
+"""
+
+import hashlib
+
+from vault_io import StateDB
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(path, chunk_size=CHUNK_SIZE):
+    """SHA-256 hex digest of a file, read in fixed-size chunks."""
+    digest = hashlib.sha256()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(path, 'rb') as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            digest.update(view[:size])
+    return digest.hexdigest()
+
+
+class ContentIndex(StateDB):
+    """SQLite-backed digest -> task index shared by the watcher and agent."""
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS contents (
+            digest TEXT PRIMARY KEY,
+            filename TEXT NOT NULL,
+            done_filename TEXT
+        );
+        CREATE INDEX IF NOT EXISTS contents_filename ON contents (filename);
+        CREATE TABLE IF NOT EXISTS duplicates (
+            task_id INTEGER PRIMARY KEY,
+            digest TEXT NOT NULL,
+            filename TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS duplicates_digest ON duplicates (digest);
+    '''
+
+    def lookup(self, digest):
+        """(filename, done_filename) of the first task with this content, or None."""
+        with self._lock:
+            return self._conn.execute(
+                'SELECT filename, done_filename FROM contents WHERE digest = ?', (digest,)
+            ).fetchone()
+
+    def add(self, digest, filename):
+        """Register `filename` as the task for `digest` (replacing a stale entry)."""
+        self.add_many([(digest, filename)])
+
+    def add_many(self, entries):
+        """Register many (digest, filename) tasks in one transaction."""
+        with self._transaction() as conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO contents (digest, filename, done_filename) VALUES (?, ?, NULL)', entries
+            )
+
+    def add_duplicate(self, digest, task_id, filename):
+        """Park a duplicate until its original completes.
+
+        Returns the original's Done/ name if it completed in the meantime (the
+        duplicate is then not parked), otherwise None.
+        """
+        with self._transaction() as conn:
+            row = conn.execute('SELECT done_filename FROM contents WHERE digest = ?', (digest,)).fetchone()
+            if row is not None and row[0] is not None:
+                return row[0]
+            conn.execute('INSERT OR REPLACE INTO duplicates (task_id, digest, filename) VALUES (?, ?, ?)',
+                         (task_id, digest, filename))
+            return None
+
+    def rename(self, filename, new_filename):
+        """Follow a pending task to its new name in Needs_Action/."""
+        with self._transaction() as conn:
+            conn.execute(
+                'UPDATE contents SET filename = ? WHERE filename = ? AND done_filename IS NULL', (new_filename, filename)
+            )
+
+    def complete(self, filename, done_filename):
+        """Record that the task in `filename` reached Done/ as `done_filename`.
+
+        Returns the (task_id, filename) duplicates that were waiting for it.
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                'SELECT digest FROM contents WHERE filename = ? AND done_filename IS NULL', (filename,)
+            ).fetchone()
+            if row is None:
+                return []
+            conn.execute('UPDATE contents SET done_filename = ? WHERE digest = ?', (done_filename, row[0]))
+            waiting = conn.execute(
+                'SELECT task_id, filename FROM duplicates WHERE digest = ? ORDER BY task_id', (row[0],)
+            ).fetchall()
+            conn.execute('DELETE FROM duplicates WHERE digest = ?', (row[0],))
+            return waiting
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM contents').fetchone()[0]
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Agent Factory Bronze Tier - Watcher + Agent Daemon
+Runs the Inbox watcher and the File Triage Agent in one process. The watcher's
+InboxHandler pushes each file it moves to Needs_Action straight onto the
+agent's task queue, and both write through one Dashboard, so a task goes from
+Inbox to Done without a second process rediscovering it or re-rendering the
+dashboard separately. watcher.py and agent.py still run on their own.
+"""
+
+import argparse
+from pathlib import Path
+
+from watchdog.observers import Observer
+from colorama import Fore, Back, Style, init
+
+from agent import FileTriageAgent
+from jsonlog import enable_json_logs
+from metrics import add_observability_arguments, start_exporters
+from watcher import InboxHandler
+
+# Initialize colorama for Windows compatibility
+init(autoreset=True)
+
+
+class TriageDaemon:
+    """An InboxHandler feeding a FileTriageAgent's queue in-process."""
+
+    def __init__(self, agent, settle_time=1.0, poll_interval=0.2):
+        self.agent = agent
+        self.inbox_path = agent.base_path / "Vault" / "Inbox"
+        if not self.inbox_path.exists():
+            raise FileNotFoundError(f"Required path does not exist: {self.inbox_path}")
+        self.handler = InboxHandler(
+            self.inbox_path, agent.needs_action_path, agent.dashboard_path,
+            settle_time=settle_time, poll_interval=poll_interval,
+            dashboard=agent.dashboard, task_queue=agent.task_queue, content_index=agent.content_index,
+        )
+
+    def run(self, workers=4, interval=30, stop_event=None):
+        """Watch the Inbox and process tasks until Ctrl+C (or `stop_event` is set)."""
+        print(f"\n{Back.BLUE}{Fore.WHITE}{'=' * 60}{Style.RESET_ALL}")
+        print(f"{Back.BLUE}{Fore.WHITE}  Agent Factory Bronze Tier - Watcher + Agent Daemon  {Style.RESET_ALL}")
+        print(f"{Back.BLUE}{Fore.WHITE}{'=' * 60}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Watching: {Fore.WHITE}{self.inbox_path}{Style.RESET_ALL}")
+
+        # Watch all of Vault/ so the move of each ingested file out of the Inbox
+        # is seen as one paired event; watchdog holds an unpaired move-out for
+        # 0.5 s, stalling the events queued behind it. The handler ignores
+        # files outside the Inbox.
+        observer = Observer()
+        observer.schedule(self.handler, str(self.inbox_path.parent), recursive=True)
+        self.handler.process_existing_files()
+        self.handler.start()
+        observer.start()
+        try:
+            # Needs_Action is fed by the handler; the idle rescan still catches
+            # files dropped there directly
+            self.agent.run_workers(workers=workers, interval=interval, watch=False, stop_event=stop_event)
+        finally:
+            observer.stop()
+            observer.join()
+            self.handler.stop()
+            self.agent.dashboard.flush()
+
+
+def main():
+    """Main entry point for the daemon."""
+    parser = argparse.ArgumentParser(
+        description="Agent Factory Bronze Tier - Watcher + Agent Daemon"
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of concurrent workers (default: --max-inflight)'
+    )
+    parser.add_argument(
+        '--interval',
+        type=int,
+        default=30,
+        help='Idle rescan interval for files dropped straight into Needs_Action (default: 30)'
+    )
+    parser.add_argument(
+        '--max-inflight',
+        type=int,
+        default=None,
+        help='Maximum concurrent Groq API calls (default: MAX_INFLIGHT_REQUESTS or 4)'
+    )
+    parser.add_argument(
+        '--settle-time',
+        type=float,
+        default=1.0,
+        help='Seconds an Inbox file must stop changing before it is picked up (default: 1.0)'
+    )
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Answer several small .md/.txt files with one Groq request'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Stream responses into .md/.txt files as they are generated'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always call Groq instead of reusing cached responses'
+    )
+    parser.add_argument(
+        '--base-path',
+        type=Path,
+        default=Path(__file__).parent,
+        help='Folder holding Vault/ and skills/ (default: the daemon\'s folder)'
+    )
+    add_observability_arguments(parser)
+    args = parser.parse_args()
+    if args.log_format == 'json':
+        enable_json_logs()
+
+    agent = FileTriageAgent(args.base_path, max_inflight=args.max_inflight, use_cache=not args.no_cache,
+                            batch=args.batch, stream=args.stream)
+    daemon = TriageDaemon(agent, settle_time=args.settle_time)
+    exporters = start_exporters(args.metrics_port, args.metrics_file, args.metrics_interval)
+    try:
+        daemon.run(workers=args.workers or agent.max_inflight, interval=args.interval)
+    finally:
+        agent.close()
+        for exporter in exporters:
+            exporter.stop()
+
+
+if __name__ == "__main__":
+    main()
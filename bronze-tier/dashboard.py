@@ -0,0 +1,629 @@
+#!/usr/bin/env python3
+"""
+Agent Factory Bronze Tier - Dashboard State Store
+Task state lives in a small SQLite database (Vault/.state/dashboard.db) with
+O(1) status transitions. Vault/Dashboard.md is a rendered view of that store,
+re-rendered on a debounce so a burst of transitions causes a single write.
+Renders hold a cross-process file lock and replace the file atomically, so the
+watcher and agent processes never interleave or truncate each other's writes.
+Statistics are counters in the same database, updated in the transaction that
+changes each task's status, so a crash can never separate the two.
+Only the most recent rows stay in Dashboard.md; older completed rows move to
+monthly pages under Vault/Archive/ so the hot file stays a bounded size. Pages
+hold a fixed number of rows, so archiving a batch only rewrites the month's
+last page, however many tasks the month already archived.
+"""
+
+import atexit
+import os
+import re
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+from metrics import REGISTRY
+from vault_io import StateDB, atomic_write, claim_folders, file_lock
+
+SUPPORTED_EXTENSIONS = {'.md', '.txt', '.docx'}
+
+# Which statistics card each task status counts towards
+STATUS_COUNTERS = {'Pending': 'pending', 'Processing': 'pending', 'Completed': 'completed', 'Error': 'errors'}
+
+
+# ----------------------------------------------------------------------
+# View templates (HTML/CSS Dashboard, see DOCS/CHANGELOG.md v3.0.0)
+# ----------------------------------------------------------------------
+
+BADGE_STYLES = {
+    'Completed': ('#10b981 0%, #059669 100%', '16, 185, 129'),
+    'Pending': ('#f59e0b 0%, #d97706 100%', '245, 158, 11'),
+    'Error': ('#ef4444 0%, #dc2626 100%', '239, 68, 68'),
+    'Processing': ('#06b6d4 0%, #0891b2 100%', '6, 182, 212'),
+}
+
+STAT_CARDS = [
+    ('Total Tasks', '99, 102, 241', '#6366f1'),
+    ('Completed', '16, 185, 129', '#10b981'),
+    ('Pending', '245, 158, 11', '#f59e0b'),
+    ('Errors', '239, 68, 68', '#ef4444'),
+]
+
+TABLE_COLUMNS = [('S.NO', 'center'), ('Task Name', 'left'), ('Status', 'center'),
+                 ('Date', 'center'), ('Time', 'center'), ('Link', 'left')]
+
+HEADER = '''# 📊 Agent Factory Dashboard
+
+<div style="background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 50%, #d946ef 100%); padding: 40px; border-radius: 16px; color: white; margin-bottom: 30px; box-shadow: 0 8px 32px rgba(99, 102, 241, 0.4);">
+  <h2 style="margin: 0; color: white; font-size: 32px; font-weight: 700;">Task Management Center</h2>
+  <p style="margin: 8px 0 0 0; opacity: 0.95; font-size: 16px;">Real-time tracking of all file processing tasks</p>
+</div>
+
+---
+
+## 📈 Statistics
+
+'''
+
+TABLE_HEADER = '''---
+
+## 📋 Task Summary
+
+<div style="background: #1e293b; border-radius: 16px; overflow: hidden; box-shadow: 0 4px 24px rgba(0, 0, 0, 0.4); border: 1px solid rgba(99, 102, 241, 0.2); margin: 20px 0;">
+  <div style="background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%); padding: 20px 30px;">
+    <h3 style="margin: 0; color: white; font-size: 20px; font-weight: 600;">All Tasks</h3>
+  </div>
+
+<table style="width: 100%; border-collapse: collapse; background: #1e293b;">
+  <thead>
+    <tr style="background: #0f172a;">
+'''
+
+LEGEND_HEADER = '''---
+
+## 🎯 Status Legend
+
+<div style="display: flex; flex-wrap: wrap; gap: 15px; margin: 30px 0; padding: 25px; background: #1e293b; border-radius: 16px; border: 1px solid rgba(99, 102, 241, 0.2);">
+'''
+
+# Matches one task row of a Dashboard.md written by the pre-store scripts
+LEGACY_ROW = re.compile(
+    r'<td style="[^"]*font-weight: 700; color: #6366f1; font-size: 16px;">(\d+)</td>\s*'
+    r'<td style="[^"]*">([^<]*)</td>\s*'
+    r'<td style="[^"]*">\s*<span style="[^"]*">([^<]*)</span>\s*</td>\s*'
+    r'<td style="[^"]*">([^<]*)</td>\s*'
+    r'<td style="[^"]*">([^<]*)</td>\s*'
+    r'<td style="[^"]*"><a href="([^"/]+)/([^"]+)"',
+    re.DOTALL
+)
+
+
+def status_badge(status):
+    """Render the colored status pill for a task status."""
+    gradient, shadow = BADGE_STYLES.get(status, BADGE_STYLES['Pending'])
+    return (
+        f'<span style="background: linear-gradient(135deg, {gradient}); color: white; padding: 6px 16px; '
+        f'border-radius: 20px; font-size: 12px; font-weight: 600; text-transform: uppercase; '
+        f'letter-spacing: 0.5px; box-shadow: 0 2px 8px rgba({shadow}, 0.4);">{status}</span>'
+    )
+
+
+def render_row(sno, name, status, date, time, folder, filename):
+    """Render one <tr> of the task table."""
+    # Odd rows: no background, Even rows: rgba(15, 23, 42, 0.5)
+    if sno % 2 == 0:
+        row_style = 'background: rgba(15, 23, 42, 0.5); border-bottom: 1px solid rgba(99, 102, 241, 0.1);'
+    else:
+        row_style = 'border-bottom: 1px solid rgba(99, 102, 241, 0.1);'
+
+    return f'''    <tr style="{row_style}">
+      <td style="padding: 16px; text-align: center; font-weight: 700; color: #6366f1; font-size: 16px;">{sno}</td>
+      <td style="padding: 16px; color: #e4e6eb; font-size: 14px;">{name}</td>
+      <td style="padding: 16px; text-align: center;">
+        {status_badge(status)}
+      </td>
+      <td style="padding: 16px; text-align: center; color: #9ca3af; font-size: 14px;">{date}</td>
+      <td style="padding: 16px; text-align: center; color: #9ca3af; font-size: 14px;">{time}</td>
+      <td style="padding: 16px;"><a href="{folder}/{filename}" style="color: #6366f1; text-decoration: none; font-weight: 500; font-size: 14px;">📄 {folder}/{filename}</a></td>
+    </tr>
+'''
+
+
+def render_stats(stats):
+    """Render the four statistics cards."""
+    values = {
+        'Total Tasks': stats.get('total', 0),
+        'Completed': stats.get('completed', 0),
+        'Pending': stats.get('pending', 0),
+        'Errors': stats.get('errors', 0),
+    }
+    cards = []
+    for label, border, accent in STAT_CARDS:
+        cards.append(
+            f'  <div style="flex: 1; min-width: 200px; background: linear-gradient(135deg, #1e293b 0%, #0f172a 100%); padding: 30px; border-radius: 16px; color: white; text-align: center; border: 1px solid rgba({border}, 0.3); box-shadow: 0 4px 24px rgba(0, 0, 0, 0.4); border-top: 3px solid {accent};">\n'
+            f'    <h3 style="margin: 0; font-size: 48px; font-weight: 700; background: linear-gradient(135deg, #e4e6eb 0%, #9ca3af 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">{values[label]}</h3>\n'
+            f'    <p style="margin: 8px 0 0 0; opacity: 0.7; font-size: 14px; text-transform: uppercase; letter-spacing: 1px; font-weight: 500;">{label}</p>\n'
+            f'  </div>\n'
+        )
+    return '<div style="display: flex; gap: 20px; margin: 30px 0; flex-wrap: wrap;">\n' + ''.join(cards) + '</div>\n\n'
+
+
+def render_table(rows, title, link_prefix=''):
+    """Render the task table card (title bar, header row and task rows)."""
+    parts = [TABLE_HEADER.replace('>All Tasks<', f'>{title}<')]
+    for label, align in TABLE_COLUMNS:
+        parts.append(
+            f'      <th style="padding: 16px; text-align: {align}; font-weight: 600; font-size: 13px; text-transform: uppercase; letter-spacing: 0.5px; color: #9ca3af; border-bottom: 2px solid rgba(99, 102, 241, 0.3);">{label}</th>\n'
+        )
+    parts.append('    </tr>\n  </thead>\n  <tbody>\n')
+    parts.extend(
+        render_row(sno, name, status, date, time, link_prefix + folder, filename)
+        for sno, name, status, date, time, folder, filename in rows
+    )
+    parts.append('  </tbody>\n</table>\n</div>\n\n')
+    return ''.join(parts)
+
+
+def render_archive_note(archived_count):
+    """Render the pointer from Dashboard.md to the archive index."""
+    return (
+        '<p style="margin: 0 0 20px 0; color: #9ca3af; font-size: 14px;">'
+        f'🗄️ {archived_count} older completed task(s) are in the '
+        '<a href="Archive/index.md" style="color: #6366f1; text-decoration: none; font-weight: 500;">Archive</a></p>\n\n'
+    )
+
+
+def archive_page_name(month, page):
+    """File name of a month's archive page: Dashboard-YYYY-MM.md, then Dashboard-YYYY-MM-2.md, ..."""
+    return f'Dashboard-{month}.md' if page == 1 else f'Dashboard-{month}-{page}.md'
+
+
+def render_archive_page(month, page, rows):
+    """Render one Vault/Archive/Dashboard-YYYY-MM[-N].md page."""
+    title = month if page == 1 else f'{month} (page {page})'
+    return (
+        f'# 🗄️ Dashboard Archive - {title}\n\n'
+        '[← Archive index](index.md) · [Dashboard](../Dashboard.md)\n\n'
+        + render_table(rows, f'Completed Tasks - {title}', link_prefix='../')
+    )
+
+
+def render_archive_index(pages):
+    """Render Vault/Archive/index.md from (month, page, task count) rows."""
+    months = {}
+    for month, page, count in pages:
+        months.setdefault(month, []).append((page, count))
+    lines = ['# 🗄️ Dashboard Archive\n\n', '[← Dashboard](../Dashboard.md)\n\n',
+             '| Month | Completed Tasks |\n', '|-------|-----------------|\n']
+    for month in sorted(months, reverse=True):
+        month_pages = sorted(months[month])
+        links = [f'[{month}]({archive_page_name(month, 1)})'] + [
+            f'[{page}]({archive_page_name(month, page)})' for page, _ in month_pages if page > 1]
+        lines.append(f'| {" · ".join(links)} | {sum(count for _, count in month_pages)} |\n')
+    return ''.join(lines)
+
+
+def render_dashboard(rows, stats, last_updated, archived_count=0):
+    """Render the complete Dashboard.md from task rows and statistics."""
+    parts = [HEADER, render_stats(stats), render_table(rows, 'All Tasks')]
+    if archived_count:
+        parts.append(render_archive_note(archived_count))
+
+    parts.append(LEGEND_HEADER)
+    for status in ('Completed', 'Pending', 'Error', 'Processing'):
+        parts.append(f'  {status_badge(status)}\n')
+    parts.append('</div>\n\n---\n\n')
+
+    parts.append(
+        '<div style="background: #1e293b; padding: 25px 30px; border-radius: 16px; border-left: 4px solid #6366f1; margin-top: 30px; border: 1px solid rgba(99, 102, 241, 0.2);">\n'
+        f'  <p style="margin: 8px 0; color: #9ca3af; font-size: 14px;"><strong style="color: #e4e6eb;">Last Updated:</strong> {last_updated}</p>\n'
+        '  <p style="margin: 8px 0; color: #9ca3af; font-size: 14px;"><strong style="color: #e4e6eb;">System Status:</strong> <span style="color: #10b981; font-weight: 600;">● Operational</span></p>\n'
+        '</div>'
+    )
+    return ''.join(parts)
+
+
+# ----------------------------------------------------------------------
+# State store
+# ----------------------------------------------------------------------
+
+class TaskStore(StateDB):
+    """SQLite-backed task table shared by the watcher and agent processes."""
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS tasks (
+            sno INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            filename TEXT NOT NULL,
+            folder TEXT NOT NULL,
+            status TEXT NOT NULL,
+            date TEXT NOT NULL,
+            time TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS tasks_filename ON tasks (filename, folder);
+        CREATE TABLE IF NOT EXISTS archive_pages (
+            month TEXT NOT NULL,
+            page INTEGER NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (month, page)
+        );
+        CREATE TABLE IF NOT EXISTS counters (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        );
+    '''
+
+    KEYS = ('total', 'completed', 'pending', 'errors')
+
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        # Check and migrate under one write lock: the watcher and agent may start together
+        with self._transaction() as conn:
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(tasks)')}
+            if 'archived' not in columns:
+                conn.execute('ALTER TABLE tasks ADD COLUMN archived INTEGER NOT NULL DEFAULT 0')
+            if 'archive_month' not in columns:
+                conn.execute('ALTER TABLE tasks ADD COLUMN archive_month TEXT')
+                conn.execute('ALTER TABLE tasks ADD COLUMN archive_page INTEGER')
+                # Rows archived before pages were split all sit on their month's first page
+                conn.execute("UPDATE tasks SET archive_month = substr(date, 1, 7), archive_page = 1 WHERE archived = 1")
+                conn.execute('INSERT OR REPLACE INTO archive_pages (month, page, count) '
+                             'SELECT archive_month, 1, COUNT(*) FROM tasks WHERE archived = 1 GROUP BY archive_month')
+            if conn.execute('SELECT 1 FROM counters LIMIT 1').fetchone() is None:
+                # Every committed row is visible here, and later writes bump the counters themselves
+                conn.executemany('INSERT INTO counters (key, value) VALUES (?, ?)',
+                                 self._tally(conn).items())
+        # Keeps the hot-window queries independent of how many rows were archived
+        self._conn.execute('CREATE INDEX IF NOT EXISTS tasks_hot ON tasks (status, sno) WHERE archived = 0')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS tasks_archive ON tasks (archive_month, archive_page, sno) '
+                           'WHERE archived = 1')
+
+    def is_empty(self):
+        with self._lock:
+            return self._conn.execute('SELECT 1 FROM tasks LIMIT 1').fetchone() is None
+
+    def import_rows(self, rows):
+        """Bulk-insert (sno, name, status, date, time, folder, filename) rows."""
+        with self._transaction() as conn:
+            for row in rows:
+                inserted = conn.execute(
+                    'INSERT OR IGNORE INTO tasks (sno, name, status, date, time, folder, filename) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    row
+                ).rowcount
+                if inserted:
+                    self._count(conn, None, row[2])
+
+    def add_task(self, name, filename, status='Pending', folder='Needs_Action'):
+        """Insert a new task row and return its S.NO."""
+        now = datetime.now()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                'INSERT INTO tasks (name, filename, folder, status, date, time) VALUES (?, ?, ?, ?, ?, ?)',
+                (name, filename, folder, status, now.strftime("%Y-%m-%d"), now.strftime("%H:%M:%S"))
+            )
+            self._count(conn, None, status)
+            return cursor.lastrowid
+
+    def add_tasks(self, tasks, status='Pending', folder='Needs_Action'):
+        """Insert many (name, filename) tasks in one transaction; return their S.NOs."""
+        now = datetime.now()
+        date, time = now.strftime("%Y-%m-%d"), now.strftime("%H:%M:%S")
+        with self._transaction() as conn:
+            snos = [
+                conn.execute(
+                    'INSERT INTO tasks (name, filename, folder, status, date, time) VALUES (?, ?, ?, ?, ?, ?)',
+                    (name, filename, folder, status, date, time)
+                ).lastrowid
+                for name, filename in tasks
+            ]
+            self._count(conn, None, status, len(snos))
+            return snos
+
+    def set_status(self, task_id, status, filename=None, folder=None):
+        """Move a task (by S.NO) to a new status with a primary-key lookup.
+
+        Returns the previous status, or None if no such task exists.
+        """
+        now = datetime.now()
+        with self._transaction() as conn:
+            row = conn.execute('SELECT status FROM tasks WHERE sno = ?', (task_id,)).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                'UPDATE tasks SET status = ?, date = ?, time = ?, '
+                'filename = COALESCE(?, filename), folder = COALESCE(?, folder) WHERE sno = ?',
+                (status, now.strftime("%Y-%m-%d"), now.strftime("%H:%M:%S"), filename, folder, task_id)
+            )
+            self._count(conn, row[0], status)
+            return row[0]
+
+    def find_task(self, filename, folder='Needs_Action'):
+        """Return the S.NO of the newest task for a file in `folder`, or None.
+
+        Filenames are unique within a folder at any moment, so this cannot
+        confuse report.md with report.txt the way a stem lookup would.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT MAX(sno) FROM tasks WHERE filename = ? AND folder = ?', (filename, folder)
+            ).fetchone()
+        return row[0]
+
+    def active_statuses(self, folder='Needs_Action'):
+        """Map each filename in `folder` to the status of its newest task."""
+        with self._lock:
+            return dict(self._conn.execute(
+                'SELECT filename, status FROM tasks WHERE sno IN '
+                '(SELECT MAX(sno) FROM tasks WHERE folder = ? GROUP BY filename)',
+                (folder,)
+            ))
+
+    def rows(self):
+        """Return the non-archived rows in S.NO order, shaped for `render_row`."""
+        with self._lock:
+            return self._conn.execute(
+                'SELECT sno, name, status, date, time, folder, filename FROM tasks '
+                'WHERE archived = 0 ORDER BY sno'
+            ).fetchall()
+
+    def archive_completed(self, keep, threshold, page_rows):
+        """Mark all but the newest `keep` completed rows archived.
+
+        Nothing happens until more than `threshold` completed rows are
+        unarchived, so archive pages are rewritten in batches rather than on
+        every render. Each month's rows fill pages of `page_rows` in order.
+        Returns the set of (YYYY-MM, page) pages that gained rows.
+        """
+        with self._transaction() as conn:
+            (count,) = conn.execute(
+                "SELECT COUNT(*) FROM tasks WHERE archived = 0 AND status = 'Completed'"
+            ).fetchone()
+            if count <= threshold:
+                return set()
+            rows = conn.execute(
+                "SELECT sno, substr(date, 1, 7) FROM tasks WHERE archived = 0 AND status = 'Completed' "
+                "ORDER BY sno LIMIT ?",
+                (count - keep,)
+            ).fetchall()
+
+            last_pages, counts, updates = {}, {}, []
+            for sno, month in rows:
+                if month not in last_pages:
+                    last_pages[month] = conn.execute(
+                        'SELECT page, count FROM archive_pages WHERE month = ? ORDER BY page DESC LIMIT 1', (month,)
+                    ).fetchone() or (1, 0)
+                page, filled = last_pages[month]
+                if filled >= page_rows:
+                    page, filled = page + 1, 0
+                last_pages[month] = (page, filled + 1)
+                counts[(month, page)] = filled + 1
+                updates.append((month, page, sno))
+
+            conn.executemany('UPDATE tasks SET archived = 1, archive_month = ?, archive_page = ? WHERE sno = ?',
+                             updates)
+            conn.executemany(
+                'INSERT INTO archive_pages (month, page, count) VALUES (?, ?, ?) '
+                'ON CONFLICT (month, page) DO UPDATE SET count = excluded.count',
+                [(month, page, filled) for (month, page), filled in counts.items()]
+            )
+        return set(counts)
+
+    def archived_rows(self, month, page):
+        """Return the rows on one archive page, in S.NO order."""
+        with self._lock:
+            return self._conn.execute(
+                'SELECT sno, name, status, date, time, folder, filename FROM tasks '
+                'WHERE archived = 1 AND archive_month = ? AND archive_page = ? ORDER BY sno',
+                (month, page)
+            ).fetchall()
+
+    def archive_pages(self):
+        """Return (YYYY-MM, page, archived task count) rows."""
+        with self._lock:
+            return self._conn.execute('SELECT month, page, count FROM archive_pages').fetchall()
+
+    def archived_count(self):
+        """Total archived tasks, summed over the pages (not the task table)."""
+        with self._lock:
+            return self._conn.execute('SELECT COALESCE(SUM(count), 0) FROM archive_pages').fetchone()[0]
+
+    def stats(self):
+        """Count tasks by status with a full table scan (for checking the counters)."""
+        with self._lock:
+            return self._tally(self._conn)
+
+    def counters(self):
+        """Return the statistics counters maintained alongside every write."""
+        with self._lock:
+            counters = dict(self._conn.execute('SELECT key, value FROM counters'))
+        return {key: counters.get(key, 0) for key in self.KEYS}
+
+    def set_counters(self, stats):
+        """Replace the counters (used by `--recount`)."""
+        with self._transaction() as conn:
+            conn.executemany('INSERT OR REPLACE INTO counters (key, value) VALUES (?, ?)',
+                             [(key, stats.get(key, 0)) for key in self.KEYS])
+
+    @staticmethod
+    def _tally(conn):
+        counts = dict(conn.execute('SELECT status, COUNT(*) FROM tasks GROUP BY status'))
+        stats = {'total': sum(counts.values()), 'completed': 0, 'pending': 0, 'errors': 0}
+        for status, count in counts.items():
+            stats[STATUS_COUNTERS.get(status, 'pending')] += count
+        return stats
+
+    @staticmethod
+    def _count(conn, old_status, new_status, count=1):
+        """Apply `count` transitions to the counters inside the caller's transaction.
+
+        An old_status of None means brand new tasks.
+        """
+        deltas = Counter()
+        if old_status is None:
+            deltas['total'] += count
+        else:
+            deltas[STATUS_COUNTERS.get(old_status, 'pending')] -= count
+        deltas[STATUS_COUNTERS.get(new_status, 'pending')] += count
+        conn.executemany('UPDATE counters SET value = value + ? WHERE key = ?',
+                         [(delta, key) for key, delta in deltas.items() if delta])
+
+
+class Dashboard:
+    """Task state transitions with a debounced Dashboard.md view."""
+
+    def __init__(self, dashboard_path, state_path=None, debounce=0.5, max_rows=None, archive_batch=None,
+                 archive_page_rows=None):
+        self.dashboard_path = Path(dashboard_path)
+        self.archive_path = self.dashboard_path.parent / "Archive"
+        state_path = Path(state_path) if state_path else self.dashboard_path.parent / ".state"
+        self.store = TaskStore(state_path / "dashboard.db")
+        self.lock_path = state_path / "dashboard.lock"
+        self.debounce = debounce
+        self.max_rows = max_rows or int(os.getenv("DASHBOARD_MAX_ROWS", "50"))
+        self.archive_batch = archive_batch or int(os.getenv("DASHBOARD_ARCHIVE_BATCH", "50"))
+        self.archive_page_rows = archive_page_rows or int(os.getenv("DASHBOARD_ARCHIVE_PAGE_ROWS", "500"))
+
+        self._timer = None
+        self._timer_lock = threading.Lock()
+        self.renders = 0
+
+        if self.store.is_empty():
+            self._import_legacy_dashboard()
+
+        atexit.register(self.flush)
+
+    def _import_legacy_dashboard(self):
+        """Seed an empty store from the rows of an existing Dashboard.md (one-time)."""
+        if not self.dashboard_path.exists():
+            return
+        with open(self.dashboard_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        rows = [
+            (int(sno), name.strip(), status.strip(), date.strip(), time.strip(), folder, filename)
+            for sno, name, status, date, time, folder, filename in LEGACY_ROW.findall(content)
+        ]
+        if rows:
+            self.store.import_rows(rows)
+
+    def add_task(self, task_name, filename, status="Pending"):
+        """Record a new task (Pending in Needs_Action, or Completed in Done) and return its task ID."""
+        folder = "Done" if status == "Completed" else "Needs_Action"
+        sno = self.store.add_task(task_name, filename, status, folder)
+        self.schedule_render()
+        return sno
+
+    def add_tasks(self, tasks):
+        """Record many (task_name, filename) Pending tasks with one commit and render."""
+        snos = self.store.add_tasks(tasks)
+        if snos:
+            self.schedule_render()
+        return snos
+
+    def find_task(self, filename):
+        """Return the task ID of the file currently in Needs_Action, or None."""
+        return self.store.find_task(filename)
+
+    def update_status(self, task_id, new_status, filename=None):
+        """Transition a task to a new status (Completed tasks link to Done/)."""
+        folder = "Done" if new_status == "Completed" else "Needs_Action"
+        old_status = self.store.set_status(task_id, new_status, filename, folder)
+        self.schedule_render()
+        return old_status
+
+    def schedule_render(self):
+        """Render once `debounce` seconds after the first of a burst of changes."""
+        if self.debounce <= 0:
+            self.render()
+            return
+        with self._timer_lock:
+            if self._timer is None:
+                self._timer = threading.Timer(self.debounce, self._timer_fired)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _timer_fired(self):
+        with self._timer_lock:
+            self._timer = None
+        self.render()
+
+    def flush(self):
+        """Render immediately if a debounced render is pending."""
+        with self._timer_lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+            self.render()
+
+    def render(self):
+        """Write Dashboard.md from the current store contents.
+
+        The snapshot is read while holding the lock, so every transition
+        committed by any process before the lock was taken lands in this
+        write, and a later render can never be overwritten by an older one.
+        """
+        with REGISTRY.stage('dashboard_render'), file_lock(self.lock_path):
+            archived_count = self._archive_completed()
+            content = render_dashboard(
+                self.store.rows(),
+                self.store.counters(),
+                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                archived_count,
+            )
+            atomic_write(self.dashboard_path, content)
+        self.renders += 1
+        REGISTRY.inc('triage_dashboard_writes_total')
+        REGISTRY.inc('triage_dashboard_bytes_total', len(content.encode('utf-8')))
+
+    def _archive_completed(self):
+        """Move old completed rows to monthly archive pages (lock must be held).
+
+        Only the pages that gained rows are rewritten, and each holds at most
+        `archive_page_rows` rows (pages archived before the split may hold
+        more). Returns the total number of archived tasks.
+        """
+        pages = self.store.archive_completed(
+            keep=self.max_rows, threshold=self.max_rows + self.archive_batch, page_rows=self.archive_page_rows
+        )
+        if pages:
+            self.archive_path.mkdir(exist_ok=True)
+            for month, page in pages:
+                atomic_write(
+                    self.archive_path / archive_page_name(month, page),
+                    render_archive_page(month, page, self.store.archived_rows(month, page)),
+                )
+            atomic_write(self.archive_path / "index.md", render_archive_index(self.store.archive_pages()))
+        return self.store.archived_count()
+
+    def recount(self, vault_path):
+        """Rebuild the statistics from the Vault folders in one scan each.
+
+        Files in Done/ count as Completed; files in Needs_Action/ (including
+        in-flight claims and parked duplicates) count as Errors if their task last failed, otherwise
+        Pending. Returns the rebuilt counters.
+        """
+        vault_path = Path(vault_path)
+        statuses = self.store.active_statuses()
+        stats = {'total': 0, 'completed': 0, 'pending': 0, 'errors': 0}
+
+        def supported_files(folder):
+            if not folder.exists():
+                return
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_file() and os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS:
+                        yield entry.name
+
+        stats['completed'] = sum(1 for _ in supported_files(vault_path / "Done"))
+        needs_action = vault_path / "Needs_Action"
+        for folder in (needs_action, *claim_folders(needs_action / ".processing"), needs_action / ".duplicates"):
+            for name in supported_files(folder):
+                if statuses.get(name) == "Error":
+                    stats['errors'] += 1
+                else:
+                    stats['pending'] += 1
+        stats['total'] = stats['completed'] + stats['pending'] + stats['errors']
+
+        self.store.set_counters(stats)
+        self.render()
+        return stats
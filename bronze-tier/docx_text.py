@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Agent Factory Bronze Tier - Fast .docx Text Extraction
+Streams word/document.xml out of the .docx zip with an incremental XML parser
+and collects paragraph and table text in one pass, clearing each top-level
+block once it is read. No python-docx object model is built; python-docx is
+only needed to write the response back into the document.
+"""
+
+import zipfile
+from xml.etree.ElementTree import iterparse
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_MC = '{http://schemas.openxmlformats.org/markup-compatibility/2006}'
+
+BODY, PARAGRAPH, TABLE, ROW, CELL = _W + 'body', _W + 'p', _W + 'tbl', _W + 'tr', _W + 'tc'
+TEXT, TAB, BREAK, CARRIAGE, HYPHEN = _W + 't', _W + 'tab', _W + 'br', _W + 'cr', _W + 'noBreakHyphen'
+FALLBACK = _MC + 'Fallback'
+
+# Table cells are joined with this separator, one line per row
+CELL_SEPARATOR = ' | '
+
+
+def extract_docx_text(path):
+    """Text of a .docx: one line per paragraph (as python-docx's `paragraph.text`)
+    and one line per table row, in document order."""
+    with zipfile.ZipFile(path) as package:
+        with package.open('word/document.xml') as stream:
+            return '\n'.join(_iter_lines(stream))
+
+
+def _iter_lines(stream):
+    body = None
+    paragraphs = []      # run text of each open paragraph (textboxes nest them)
+    containers = [[]]    # finished paragraph lines go to the innermost cell, or the body
+    rows = []            # cells of each open table row (tables can nest)
+    fallback = 0         # inside mc:Fallback, a duplicate of the mc:Choice content
+
+    for event, elem in iterparse(stream, events=('start', 'end')):
+        tag = elem.tag
+        if event == 'start':
+            if tag == PARAGRAPH:
+                paragraphs.append([])
+            elif tag == CELL:
+                containers.append([])
+            elif tag == ROW:
+                rows.append([])
+            elif tag == FALLBACK:
+                fallback += 1
+            elif tag == BODY:
+                body = elem
+            continue
+
+        if tag == TEXT:
+            if paragraphs and not fallback:
+                paragraphs[-1].append(elem.text or '')
+        elif tag == TAB:
+            # w:tab also appears in paragraph tab stops (w:tabs), outside any run
+            if paragraphs and not fallback and elem.get(_W + 'val') is None:
+                paragraphs[-1].append('\t')
+        elif tag in (BREAK, CARRIAGE):
+            if paragraphs and not fallback and elem.get(_W + 'type') in (None, 'textWrapping'):
+                paragraphs[-1].append('\n')
+        elif tag == HYPHEN:
+            if paragraphs and not fallback:
+                paragraphs[-1].append('-')
+        elif tag == PARAGRAPH:
+            containers[-1].append(''.join(paragraphs.pop()))
+        elif tag == CELL:
+            lines = containers.pop()
+            rows[-1].append(' '.join(line for line in lines if line))
+        elif tag == ROW:
+            cells = rows.pop()
+            if any(cells):
+                containers[-1].append(CELL_SEPARATOR.join(cells))
+        elif tag == FALLBACK:
+            fallback -= 1
+
+        # A top-level block is complete: hand its lines out and free its subtree
+        if tag in (PARAGRAPH, TABLE) and not paragraphs and not rows:
+            yield from containers[0]
+            containers[0].clear()
+            if body is not None:
+                body.clear()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Agent Factory Bronze Tier - Task Journal
+Write-ahead record of how far each claimed task got, in
+Vault/.state/journal.db. Once a response exists it is journaled (with the
+response text) before the file is touched, and again once it has been written
+into the file. If the agent dies before the move to Done/, the next start
+finishes the task from the journal instead of calling Groq again and
+appending a second response. The name a task is given in Done/ is journaled
+before the move, so a task that got there under a new name (report-2.md) is
+still recognised. Finished tasks are deleted, so recovery only
+reads the unfinished entries.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from vault_io import StateDB
+
+# Stages, in order; a task leaves the journal once it is in Done/
+RESPONDED = 'responded'   # response generated, not yet written into the file
+UPDATED = 'updated'       # response written into the file, not yet moved to Done/
+
+
+@dataclass
+class JournalEntry:
+    """An unfinished task: its claimed file name and the last completed stage."""
+    name: str
+    stage: str
+    task_id: Optional[int]
+    task_type: Optional[str]
+    response: Optional[str]
+    size: Optional[int]
+    done_name: Optional[str] = None
+
+
+class TaskJournal(StateDB):
+    """SQLite-backed journal of task stages, durable on every commit."""
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS journal (
+            name TEXT PRIMARY KEY,
+            stage TEXT NOT NULL,
+            task_id INTEGER,
+            task_type TEXT,
+            response TEXT,
+            size INTEGER,
+            done_name TEXT,
+            updated REAL NOT NULL
+        );
+    '''
+
+    # A stage is on disk before the file operation it guards starts
+    SYNCHRONOUS = 'FULL'
+
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        # Journals written before done_name was tracked
+        with self._transaction() as conn:
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(journal)')}
+            if 'done_name' not in columns:
+                conn.execute('ALTER TABLE journal ADD COLUMN done_name TEXT')
+
+    def record(self, name, stage, task_id=None, task_type=None, response=None, size=None):
+        """Note that `name` completed `stage`; earlier fields are kept unless given again.
+
+        `size` is the file's size after the stage, used to tell a resumable
+        file from a new one that reuses the name.
+        """
+        with self._lock:
+            self._conn.execute(
+                'INSERT INTO journal (name, stage, task_id, task_type, response, size, updated) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (name) DO UPDATE SET stage = excluded.stage, '
+                'task_id = COALESCE(excluded.task_id, task_id), '
+                'task_type = COALESCE(excluded.task_type, task_type), '
+                'response = COALESCE(excluded.response, response), '
+                'size = excluded.size, updated = excluded.updated',
+                (name, stage, task_id, task_type, response, size, time.time())
+            )
+
+    def get(self, name):
+        """The unfinished entry for `name`, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT name, stage, task_id, task_type, response, size, done_name FROM journal WHERE name = ?',
+                (name,)
+            ).fetchone()
+        return JournalEntry(*row) if row else None
+
+    def pending(self):
+        """All unfinished entries, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT name, stage, task_id, task_type, response, size, done_name FROM journal ORDER BY updated'
+            ).fetchall()
+        return [JournalEntry(*row) for row in rows]
+
+    def set_done_name(self, name, done_name):
+        """Note the name in Done/ that `name` is about to be moved to."""
+        with self._lock:
+            self._conn.execute('UPDATE journal SET done_name = ? WHERE name = ?', (done_name, name))
+
+    def rename(self, old_name, new_name):
+        """Carry an unfinished entry over to a task's new file name."""
+        with self._lock:
+            self._conn.execute('UPDATE journal SET name = ? WHERE name = ?', (new_name, old_name))
+
+    def finish(self, name):
+        """Drop the entry for a task that is done (or abandoned)."""
+        with self._lock:
+            self._conn.execute('DELETE FROM journal WHERE name = ?', (name,))
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM journal').fetchone()[0]
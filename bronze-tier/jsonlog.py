@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Agent Factory Bronze Tier - JSON-Lines Log Mode
+For headless runs, replaces the colorama console output with one JSON object
+per line. `enable_json_logs()` swaps `sys.stdout` for a writer that strips ANSI
+colors and turns each printed line into `{"ts", "level", "thread", "tag",
+"msg"}` (the tag is the leading `[OK]`/`[X]`/`[RETRY]` marker); banners and
+blank lines are dropped. `log_event()` adds structured events, such as the
+per-task stage timings, which are only emitted in this mode.
+"""
+
+import json
+import re
+import sys
+import threading
+from datetime import datetime
+
+_ANSI = re.compile(r'\x1b\[[0-9;]*[A-Za-z]')
+_TAG = re.compile(r'^\[([^\]]+)\]\s*')
+_ERROR_TAGS = {'X'}
+_WARNING_TAGS = {'!', 'RETRY', 'SKIP', 'STOP', 'EMPTY'}
+
+_writer = None
+
+
+class JsonLinesWriter:
+    """File-like stdout replacement that emits each completed line as JSON."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def write(self, text):
+        # print() writes the message and the newline separately, so buffer per thread
+        buffer = getattr(self._local, 'buffer', '') + text
+        *lines, self._local.buffer = buffer.split('\n')
+        for line in lines:
+            self._emit_line(line)
+        return len(text)
+
+    def flush(self):
+        with self._lock:
+            self.stream.flush()
+
+    def isatty(self):
+        return False
+
+    def _emit_line(self, line):
+        line = _ANSI.sub('', line).strip()
+        if not line or not line.strip('=-_ '):
+            return
+        record = {'ts': datetime.now().isoformat(timespec='milliseconds'),
+                  'level': 'info', 'thread': threading.current_thread().name}
+        tag = _TAG.match(line)
+        if tag:
+            record['tag'] = tag.group(1)
+            line = line[tag.end():]
+            if tag.group(1) in _ERROR_TAGS:
+                record['level'] = 'error'
+            elif tag.group(1) in _WARNING_TAGS:
+                record['level'] = 'warning'
+        record['msg'] = line
+        self.emit(record)
+
+    def emit(self, record):
+        with self._lock:
+            self.stream.write(json.dumps(record, default=str) + '\n')
+            self.stream.flush()
+
+
+def enable_json_logs(stream=None):
+    """Route stdout through a JsonLinesWriter (idempotent); returns the writer."""
+    global _writer
+    if _writer is None:
+        _writer = JsonLinesWriter(stream or sys.__stdout__)
+        sys.stdout = _writer
+    return _writer
+
+
+def json_logs_enabled():
+    return _writer is not None
+
+
+def log_event(event, level='info', **fields):
+    """Emit a structured event in JSON mode (no-op with the console output)."""
+    if _writer is None:
+        return
+    record = {'ts': datetime.now().isoformat(timespec='milliseconds'), 'level': level,
+              'thread': threading.current_thread().name, 'event': event}
+    record.update(fields)
+    _writer.emit(record)
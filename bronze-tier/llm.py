@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Agent Factory Bronze Tier - Async Groq Generation Layer
+Keeps many chat completions in flight on one asyncio event loop, paces them
+with requests-per-minute and tokens-per-minute token buckets (synced from
+Groq's x-ratelimit-* headers), and retries 429/5xx with jittered backoff. Completions can also be streamed
+chunk by chunk to a caller in another thread.
+The Groq SDK is imported when the first request starts, not at module load.
+"""
+
+import asyncio
+import inspect
+import queue
+import random
+import re
+import threading
+import time
+
+from colorama import Fore, Style
+
+from metrics import REGISTRY
+
+
+# Groq reports reset windows as durations such as "2m59.56s", "7.66s" or "120ms"
+_DURATION_PART = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+_DURATION_UNITS = {'h': 3600.0, 'm': 60.0, 's': 1.0, 'ms': 0.001}
+
+
+def _retryable_errors():
+    """Groq SDK errors worth retrying (imported lazily; the SDK is slow to import)."""
+    from groq import APIConnectionError, APIStatusError, RateLimitError
+    return (RateLimitError, APIStatusError, APIConnectionError)
+
+
+def parse_duration(value):
+    """Parse a Groq rate-limit duration header into seconds (None if absent)."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def estimate_tokens(text):
+    """Rough token estimate (~4 characters per token) used for TPM pacing."""
+    return max(1, len(text) // 4)
+
+
+class TokenBucket:
+    """Asyncio token bucket that refills continuously up to `capacity`."""
+
+    def __init__(self, capacity, per_seconds=60.0):
+        self.capacity = float(capacity)
+        self.rate = self.capacity / per_seconds
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount=1):
+        """Wait until `amount` tokens are available, then take them."""
+        amount = min(float(amount), self.capacity)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+    def charge(self, amount):
+        """Take tokens after the fact; the balance may go negative (debt)."""
+        self._refill()
+        self.tokens -= amount
+
+    def sync(self, remaining, reset_seconds=None):
+        """Align the bucket with the server's view of the remaining quota."""
+        if remaining is None:
+            return
+        self._refill()
+        self.tokens = min(self.tokens, float(remaining))
+        if reset_seconds and remaining <= 0:
+            # Nothing left until the window resets: park the bucket until then
+            self.tokens = -reset_seconds * self.rate
+
+
+class GroqGenerator:
+    """Rate-limit-aware Groq client running on a background asyncio loop.
+
+    Worker threads call `generate()`, which submits the request to the shared
+    loop and blocks on the result, so many completions stay in flight at once.
+    """
+
+    def __init__(self, api_key, model, temperature=0.7, max_tokens=2048, base_url=None,
+                 requests_per_minute=30, tokens_per_minute=12000, max_retries=5,
+                 max_concurrency=8, backoff_base=1.0, backoff_cap=60.0, timeout=120.0):
+        self.api_key = api_key
+        self.model = model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.base_url = base_url
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.timeout = timeout
+
+        self.stats = {'requests': 0, 'retries': 0, 'rate_limited': 0,
+                      'prompt_tokens': 0, 'completion_tokens': 0}
+        self._stats_lock = threading.Lock()
+
+        self._loop = None
+        self._thread = None
+        self._client = None
+        self._start_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Event loop management
+    # ------------------------------------------------------------------
+
+    def _ensure_loop(self):
+        """Start the background event loop on first use."""
+        with self._start_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="groq-loop", daemon=True
+                )
+                self._thread.start()
+                asyncio.run_coroutine_threadsafe(self._setup(), self._loop).result()
+        return self._loop
+
+    async def _setup(self):
+        """Create loop-bound state (client, buckets, concurrency limit)."""
+        from groq import AsyncGroq
+
+        # The SDK's own retries would hide 429s from our pacing, so disable them
+        self._client = AsyncGroq(
+            api_key=self.api_key, base_url=self.base_url,
+            max_retries=0, timeout=self.timeout,
+        )
+        self.request_bucket = TokenBucket(self.requests_per_minute)
+        self.token_bucket = TokenBucket(self.tokens_per_minute)
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+
+    def close(self):
+        """Close the HTTP client and stop the background loop."""
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._client.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def generate(self, messages, **overrides):
+        """Blocking wrapper around `agenerate`, safe to call from any thread."""
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(self.agenerate(messages, **overrides), loop)
+        return future.result()
+
+    def generate_many(self, message_lists, **overrides):
+        """Run several completions concurrently; failed items come back as exceptions."""
+        loop = self._ensure_loop()
+
+        async def gather():
+            return await asyncio.gather(
+                *(self.agenerate(messages, **overrides) for messages in message_lists),
+                return_exceptions=True,
+            )
+
+        return asyncio.run_coroutine_threadsafe(gather(), loop).result()
+
+    def stream(self, messages, **overrides):
+        """Blocking generator of response text chunks, safe to call from any thread.
+
+        Chunks are handed over as they arrive, so the caller can write them out
+        without waiting for (or holding) the whole completion.
+        """
+        loop = self._ensure_loop()
+        chunks = queue.Queue()
+        end = object()
+        future = asyncio.run_coroutine_threadsafe(self.astream(messages, chunks.put, **overrides), loop)
+        future.add_done_callback(lambda _: chunks.put(end))
+        try:
+            while (chunk := chunks.get()) is not end:
+                yield chunk
+            future.result()
+        finally:
+            future.cancel()
+
+    async def agenerate(self, messages, **overrides):
+        """Create one chat completion, pacing and retrying as needed."""
+        params = self._params(overrides)
+        prompt_tokens = sum(estimate_tokens(m['content']) for m in messages)
+        start = time.perf_counter()
+
+        attempt = 0
+        while True:
+            await self._pace(prompt_tokens)
+
+            try:
+                async with self._slots:
+                    raw = await self._client.chat.completions.with_raw_response.create(
+                        messages=messages, **params
+                    )
+                completion = raw.parse()
+                if inspect.isawaitable(completion):
+                    completion = await completion
+            except _retryable_errors() as e:
+                attempt += 1
+                await self._wait_to_retry(e, attempt)
+                continue
+
+            self._sync_limits(raw.headers)
+            self._record_usage(getattr(completion, 'usage', None), prompt_tokens, start)
+            return completion.choices[0].message.content
+
+    async def astream(self, messages, on_chunk, **overrides):
+        """Stream one chat completion, calling `on_chunk(text)` for each delta.
+
+        Pacing and retries match `agenerate`; a request is only retried if it
+        fails before streaming starts.
+        """
+        params = self._params(overrides)
+        params['stream'] = True
+        prompt_tokens = sum(estimate_tokens(m['content']) for m in messages)
+        start = time.perf_counter()
+
+        attempt = 0
+        while True:
+            await self._pace(prompt_tokens)
+
+            async with self._slots:
+                try:
+                    raw = await self._client.chat.completions.with_raw_response.create(
+                        messages=messages, **params
+                    )
+                except _retryable_errors() as e:
+                    error = e
+                else:
+                    error = None
+                    self._sync_limits(raw.headers)
+                    chunks = raw.parse()
+                    if inspect.isawaitable(chunks):
+                        chunks = await chunks
+                    usage = None
+                    async for chunk in chunks:
+                        for choice in chunk.choices:
+                            if choice.delta.content:
+                                on_chunk(choice.delta.content)
+                        # Groq reports usage on the final chunk
+                        usage = (getattr(chunk, 'usage', None)
+                                 or getattr(getattr(chunk, 'x_groq', None), 'usage', None)
+                                 or usage)
+
+            if error is not None:
+                attempt += 1
+                await self._wait_to_retry(error, attempt)
+                continue
+
+            self._record_usage(usage, prompt_tokens, start)
+            return
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _params(self, overrides):
+        params = {
+            'model': self.model,
+            'temperature': self.temperature,
+            'max_tokens': self.max_tokens,
+        }
+        params.update(overrides)
+        return params
+
+    async def _pace(self, prompt_tokens):
+        await self.request_bucket.acquire(1)
+        await self.token_bucket.acquire(prompt_tokens)
+
+    async def _wait_to_retry(self, error, attempt):
+        """Sleep before retry number `attempt`; re-raise if `error` is not retryable."""
+        retry_after = self._handle_error(error)
+        if retry_after is None or attempt > self.max_retries:
+            raise error
+        self._bump('retries')
+        delay = self._backoff(attempt, retry_after)
+        print(f"  {Fore.YELLOW}[RETRY] Groq {self._describe(error)}; retry {attempt}/{self.max_retries} in {delay:.1f}s{Style.RESET_ALL}")
+        await asyncio.sleep(delay)
+
+    def _record_usage(self, usage, prompt_tokens, start):
+        # Latency as the caller sees it: pacing and retries included
+        REGISTRY.observe('triage_llm_request_seconds', time.perf_counter() - start)
+        if usage is not None:
+            # Reconcile the estimate with what the request actually cost
+            self.token_bucket.charge(max(0, usage.total_tokens - prompt_tokens))
+            self._bump('prompt_tokens', usage.prompt_tokens)
+            self._bump('completion_tokens', usage.completion_tokens)
+        self._bump('requests')
+
+    def _bump(self, key, amount=1):
+        with self._stats_lock:
+            self.stats[key] += amount
+        REGISTRY.inc(f'triage_llm_{key}_total', amount)
+
+    def _sync_limits(self, headers):
+        """Feed x-ratelimit-* response headers into the token buckets."""
+        def number(name):
+            try:
+                return float(headers.get(name))
+            except (TypeError, ValueError):
+                return None
+
+        self.request_bucket.sync(
+            number('x-ratelimit-remaining-requests'),
+            parse_duration(headers.get('x-ratelimit-reset-requests')),
+        )
+        self.token_bucket.sync(
+            number('x-ratelimit-remaining-tokens'),
+            parse_duration(headers.get('x-ratelimit-reset-tokens')),
+        )
+
+    def _handle_error(self, error):
+        """Return the server-suggested wait for retryable errors, else None."""
+        from groq import APIConnectionError
+
+        if isinstance(error, APIConnectionError):
+            return 0.0
+        status = getattr(error, 'status_code', None)
+        headers = error.response.headers if getattr(error, 'response', None) is not None else {}
+        if status == 429:
+            self._bump('rate_limited')
+            self._sync_limits(headers)
+            return parse_duration(headers.get('retry-after')) or 0.0
+        if status is not None and status >= 500:
+            return parse_duration(headers.get('retry-after')) or 0.0
+        return None
+
+    def _backoff(self, attempt, retry_after=0.0):
+        """Full-jitter exponential backoff, never shorter than Retry-After."""
+        ceiling = min(self.backoff_cap, self.backoff_base * (2 ** attempt))
+        return max(retry_after, random.uniform(0, ceiling))
+
+    @staticmethod
+    def _describe(error):
+        status = getattr(error, 'status_code', None)
+        return f"HTTP {status}" if status else type(error).__name__
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Agent Factory Bronze Tier - Run Metrics
+Per-file latency and outcome tracking for batch runs of the agent, with the
+percentile and throughput figures printed in the end-of-run summary.
+
+The process-wide `REGISTRY` collects pipeline counters (files, errors by type,
+LLM requests and tokens), gauges (queue depth, files per minute) and per-stage
+latency histograms. It can be served as Prometheus text on localhost
+(`MetricsServer`) or flushed to a JSON file periodically (`MetricsFile`).
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from vault_io import atomic_write
+
+# Prometheus histogram bucket bounds, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Recent samples kept per histogram series for the JSON percentiles
+RESERVOIR_SIZE = 1024
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of `values` (None if empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class RunSummary:
+    """Thread-safe record of how long each file took and whether it succeeded."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.finished = None
+        self.latencies = []
+        self.failures = []
+        self._lock = threading.Lock()
+
+    def record(self, filename, seconds, success):
+        with self._lock:
+            self.latencies.append(seconds)
+            if not success:
+                self.failures.append(filename)
+
+    def finish(self):
+        self.finished = time.monotonic()
+
+    def as_dict(self):
+        with self._lock:
+            latencies = list(self.latencies)
+            failures = list(self.failures)
+        elapsed = (self.finished or time.monotonic()) - self.started
+        return {
+            'files': len(latencies),
+            'succeeded': len(latencies) - len(failures),
+            'failed': failures,
+            'elapsed': elapsed,
+            'files_per_minute': len(latencies) / elapsed * 60 if elapsed > 0 else 0.0,
+            'p50': percentile(latencies, 50),
+            'p95': percentile(latencies, 95),
+            'p99': percentile(latencies, 99),
+            'max': max(latencies) if latencies else None,
+        }
+
+
+class _Histogram:
+    """Bucket counts, sum and recent samples of one labelled series."""
+
+    def __init__(self):
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=RESERVOIR_SIZE)
+
+    def observe(self, value):
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if value <= bound:
+                self.buckets[i] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+        self.recent.append(value)
+
+
+def _label_key(labels):
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _label_text(key, extra=()):
+    """Prometheus label set, e.g. `{stage="llm",le="0.5"}` ('' without labels)."""
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Registry:
+    """Thread-safe counters, callback gauges and latency histograms."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+        self._counters = {}      # name -> {label_key: value}
+        self._histograms = {}    # name -> {label_key: _Histogram}
+        self._gauges = {}        # name -> callable
+        self._completions = deque()
+
+    def inc(self, name, amount=1, **labels):
+        """Add `amount` to a counter."""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name, seconds, **labels):
+        """Record one latency sample in a histogram."""
+        key = _label_key(labels)
+        with self._lock:
+            self._histograms.setdefault(name, {}).setdefault(key, _Histogram()).observe(seconds)
+
+    def gauge(self, name, read):
+        """Register a gauge whose value is `read()` at export time."""
+        with self._lock:
+            self._gauges[name] = read
+
+    @contextmanager
+    def stage(self, stage, timings=None):
+        """Time a pipeline stage into `triage_stage_seconds` (and `timings[stage]`, if given)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self.observe('triage_stage_seconds', seconds, stage=stage)
+            if timings is not None:
+                timings[stage] = timings.get(stage, 0.0) + seconds
+
+    def task_done(self, success):
+        """Count a finished task (for `triage_files_total` and files per minute)."""
+        self.inc('triage_files_total', outcome='completed' if success else 'failed')
+        now = time.monotonic()
+        with self._lock:
+            self._completions.append(now)
+            while self._completions and self._completions[0] < now - 60:
+                self._completions.popleft()
+
+    def files_per_minute(self):
+        """Tasks finished in the last 60 seconds."""
+        cutoff = time.monotonic() - 60
+        with self._lock:
+            return sum(1 for finished in self._completions if finished >= cutoff)
+
+    def counter(self, name, **labels):
+        """Current value of one counter series (0 if never incremented)."""
+        with self._lock:
+            return self._counters.get(name, {}).get(_label_key(labels), 0)
+
+    def _gauge_values(self):
+        with self._lock:
+            gauges = dict(self._gauges)
+        values = {'triage_uptime_seconds': time.monotonic() - self.started,
+                  'triage_files_per_minute': self.files_per_minute()}
+        for name, read in gauges.items():
+            try:
+                values[name] = read()
+            except Exception:
+                continue
+        return values
+
+    def snapshot(self):
+        """All metrics as a JSON-serializable dict (histograms summarized with percentiles)."""
+        gauges = self._gauge_values()
+        with self._lock:
+            counters = {
+                name: {','.join(f'{k}={v}' for k, v in key): value for key, value in series.items()}
+                for name, series in self._counters.items()
+            }
+            histograms = {}
+            for name, series in self._histograms.items():
+                histograms[name] = {}
+                for key, histogram in series.items():
+                    recent = list(histogram.recent)
+                    histograms[name][','.join(f'{k}={v}' for k, v in key)] = {
+                        'count': histogram.count,
+                        'sum': histogram.sum,
+                        'max': histogram.max,
+                        'p50': percentile(recent, 50),
+                        'p95': percentile(recent, 95),
+                        'p99': percentile(recent, 99),
+                    }
+        return {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'gauges': gauges,
+            'counters': counters,
+            'histograms': histograms,
+        }
+
+    def render_prometheus(self):
+        """All metrics in the Prometheus text exposition format."""
+        lines = []
+        for name, value in sorted(self._gauge_values().items()):
+            lines += [f'# TYPE {name} gauge', f'{name} {value}']
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                lines.append(f'# TYPE {name} counter')
+                lines += [f'{name}{_label_text(key)} {value}' for key, value in sorted(series.items())]
+            for name, series in sorted(self._histograms.items()):
+                lines.append(f'# TYPE {name} histogram')
+                for key, histogram in sorted(series.items()):
+                    for bound, count in zip(LATENCY_BUCKETS, histogram.buckets):
+                        lines.append(f'{name}_bucket{_label_text(key, [("le", str(bound))])} {count}')
+                    lines.append(f'{name}_bucket{_label_text(key, [("le", "+Inf")])} {histogram.count}')
+                    lines.append(f'{name}_sum{_label_text(key)} {histogram.sum}')
+                    lines.append(f'{name}_count{_label_text(key)} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        """Drop every series and gauge (for tests)."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._gauges.clear()
+            self._completions.clear()
+            self.started = time.monotonic()
+
+
+# Shared by the agent, LLM layer, dashboard and watcher in this process
+REGISTRY = Registry()
+
+
+class MetricsServer:
+    """Serves `GET /metrics` in Prometheus text format on localhost."""
+
+    def __init__(self, port, registry=REGISTRY, host='127.0.0.1'):
+        # Imported here: http.server is only needed when the endpoint is enabled
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = registry.render_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+class MetricsFile:
+    """Writes `registry.snapshot()` to a JSON file every `interval` seconds (and on stop)."""
+
+    def __init__(self, path, interval=10.0, registry=REGISTRY):
+        self.path = path
+        self.interval = interval
+        self.registry = registry
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def flush(self):
+        atomic_write(self.path, json.dumps(self.registry.snapshot(), indent=2))
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="metrics-file", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self.flush()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+
+def start_exporters(port=None, path=None, interval=10.0):
+    """Start the Prometheus endpoint and/or JSON file writer; returns them for `stop()`."""
+    exporters = []
+    if port is not None:
+        exporters.append(MetricsServer(port).start())
+    if path is not None:
+        exporters.append(MetricsFile(path, interval).start())
+    return exporters
+
+
+def add_observability_arguments(parser):
+    """Add the log format and metrics export options (agent.py, daemon.py and watcher.py)."""
+    parser.add_argument(
+        '--log-format',
+        choices=['text', 'json'],
+        default=os.getenv("LOG_FORMAT", "text"),
+        help='Console output: colored text, or JSON lines for headless runs (default: LOG_FORMAT or text)'
+    )
+    parser.add_argument(
+        '--metrics-port',
+        type=int,
+        default=None,
+        help='Serve Prometheus metrics at http://127.0.0.1:PORT/metrics'
+    )
+    parser.add_argument(
+        '--metrics-file',
+        type=Path,
+        default=None,
+        help='Write a metrics JSON snapshot to this file every --metrics-interval seconds'
+    )
+    parser.add_argument(
+        '--metrics-interval',
+        type=float,
+        default=10.0,
+        help='Seconds between metrics file writes (default: 10)'
+    )
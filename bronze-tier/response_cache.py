@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Agent Factory Bronze Tier - Response Cache
+Persistent cache of Groq responses in Vault/.state/responses.db, keyed by a
+hash of (normalized content, task type, model, temperature, system prompt), so
+a duplicate request is answered from disk instead of another LLM call.
+Entries expire after a TTL; once the cache grows past its size limit the least
+recently used entries are evicted.
+"""
+
+import hashlib
+import re
+import time
+
+from vault_io import StateDB
+
+_WHITESPACE = re.compile(r'[ \t]+')
+
+
+def normalize_content(content):
+    """Collapse formatting-only differences (line endings, trailing and repeated spaces)."""
+    lines = content.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+    return '\n'.join(_WHITESPACE.sub(' ', line).strip() for line in lines).strip()
+
+
+def cache_key(content, task_type, model, temperature, system_prompt):
+    """SHA-256 key over everything that determines the model's answer."""
+    digest = hashlib.sha256()
+    for part in (normalize_content(content), task_type, model, repr(float(temperature)), system_prompt):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class ResponseCache(StateDB):
+    """SQLite-backed response cache with TTL and size-bounded LRU eviction."""
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            response TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            created REAL NOT NULL,
+            last_used REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+    '''
+
+    def __init__(self, db_path, ttl=7 * 24 * 3600, max_bytes=50 * 1024 * 1024):
+        super().__init__(db_path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the cached response for `key`, or None if absent or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT response, created FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                if row is not None:
+                    self._conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+                self.misses += 1
+                return None
+            self._conn.execute('UPDATE responses SET last_used = ? WHERE key = ?', (now, key))
+            self.hits += 1
+            return row[0]
+
+    def put(self, key, response):
+        """Store a response, then evict expired and least recently used entries."""
+        now = time.time()
+        size = len(response.encode('utf-8'))
+        with self._transaction() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO responses (key, response, size, created, last_used) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (key, response, size, now, now)
+            )
+            self._evict(now)
+
+    def _evict(self, now):
+        self._conn.execute('DELETE FROM responses WHERE created < ?', (now - self.ttl,))
+        total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Drop the oldest-used entries until the cache is back under its limit
+        excess = total - self.max_bytes
+        stale = []
+        for key, size in self._conn.execute('SELECT key, size FROM responses ORDER BY last_used').fetchall():
+            stale.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany('DELETE FROM responses WHERE key = ?', stale)
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute('DELETE FROM responses')
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Agent Factory Bronze Tier - Needs_Action Task Queue
+In-memory FIFO priority queue of files waiting in Vault/Needs_Action/, seeded
+by one scandir at startup and kept current by watchdog events, so picking the
+next task is an O(log n) heap pop instead of a glob-and-sort of the folder.
+"""
+
+import heapq
+import itertools
+import os
+import threading
+from pathlib import Path
+
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+SUPPORTED_EXTENSIONS = {'.md', '.txt', '.docx'}
+
+
+class _NeedsActionEvents(FileSystemEventHandler):
+    """Pushes files that appear in Needs_Action onto the queue."""
+
+    def __init__(self, task_queue):
+        self.task_queue = task_queue
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self.task_queue.push(Path(event.src_path))
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self.task_queue.push(Path(event.dest_path))
+
+
+class TaskQueue:
+    """Oldest-first queue of Needs_Action files, ordered by (mtime, arrival)."""
+
+    def __init__(self, needs_action_path):
+        self.needs_action_path = Path(needs_action_path)
+        self._heap = []
+        self._queued = set()
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._observer = None
+        self._closed = False
+        self.seeded = False
+
+    def __len__(self):
+        with self._condition:
+            return len(self._heap)
+
+    def seed(self):
+        """Queue every supported file currently in Needs_Action (one scandir)."""
+        items = []
+        with os.scandir(self.needs_action_path) as entries:
+            for entry in entries:
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS:
+                    items.append((entry.stat().st_mtime_ns, entry.name))
+
+        with self._condition:
+            for mtime, name in items:
+                if name not in self._queued:
+                    self._queued.add(name)
+                    self._heap.append((mtime, next(self._counter), name))
+            heapq.heapify(self._heap)
+            self.seeded = True
+            if self._heap:
+                self._condition.notify_all()
+
+    def push(self, file_path, mtime=None):
+        """Queue a file that appeared in Needs_Action (ignored if already queued)."""
+        file_path = Path(file_path)
+        if file_path.parent != self.needs_action_path:
+            return
+        if file_path.suffix.lower() not in SUPPORTED_EXTENSIONS:
+            return
+        if mtime is None:
+            try:
+                mtime = file_path.stat().st_mtime_ns
+            except FileNotFoundError:
+                return
+
+        with self._condition:
+            if file_path.name in self._queued:
+                return
+            self._queued.add(file_path.name)
+            heapq.heappush(self._heap, (mtime, next(self._counter), file_path.name))
+            self._condition.notify()
+
+    def pop(self, timeout=None):
+        """Remove and return the oldest queued file, waiting up to `timeout` seconds.
+
+        Returns None if nothing arrived in time. The file may already have been
+        taken by another process; callers claim it before use.
+        """
+        with self._condition:
+            if not self._heap:
+                self._condition.wait_for(lambda: self._heap or self._closed, timeout=timeout)
+            if not self._heap:
+                return None
+            _, _, name = heapq.heappop(self._heap)
+            self._queued.discard(name)
+        return self.needs_action_path / name
+
+    def start(self):
+        """Watch Needs_Action for new files."""
+        self._closed = False
+        if self._observer is None:
+            self._observer = Observer()
+            self._observer.schedule(_NeedsActionEvents(self), str(self.needs_action_path), recursive=False)
+            self._observer.start()
+
+    def stop(self):
+        """Stop watching and wake any waiting consumers."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
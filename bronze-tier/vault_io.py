@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Agent Factory Bronze Tier - Vault File I/O Helpers
+Cross-process file locks, crash-safe atomic writes, no-clobber moves,
+collision-free task names and the SQLite state-store base shared by the
+watcher and agent processes.
+"""
+
+import errno
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(lock_path):
+    """Hold an exclusive advisory lock on `lock_path` across processes."""
+    lock_path = Path(lock_path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, 'a+b') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def try_lock(lock_path):
+    """Take an exclusive advisory lock on `lock_path` without waiting.
+
+    Returns the open lock file, which holds the lock until it is closed, or
+    None if another process (or another open handle) holds it.
+    """
+    lock_file = open(lock_path, 'a+b')
+    try:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+def fsync_directory(path):
+    """Persist a rename by syncing its directory entry (no-op on Windows)."""
+    if os.name == 'nt':
+        return
+    fd = os.open(str(path), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_writer(path, encoding='utf-8', binary=False):
+    """Yield a temp file next to `path`; on success fsync it and os.replace it into place.
+
+    Content can be written incrementally; if the block raises, the temp file is
+    removed and `path` is left untouched. With `binary=True` the file takes bytes.
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with (os.fdopen(fd, 'wb') if binary else os.fdopen(fd, 'w', encoding=encoding)) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+    fsync_directory(path.parent)
+
+
+def atomic_write(path, content, encoding='utf-8'):
+    """Write `content` to a temp file, fsync it, then os.replace it into place.
+
+    Readers see either the old file or the new one, never a truncated mix.
+    """
+    with atomic_writer(path, encoding) as f:
+        f.write(content)
+
+
+def unique_name(filename, folders, taken=()):
+    """`filename`, or the first free `stem-2.ext`, `stem-3.ext`, ... across `folders`.
+
+    Keeps a new task from overwriting a same-named file anywhere it may end up.
+    Names in `taken` (reserved but not yet on disk) count as used.
+    """
+    stem, ext = os.path.splitext(filename)
+    candidate, n = filename, 1
+    while candidate in taken or any(os.path.lexists(os.path.join(folder, candidate)) for folder in folders):
+        n += 1
+        candidate = f"{stem}-{n}{ext}"
+    return candidate
+
+
+def move_no_replace(source, destination):
+    """Rename `source` to `destination`, raising FileExistsError if it is taken.
+
+    os.rename silently replaces an existing file on POSIX, so the move is a
+    hard link followed by an unlink of the source; where links are
+    unsupported it falls back to a checked rename. If the source vanishes
+    before the unlink (another process moved it first), the link is undone
+    and FileNotFoundError is raised.
+    """
+    try:
+        os.link(source, destination)
+    except (FileExistsError, FileNotFoundError):
+        raise
+    except OSError:
+        if os.path.lexists(destination):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(destination))
+        os.rename(source, destination)
+        return
+    try:
+        os.unlink(source)
+    except FileNotFoundError:
+        os.unlink(destination)
+        raise
+
+
+def claim_folders(processing_path):
+    """Needs_Action/.processing/ and the per-agent claim folders inside it."""
+    processing_path = Path(processing_path)
+    folders = [processing_path]
+    try:
+        with os.scandir(processing_path) as entries:
+            folders.extend(Path(entry.path) for entry in entries
+                           if entry.is_dir() and not entry.name.startswith('.'))
+    except FileNotFoundError:
+        pass
+    return folders
+
+
+def link_or_copy(source, destination):
+    """Hard-link `source` at `destination`, copying where links are unsupported."""
+    try:
+        os.link(source, destination)
+    except FileExistsError:
+        raise
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+class StateDB:
+    """A SQLite store in Vault/.state/ shared by threads and processes.
+
+    Subclasses set SCHEMA (created on open) and SYNCHRONOUS ('FULL' where a
+    commit must be on disk before the work it guards). Reads hold `_lock`;
+    writes that depend on a read go through `_transaction()`.
+    """
+
+    SCHEMA = ''
+    SYNCHRONOUS = 'NORMAL'
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(f'PRAGMA synchronous={self.SYNCHRONOUS}')
+        self._conn.executescript(self.SCHEMA)
+
+    @contextmanager
+    def _transaction(self):
+        """Serialize a read-then-write against other threads and processes."""
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
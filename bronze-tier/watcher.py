@@ -5,25 +5,83 @@ Monitors Vault/Inbox/ for new files (.md, .txt, .docx) and processes them automa
 """
 
 import os
-import shutil
+import queue
+import threading
 import time
-from datetime import datetime
 from pathlib import Path
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 from colorama import Fore, Back, Style, init
 
+from content_index import ContentIndex, file_digest
+from dashboard import Dashboard
+from jsonlog import enable_json_logs
+from metrics import REGISTRY, add_observability_arguments, start_exporters
+from vault_io import claim_folders, link_or_copy, move_no_replace, unique_name
+
 # Initialize colorama for Windows compatibility
 init(autoreset=True)
 
+SUPPORTED_EXTENSIONS = {'.md', '.txt', '.docx'}
+
 
 class InboxHandler(FileSystemEventHandler):
-    """Handles new file events in the Inbox folder."""
+    """Handles new file events in the Inbox folder.
+
+    Observer callbacks only record paths. A file whose writer is known to be
+    done (inotify close-write, or an atomic rename into the Inbox) goes to the
+    ingest queue straight away; otherwise a stabilizer thread hands it over
+    once its size and mtime have stopped changing for `settle_time` seconds.
+    An ingest thread then moves it to Needs_Action off the observer thread.
+
+    Ingest hashes each file: an exact duplicate of an earlier task is linked
+    to that task's result instead of being queued again, and a new file whose
+    name is taken gets a unique one (`report-2.md`).
+
+    In the combined daemon the handler shares the agent's Dashboard and
+    content index, and pushes each moved file straight onto the agent's
+    `task_queue`.
+    """
 
-    def __init__(self, inbox_path, needs_action_path, dashboard_path):
+    def __init__(self, inbox_path, needs_action_path, dashboard_path, settle_time=1.0, poll_interval=0.2,
+                 dashboard=None, task_queue=None, content_index=None):
         self.inbox_path = Path(inbox_path)
         self.needs_action_path = Path(needs_action_path)
+        self.duplicates_path = self.needs_action_path / ".duplicates"
+        self.done_path = self.needs_action_path.parent / "Done"
         self.dashboard_path = Path(dashboard_path)
+        self.dashboard = dashboard if dashboard is not None else Dashboard(self.dashboard_path)
+        self.content_index = (content_index if content_index is not None
+                              else ContentIndex(self.dashboard_path.parent / ".state" / "content.db"))
+        self.task_queue = task_queue
+
+        self.settle_time = settle_time
+        self.poll_interval = poll_interval
+        self.ready_queue = queue.Queue()
+
+        # path -> [size, mtime_ns, stable_since]
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._threads = []
+
+    def start(self):
+        """Start the stabilizer and ingest threads."""
+        self._stop_event.clear()
+        self._threads = [
+            threading.Thread(target=self._stabilize_loop, name="inbox-stabilizer", daemon=True),
+            threading.Thread(target=self._ingest_loop, name="inbox-ingest", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        """Stop the background threads after the ingest queue drains."""
+        self._stop_event.set()
+        self.ready_queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
 
     def on_created(self, event):
         """Called when a file is created in the watched directory."""
@@ -31,180 +89,305 @@ class InboxHandler(FileSystemEventHandler):
             return
 
         file_path = Path(event.src_path)
+        if file_path.parent != self.inbox_path:
+            return
 
         # Only process supported file types
-        supported_extensions = {'.md', '.txt', '.docx'}
-        if file_path.suffix.lower() not in supported_extensions:
+        if file_path.suffix.lower() not in SUPPORTED_EXTENSIONS:
             print(f"{Fore.YELLOW}[!] Skipped unsupported file: {file_path.name}{Style.RESET_ALL}")
             return
 
-        # Small delay to ensure file is fully written
-        time.sleep(0.1)
+        self._track(file_path)
 
-        try:
-            self.process_file(file_path)
-        except Exception as e:
-            print(f"{Fore.RED}[X] Error processing {file_path.name}: {e}{Style.RESET_ALL}")
+    def on_modified(self, event):
+        """Called while a file is being written; restarts its settle timer."""
+        if not event.is_directory:
+            self._track(Path(event.src_path))
+
+    def on_moved(self, event):
+        """Called on renames; atomic-rename writers land complete files this way."""
+        if event.is_directory:
+            return
+        dest_path = Path(event.dest_path)
+        if dest_path.parent == self.inbox_path:
+            self._track(dest_path, writer_done=True)
+
+    def on_closed(self, event):
+        """Called on inotify close-write: the writer has finished the file."""
+        if not event.is_directory:
+            self._track(Path(event.src_path), writer_done=True)
+
+    def _track(self, file_path, writer_done=False):
+        """Record activity on a file without blocking the observer thread."""
+        # Events from outside the Inbox (the daemon watches all of Vault/) are ignored
+        if file_path.suffix.lower() not in SUPPORTED_EXTENSIONS or file_path.parent != self.inbox_path:
+            return
+        with self._pending_lock:
+            if writer_done:
+                # The writer is known to be finished: hand off now, not on the next poll
+                self._pending.pop(file_path, None)
+                self.ready_queue.put(file_path)
+                return
+            entry = self._pending.setdefault(file_path, [None, None, None])
+            entry[2] = None
+
+    def _stabilize_loop(self):
+        while not self._stop_event.wait(self.poll_interval):
+            self._check_pending()
+
+    def _check_pending(self):
+        """Queue files whose size/mtime have settled."""
+        now = time.monotonic()
+        with self._pending_lock:
+            snapshot = [(path, list(entry)) for path, entry in self._pending.items()]
+
+        ready, gone, observed = [], [], {}
+        for file_path, (size, mtime, stable_since) in snapshot:
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
+                gone.append(file_path)
+                continue
+
+            if (stat.st_size, stat.st_mtime_ns) == (size, mtime) and stable_since is not None:
+                if now - stable_since >= self.settle_time:
+                    ready.append(file_path)
+            else:
+                observed[file_path] = (stat.st_size, stat.st_mtime_ns, now)
+
+        with self._pending_lock:
+            for file_path in gone:
+                self._pending.pop(file_path, None)
+            for file_path, (size, mtime, since) in observed.items():
+                entry = self._pending.get(file_path)
+                if entry is not None:
+                    entry[0], entry[1], entry[2] = size, mtime, since
+            for file_path in ready:
+                entry = self._pending.get(file_path)
+                # Skip files that saw new write activity since the snapshot
+                if entry is None or entry[2] is None:
+                    continue
+                del self._pending[file_path]
+                self.ready_queue.put(file_path)
+
+    def _ingest_loop(self):
+        while True:
+            file_path = self.ready_queue.get()
+            if file_path is None:
+                break
+            if not file_path.exists():
+                continue
+            try:
+                with REGISTRY.stage('ingest'):
+                    self.process_file(file_path)
+            except Exception as e:
+                REGISTRY.inc('triage_errors_total', stage='ingest', type=type(e).__name__)
+                print(f"{Fore.RED}[X] Error processing {file_path.name}: {e}{Style.RESET_ALL}")
 
     def process_file(self, file_path):
-        """Move file to Needs_Action and update Dashboard."""
-        filename = file_path.name
-        task_name = file_path.stem  # Filename without extension
+        """Move file to Needs_Action and update Dashboard (exact duplicates are linked instead)."""
+        digest = file_digest(file_path)
+        if self._link_duplicate(file_path, digest):
+            return
+
+        filename = unique_name(file_path.name, self.task_folders())
+        task_name = Path(filename).stem  # Filename without extension
+
+        # Index and add the Dashboard row before the move, so an agent that
+        # picks the file up at once finds both (and adds no second row)
+        self.content_index.add(digest, filename)
+        task_id = self.update_dashboard(task_name, filename)
 
         # Move file to Needs_Action
+        try:
+            moved_name = self._move_into(file_path, self.needs_action_path, filename)
+        except Exception:
+            self.dashboard.update_status(task_id, "Error", filename)
+            raise
+        if moved_name != filename:
+            self._rename_task(task_id, filename, moved_name)
+            filename, task_name = moved_name, Path(moved_name).stem
         destination = self.needs_action_path / filename
-        shutil.move(str(file_path), str(destination))
-        print(f"{Fore.GREEN}[OK] Moved: {Fore.CYAN}{filename}{Fore.GREEN} -> {Fore.MAGENTA}Needs_Action/{Style.RESET_ALL}")
-
-        # Update Dashboard
-        self.update_dashboard(task_name, filename)
+        REGISTRY.inc('triage_ingested_total')
+        print(f"{Fore.GREEN}[OK] Moved: {Fore.CYAN}{file_path.name}{Fore.GREEN} -> "
+              f"{Fore.MAGENTA}Needs_Action/{filename if filename != file_path.name else ''}{Style.RESET_ALL}")
         print(f"{Fore.GREEN}[OK] Updated Dashboard: {Fore.CYAN}{task_name}{Fore.GREEN} -> {Fore.YELLOW}Pending{Style.RESET_ALL}")
 
+        # Hand the task to the in-process agent (once its Dashboard row exists)
+        if self.task_queue is not None:
+            self.task_queue.push(destination)
+
+    def _move_into(self, file_path, folder, name, taken=()):
+        """Move `file_path` to `folder` as `name`, or as the next free name if that was taken since.
+
+        shutil.move replaces an existing file, so a claim an agent released
+        under the same name after unique_name picked it would be lost.
+        Returns the name the file was moved to.
+        """
+        while True:
+            try:
+                move_no_replace(file_path, folder / name)
+                return name
+            except FileExistsError:
+                name = unique_name(file_path.name, self.task_folders(), taken)
+
+    def _rename_task(self, task_id, filename, new_filename):
+        """Point a new task's Dashboard row and index entry at the name it was moved to."""
+        self.dashboard.update_status(task_id, "Pending", new_filename)
+        self.content_index.rename(filename, new_filename)
+
     def update_dashboard(self, task_name, filename):
-        """Add a new row to the Dashboard task table."""
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        current_time = datetime.now().strftime("%H:%M:%S")
-        current_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        # Read current dashboard content
-        with open(self.dashboard_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Calculate next S.NO by counting existing task rows
-        import re
-        existing_rows = re.findall(r'<td style="padding: 16px; text-align: center; font-weight: 700; color: #6366f1; font-size: 16px;">(\d+)</td>', content)
-        next_sno = len(existing_rows) + 1
-
-        # Determine row background (alternating)
-        # Odd rows: no background, Even rows: rgba(15, 23, 42, 0.5)
-        if next_sno % 2 == 0:
-            row_style = 'background: rgba(15, 23, 42, 0.5); border-bottom: 1px solid rgba(99, 102, 241, 0.1);'
+        """Add a new Pending task to the Dashboard."""
+        return self.dashboard.add_task(task_name, filename)
+
+    def pending_folders(self):
+        """Needs_Action/ and the agents' claim folders: where a pending task's file can be."""
+        return [self.needs_action_path, *claim_folders(self.needs_action_path / ".processing")]
+
+    def task_folders(self):
+        """Every place a task's file can be; new names must be free in all of them."""
+        return [*self.pending_folders(), self.duplicates_path, self.done_path]
+
+    def _link_duplicate(self, file_path, digest):
+        """Link an exact duplicate of an earlier task to its result; False if the content is new.
+
+        A duplicate of a finished task gets a Completed row and a link to the
+        response in Done/. One whose original is still pending waits in
+        Needs_Action/.duplicates/ until the agent completes the original.
+        """
+        original = self.content_index.lookup(digest)
+        if original is None:
+            return False
+        filename, done_filename = original
+        if done_filename is not None and not (self.done_path / done_filename).exists():
+            return False
+        if done_filename is None and not any((folder / filename).exists() for folder in self.pending_folders()):
+            # The original left Needs_Action without completing: treat this as new
+            return False
+
+        name = unique_name(file_path.name, self.task_folders())
+        REGISTRY.inc('triage_duplicates_total')
+        if done_filename is None:
+            self.duplicates_path.mkdir(exist_ok=True)
+            name = self._move_into(file_path, self.duplicates_path, name)
+            task_id = self.update_dashboard(Path(name).stem, name)
+            done_filename = self.content_index.add_duplicate(digest, task_id, name)
+            if done_filename is None:
+                print(f"{Fore.GREEN}[OK] Duplicate: {Fore.CYAN}{file_path.name}{Fore.GREEN} waits for "
+                      f"{Fore.CYAN}{filename}{Fore.GREEN}; no new request{Style.RESET_ALL}")
+                return True
+            # The original completed in the meantime
+            link_or_copy(self.done_path / done_filename, self.done_path / name)
+            (self.duplicates_path / name).unlink()
+            self.dashboard.update_status(task_id, "Completed", name)
         else:
-            row_style = 'border-bottom: 1px solid rgba(99, 102, 241, 0.1);'
-
-        # Create new table row with Pending status (yellow/orange gradient)
-        new_row = f'''    <tr style="{row_style}">
-      <td style="padding: 16px; text-align: center; font-weight: 700; color: #6366f1; font-size: 16px;">{next_sno}</td>
-      <td style="padding: 16px; color: #e4e6eb; font-size: 14px;">{task_name}</td>
-      <td style="padding: 16px; text-align: center;">
-        <span style="background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%); color: white; padding: 6px 16px; border-radius: 20px; font-size: 12px; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px; box-shadow: 0 2px 8px rgba(245, 158, 11, 0.4);">Pending</span>
-      </td>
-      <td style="padding: 16px; text-align: center; color: #9ca3af; font-size: 14px;">{current_date}</td>
-      <td style="padding: 16px; text-align: center; color: #9ca3af; font-size: 14px;">{current_time}</td>
-      <td style="padding: 16px;"><a href="Needs_Action/{filename}" style="color: #6366f1; text-decoration: none; font-weight: 500; font-size: 14px;">📄 Needs_Action/{filename}</a></td>
-    </tr>
-'''
-
-        # Insert new row before </tbody>
-        content = content.replace('  </tbody>', new_row + '  </tbody>')
-
-        # Update statistics
-        content = self._update_statistics(content, total_delta=1, pending_delta=1)
-
-        # Update last updated timestamp (if exists in footer)
-        if 'Last Updated:' in content:
-            content = re.sub(
-                r'<p style="margin: 0; color: #[^"]+;"><strong>Last Updated:</strong> [^<]+</p>',
-                f'<p style="margin: 0; color: #9ca3af;"><strong>Last Updated:</strong> {current_timestamp}</p>',
-                content
-            )
-
-        # Write updated content back
-        with open(self.dashboard_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-    def _update_statistics(self, content, total_delta=0, completed_delta=0, pending_delta=0, error_delta=0):
-        """Update the statistics section in the Dashboard."""
-        import re
-
-        # Extract current statistics - updated pattern for new Dashboard format
-        # Pattern: <h3 style="...font-size: 48px...">NUMBER</h3>
-        total_match = re.search(
-            r'<h3 style="[^"]*font-size: 48px[^"]*">(\d+)</h3>\s*<p style="[^"]*">Total Tasks</p>',
-            content,
-            re.DOTALL
-        )
-        completed_match = re.search(
-            r'<h3 style="[^"]*font-size: 48px[^"]*">(\d+)</h3>\s*<p style="[^"]*">Completed</p>',
-            content,
-            re.DOTALL
-        )
-        pending_match = re.search(
-            r'<h3 style="[^"]*font-size: 48px[^"]*">(\d+)</h3>\s*<p style="[^"]*">Pending</p>',
-            content,
-            re.DOTALL
-        )
-        error_match = re.search(
-            r'<h3 style="[^"]*font-size: 48px[^"]*">(\d+)</h3>\s*<p style="[^"]*">Errors</p>',
-            content,
-            re.DOTALL
-        )
-
-        # Calculate new values
-        total = int(total_match.group(1)) + total_delta if total_match else total_delta
-        completed = int(completed_match.group(1)) + completed_delta if completed_match else completed_delta
-        pending = int(pending_match.group(1)) + pending_delta if pending_match else pending_delta
-        errors = int(error_match.group(1)) + error_delta if error_match else error_delta
-
-        # Update statistics with new values
-        # Pattern to match the number inside h3 tag before "Total Tasks"
-        content = re.sub(
-            r'(<h3 style="[^"]*font-size: 48px[^"]*">)\d+(</h3>\s*<p style="[^"]*">Total Tasks</p>)',
-            rf'\g<1>{total}\g<2>',
-            content,
-            flags=re.DOTALL
-        )
-
-        # Pattern to match the number inside h3 tag before "Completed"
-        content = re.sub(
-            r'(<h3 style="[^"]*font-size: 48px[^"]*">)\d+(</h3>\s*<p style="[^"]*">Completed</p>)',
-            rf'\g<1>{completed}\g<2>',
-            content,
-            flags=re.DOTALL
-        )
-
-        # Pattern to match the number inside h3 tag before "Pending"
-        content = re.sub(
-            r'(<h3 style="[^"]*font-size: 48px[^"]*">)\d+(</h3>\s*<p style="[^"]*">Pending</p>)',
-            rf'\g<1>{pending}\g<2>',
-            content,
-            flags=re.DOTALL
-        )
-
-        # Pattern to match the number inside h3 tag before "Errors"
-        content = re.sub(
-            r'(<h3 style="[^"]*font-size: 48px[^"]*">)\d+(</h3>\s*<p style="[^"]*">Errors</p>)',
-            rf'\g<1>{errors}\g<2>',
-            content,
-            flags=re.DOTALL
-        )
-
-        return content
+            link_or_copy(self.done_path / done_filename, self.done_path / name)
+            file_path.unlink()
+            self.dashboard.add_task(Path(name).stem, name, status="Completed")
+        print(f"{Fore.GREEN}[OK] Duplicate: {Fore.CYAN}{file_path.name}{Fore.GREEN} -> "
+              f"{Fore.MAGENTA}Done/{name}{Fore.GREEN} (result of {done_filename}){Style.RESET_ALL}")
+        return True
 
     def process_existing_files(self):
-        """Process files that already exist in Inbox on startup."""
-        supported_extensions = {'.md', '.txt', '.docx'}
-        existing_files = []
+        """Bulk-ingest files that already exist in Inbox on startup.
 
-        for ext in supported_extensions:
-            existing_files.extend(self.inbox_path.glob(f"*{ext}"))
+        One scandir pass finds the backlog, every file is moved, and all new
+        Pending rows plus the statistics delta go to the Dashboard in a
+        single commit and render.
+        """
+        start_time = time.perf_counter()
+        existing_files = []
+        with os.scandir(self.inbox_path) as entries:
+            for entry in entries:
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS:
+                    existing_files.append((entry.stat().st_mtime, entry.name))
 
-        if existing_files:
-            print(f"\n{Fore.CYAN}Found {len(existing_files)} existing file(s) in Inbox{Style.RESET_ALL}")
-            for file_path in sorted(existing_files, key=lambda p: p.stat().st_mtime):
-                try:
-                    self.process_file(file_path)
-                except Exception as e:
-                    print(f"{Fore.RED}[X] Error processing {file_path.name}: {e}{Style.RESET_ALL}")
-            print(f"{Fore.GREEN}[OK] Processed all existing files{Style.RESET_ALL}\n")
-        else:
+        if not existing_files:
             print(f"{Fore.CYAN}No existing files in Inbox{Style.RESET_ALL}\n")
+            return
+
+        print(f"\n{Fore.CYAN}Found {len(existing_files)} existing file(s) in Inbox{Style.RESET_ALL}")
+
+        # Hash the backlog (oldest first); exact duplicates are linked, not queued
+        new_files, repeats, seen, names = [], [], set(), set()
+        task_folders = self.task_folders()
+        for _, filename in sorted(existing_files):
+            file_path = self.inbox_path / filename
+            try:
+                digest = file_digest(file_path)
+                if digest in seen:
+                    # Same content earlier in this backlog: link it once the original is queued
+                    repeats.append((file_path, digest))
+                    continue
+                if self._link_duplicate(file_path, digest):
+                    continue
+            except Exception as e:
+                print(f"{Fore.RED}[X] Error processing {filename}: {e}{Style.RESET_ALL}")
+                continue
+            seen.add(digest)
+            name = unique_name(filename, task_folders, names)
+            names.add(name)
+            new_files.append((file_path, digest, name))
+
+        # Index and record the new files in one go, then move them
+        self.content_index.add_many([(digest, name) for _, digest, name in new_files])
+        task_ids = self.dashboard.add_tasks([(os.path.splitext(name)[0], name) for _, _, name in new_files])
+        moved = []
+        for (file_path, _, name), task_id in zip(new_files, task_ids):
+            try:
+                moved_name = self._move_into(file_path, self.needs_action_path, name, names)
+            except Exception as e:
+                self.dashboard.update_status(task_id, "Error", name)
+                print(f"{Fore.RED}[X] Error processing {file_path.name}: {e}{Style.RESET_ALL}")
+                continue
+            if moved_name != name:
+                names.add(moved_name)
+                self._rename_task(task_id, name, moved_name)
+            moved.append((os.path.splitext(moved_name)[0], moved_name))
+
+        for file_path, digest in repeats:
+            try:
+                self._link_duplicate(file_path, digest)
+            except Exception as e:
+                print(f"{Fore.RED}[X] Error processing {file_path.name}: {e}{Style.RESET_ALL}")
+        self.dashboard.flush()
+        REGISTRY.inc('triage_ingested_total', len(moved))
+        if self.task_queue is not None:
+            for _, filename in moved:
+                self.task_queue.push(self.needs_action_path / filename)
+
+        elapsed = time.perf_counter() - start_time
+        rate = len(moved) / elapsed if elapsed > 0 else float(len(moved))
+        print(f"{Fore.GREEN}[OK] Moved {Fore.CYAN}{len(moved)}{Fore.GREEN} file(s) -> {Fore.MAGENTA}Needs_Action/{Fore.GREEN} "
+              f"in {elapsed:.2f}s ({rate:.0f} files/s){Style.RESET_ALL}\n")
 
 
 def main():
     """Start the file watcher."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Agent Factory Bronze Tier - File Watcher"
+    )
+    parser.add_argument(
+        '--settle-time',
+        type=float,
+        default=1.0,
+        help='Seconds an Inbox file must stop changing before it is picked up (default: 1.0)'
+    )
+    parser.add_argument(
+        '--base-path',
+        type=Path,
+        default=Path(__file__).parent,
+        help='Folder holding Vault/ (default: the watcher\'s folder)'
+    )
+    add_observability_arguments(parser)
+    args = parser.parse_args()
+    if args.log_format == 'json':
+        enable_json_logs()
+
     # Define paths
-    base_path = Path(__file__).parent
+    base_path = args.base_path
     inbox_path = base_path / "Vault" / "Inbox"
     needs_action_path = base_path / "Vault" / "Needs_Action"
     dashboard_path = base_path / "Vault" / "Dashboard.md"
@@ -223,7 +406,7 @@ def main():
         return
 
     # Set up the observer
-    event_handler = InboxHandler(inbox_path, needs_action_path, dashboard_path)
+    event_handler = InboxHandler(inbox_path, needs_action_path, dashboard_path, settle_time=args.settle_time)
     observer = Observer()
     observer.schedule(event_handler, str(inbox_path), recursive=False)
 
@@ -235,21 +418,28 @@ def main():
     print(f"{Fore.CYAN}Supported: {Fore.WHITE}.md, .txt, .docx{Style.RESET_ALL}")
     print(f"{Fore.CYAN}Press Ctrl+C to stop{Style.RESET_ALL}")
 
-    # Process existing files before starting to watch
-    event_handler.process_existing_files()
-
-    # Start watching
-    observer.start()
-    print(f"{Fore.GREEN}Watching for new files...{Style.RESET_ALL}\n")
-
+    exporters = start_exporters(args.metrics_port, args.metrics_file, args.metrics_interval)
     try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        observer.stop()
-        print(f"\n{Fore.YELLOW}[STOP] Watcher stopped by user.{Style.RESET_ALL}")
+        # Process existing files before starting to watch
+        event_handler.process_existing_files()
 
-    observer.join()
+        # Start watching
+        event_handler.start()
+        observer.start()
+        print(f"{Fore.GREEN}Watching for new files...{Style.RESET_ALL}\n")
+
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            observer.stop()
+            print(f"\n{Fore.YELLOW}[STOP] Watcher stopped by user.{Style.RESET_ALL}")
+
+        observer.join()
+        event_handler.stop()
+    finally:
+        for exporter in exporters:
+            exporter.stop()
 
 
 if __name__ == "__main__":